@@ -2,16 +2,33 @@
 """
 
 import contextlib
+import functools
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import sys
+import tempfile
 import textwrap
+import time
 import zipfile
 from collections import OrderedDict
 from sysconfig import get_paths
 from types import TracebackType
-from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pip._vendor.certifi import where
 from pip._vendor.packaging.requirements import Requirement
@@ -19,10 +36,17 @@ from pip._vendor.packaging.version import Version
 
 from pip import __file__ as pip_location
 from pip._internal.cli.spinners import open_spinner
+from pip._internal.configuration import Configuration
+from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_platlib, get_prefixed_libs, get_purelib
 from pip._internal.metadata import get_environment
-from pip._internal.utils.subprocess import call_subprocess
+from pip._internal.models.target_python import TargetPython
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.logging import indent_log
+from pip._internal.utils.misc import ensure_dir, rmtree
+from pip._internal.utils.subprocess import call_subprocess, subprocess_environ
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
+from pip._internal.utils.urls import url_to_path
 
 if TYPE_CHECKING:
     from pip._internal.index.package_finder import PackageFinder
@@ -69,36 +93,280 @@ def _create_standalone_pip() -> Iterator[str]:
         yield os.path.join(pip_zip, "pip")
 
 
+def _hash_json(data):
+    # type: (object) -> str
+    s = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha224(s.encode("utf-8")).hexdigest()
+
+
+class BuildEnvironmentCache:
+    """Prefixes with build requirements installed, shared by the builds that
+    need the same requirements.
+
+    A prefix is installed once, into a directory named after a digest of
+    the interpreter and of the distributions that ended up in it, and is
+    not changed afterwards. The requirements that were asked for, along
+    with the options of the finder that looked them up, are mapped to it,
+    so that later builds asking for the same ones use it as it is.
+
+    Entries are used for at most a week, so that requirements which are
+    not pinned get to pick up new releases. Prefixes that were not used
+    for as long are removed.
+
+    The pip installing the requirements also reads the configuration files
+    and PIP_* environment variables, which are part of the mapping too.
+    Settings that name constraints or requirements files, whose contents
+    may change from one run to the next, keep the prefixes to this run.
+    """
+
+    MAX_AGE = 7 * 24 * 60 * 60
+
+    _MANIFEST = "pip-build-env.json"
+
+    # Settings whose values are files, which are only read by the pip
+    # installing the requirements.
+    _FILE_SETTINGS = frozenset(["constraint", "requirement", "editable"])
+
+    # Set by pip for its subprocesses, to a new directory in each run.
+    _RUN_SETTINGS = frozenset(["req-tracker"])
+
+    def __init__(self, directory=None, install_in_process=False):
+        # type: (Optional[str], bool) -> None
+        """
+        :param directory: Where to keep the prefixes across runs. If None,
+            they are only shared within this run.
+        :param install_in_process: Whether the running pip installs the
+            requirements of the prefixes, instead of a pip subprocess.
+        """
+        self._directory = directory
+        self.install_in_process = install_in_process
+        self._settings = None  # type: Optional[Dict[str, Any]]
+
+    def _get_settings(self):
+        # type: () -> Dict[str, Any]
+        if self._settings is None:
+            configuration = Configuration(isolated=False)
+            configuration.load()
+            self._settings = {
+                key: value for key, value in configuration.items()
+                if key.rpartition(".")[2] not in self._RUN_SETTINGS
+            }
+            file_settings = sorted(
+                key for key in self._settings
+                if key.rpartition(".")[2] in self._FILE_SETTINGS
+            )
+            if file_settings and self._directory is not None:
+                logger.debug(
+                    "Not sharing build environments with other runs, as %s "
+                    "may name files that change",
+                    ", ".join(file_settings),
+                )
+                self._directory = None
+        return self._settings
+
+    @property
+    def directory(self):
+        # type: () -> str
+        self._get_settings()
+        if self._directory is None:
+            self._directory = TempDirectory(
+                kind=tempdir_kinds.BUILD_ENV, globally_managed=True
+            ).path
+        return self._directory
+
+    @staticmethod
+    def _get_interpreter():
+        # type: () -> List[str]
+        return [sys.executable, sys.version]
+
+    @staticmethod
+    def _get_local_files(find_links):
+        # type: (List[str]) -> List[Any]
+        """The files in the local find-links locations, which may change
+        without the locations changing.
+        """
+        files = []  # type: List[Any]
+        for location in find_links:
+            path = location
+            if location.startswith("file:"):
+                path = url_to_path(location)
+            try:
+                if os.path.isdir(path):
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            st = entry.stat()
+                            files.append(
+                                [entry.path, st.st_size, st.st_mtime_ns]
+                            )
+                elif os.path.isfile(path):
+                    st = os.stat(path)
+                    files.append([path, st.st_size, st.st_mtime_ns])
+            except OSError:
+                continue
+        return sorted(files)
+
+    def _get_key_path(self, finder, requirements):
+        # type: (PackageFinder, List[str]) -> str
+        # Everything _install_requirements() passes on to pip install.
+        key = _hash_json({
+            "interpreter": self._get_interpreter(),
+            "requirements": sorted(str(Requirement(r)) for r in requirements),
+            "index_urls": finder.index_urls,
+            "find_links": finder.find_links,
+            "trusted_hosts": list(finder.trusted_hosts),
+            "no_binary": sorted(finder.format_control.no_binary),
+            "only_binary": sorted(finder.format_control.only_binary),
+            "pre": finder.allow_all_prereleases,
+            "prefer_binary": finder.prefer_binary,
+            "settings": self._get_settings(),
+            "local_files": self._get_local_files(finder.find_links),
+        })
+        return os.path.join(self.directory, "keys", key[:2], key[2:])
+
+    def get(self, finder, requirements):
+        # type: (PackageFinder, List[str]) -> Optional[str]
+        """Return the prefix the requirements are installed in, if any."""
+        try:
+            with open(self._get_key_path(finder, requirements)) as f:
+                entry = json.load(f)
+            name, created = entry["prefix"], entry["created"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if time.time() - created > self.MAX_AGE:
+            return None
+        path = os.path.join(self.directory, "prefixes", name)
+        try:
+            # Record the use, for _remove_unused().
+            os.utime(os.path.join(path, self._MANIFEST))
+        except OSError:
+            return None
+        return path
+
+    def add(self, finder, requirements, install):
+        # type: (PackageFinder, List[str], Callable[[str], None]) -> str
+        """Install the requirements with install, which takes the path of
+        the prefix to install them in, and return where the prefix is.
+        """
+        prefixes_dir = os.path.join(self.directory, "prefixes")
+        ensure_dir(prefixes_dir)
+        self._remove_unused(prefixes_dir)
+
+        partial = tempfile.mkdtemp(prefix=".partial-", dir=prefixes_dir)
+        try:
+            install(partial)
+            env = get_environment(_Prefix(partial).lib_dirs)
+            distributions = sorted(
+                f"{dist.canonical_name}=={dist.version}"
+                for dist in env.iter_distributions()
+            )
+            with open(os.path.join(partial, self._MANIFEST), "w") as f:
+                json.dump(
+                    {"requirements": requirements, "distributions": distributions},
+                    f,
+                )
+        except BaseException:
+            rmtree(partial, ignore_errors=True)
+            raise
+
+        name = _hash_json({
+            "interpreter": self._get_interpreter(),
+            "distributions": distributions,
+        })
+        path = os.path.join(prefixes_dir, name)
+        try:
+            os.rename(partial, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, self._MANIFEST)):
+                # Keep using the partial prefix, only for this build.
+                logger.debug("Could not share build environment %s", partial)
+                return partial
+            # Other requirements resolved to the same distributions, or
+            # another build installed them meanwhile.
+            rmtree(partial, ignore_errors=True)
+
+        key_path = self._get_key_path(finder, requirements)
+        try:
+            ensure_dir(os.path.dirname(key_path))
+            with adjacent_tmp_file(key_path) as f:
+                f.write(json.dumps(
+                    {"prefix": name, "created": time.time()}
+                ).encode("utf-8"))
+            replace(f.name, key_path)
+        except OSError as e:
+            logger.debug("Could not record build environment %s: %s", path, e)
+        return path
+
+    def _remove_unused(self, prefixes_dir):
+        # type: (str) -> None
+        now = time.time()
+        for name in os.listdir(prefixes_dir):
+            path = os.path.join(prefixes_dir, name)
+            if name.startswith(".partial-"):
+                used = path
+            else:
+                used = os.path.join(path, self._MANIFEST)
+            try:
+                unused = now - os.stat(used).st_mtime > self.MAX_AGE
+            except OSError:
+                continue
+            if unused:
+                logger.debug("Removing unused build environment %s", path)
+                rmtree(path, ignore_errors=True)
+
+
 class BuildEnvironment:
     """Creates and manages an isolated environment to install build deps
     """
 
-    def __init__(self):
-        # type: () -> None
+    def __init__(self, cache=None):
+        # type: (Optional[BuildEnvironmentCache]) -> None
+        """
+        :param cache: Where to find the requirements already installed for
+            other builds, instead of installing them in this environment.
+        """
         temp_dir = TempDirectory(
             kind=tempdir_kinds.BUILD_ENV, globally_managed=True
         )
+        self._cache = cache
 
         self._prefixes = OrderedDict(
             (name, _Prefix(os.path.join(temp_dir.path, name)))
             for name in ('normal', 'overlay')
         )
 
-        self._bin_dirs = []  # type: List[str]
-        self._lib_dirs = []  # type: List[str]
-        for prefix in reversed(list(self._prefixes.values())):
-            self._bin_dirs.append(prefix.bin_dir)
-            self._lib_dirs.extend(prefix.lib_dirs)
+        self._site_dir = os.path.join(temp_dir.path, 'site')
+        if not os.path.exists(self._site_dir):
+            os.mkdir(self._site_dir)
 
+    @property
+    def _bin_dirs(self):
+        # type: () -> List[str]
+        # A shared prefix may serve as both.
+        bin_dirs = [
+            prefix.bin_dir for prefix in reversed(list(self._prefixes.values()))
+        ]
+        return list(OrderedDict.fromkeys(bin_dirs))
+
+    @property
+    def _lib_dirs(self):
+        # type: () -> List[str]
+        lib_dirs = [
+            lib_dir
+            for prefix in reversed(list(self._prefixes.values()))
+            for lib_dir in prefix.lib_dirs
+        ]
+        return list(OrderedDict.fromkeys(lib_dirs))
+
+    def _write_sitecustomize(self):
+        # type: () -> None
         # Customize site to:
         # - ensure .pth files are honored
         # - prevent access to system site packages
+        # The prefixes may have been replaced by shared ones since the
+        # environment was created, so this is written on each use.
         system_sites = {
             os.path.normcase(site) for site in (get_purelib(), get_platlib())
         }
-        self._site_dir = os.path.join(temp_dir.path, 'site')
-        if not os.path.exists(self._site_dir):
-            os.mkdir(self._site_dir)
         with open(os.path.join(self._site_dir, 'sitecustomize.py'), 'w') as fp:
             fp.write(textwrap.dedent(
                 '''
@@ -129,23 +397,23 @@ class BuildEnvironment:
 
     def __enter__(self):
         # type: () -> None
-        self._save_env = {
-            name: os.environ.get(name, None)
-            for name in ('PATH', 'PYTHONNOUSERSITE', 'PYTHONPATH')
-        }
+        self._write_sitecustomize()
 
-        path = self._bin_dirs[:]
-        old_path = self._save_env['PATH']
+        path = self._bin_dirs
+        old_path = os.environ.get('PATH')
         if old_path:
             path.extend(old_path.split(os.pathsep))
 
         pythonpath = [self._site_dir]
 
-        os.environ.update({
+        # The environment is only changed for the subprocesses of this
+        # thread, as wheels may be built in several threads at once.
+        self._environ = subprocess_environ({
             'PATH': os.pathsep.join(path),
             'PYTHONNOUSERSITE': '1',
             'PYTHONPATH': os.pathsep.join(pythonpath),
         })
+        self._environ.__enter__()
 
     def __exit__(
         self,
@@ -154,11 +422,7 @@ class BuildEnvironment:
         exc_tb  # type: Optional[TracebackType]
     ):
         # type: (...) -> None
-        for varname, old_value in self._save_env.items():
-            if old_value is None:
-                os.environ.pop(varname, None)
-            else:
-                os.environ[varname] = old_value
+        self._environ.__exit__(exc_type, exc_val, exc_tb)
 
     def check_requirements(self, reqs):
         # type: (Iterable[str]) -> Tuple[Set[Tuple[str, str]], Set[str]]
@@ -198,6 +462,44 @@ class BuildEnvironment:
         prefix.setup = True
         if not requirements:
             return
+        if self._cache is None:
+            self._install_into(finder, requirements, message, prefix.path)
+            return
+
+        requirements = list(requirements)
+        path = self._cache.get(finder, requirements)
+        if path is None:
+            path = self._cache.add(
+                finder,
+                requirements,
+                functools.partial(self._install_into, finder, requirements, message),
+            )
+        else:
+            logger.info("%s: using a shared environment", message)
+        logger.debug("Using build environment prefix %s", path)
+        shared_prefix = _Prefix(path)
+        shared_prefix.setup = True
+        self._prefixes[prefix_as_string] = shared_prefix
+
+    def _install_into(
+        self,
+        finder: "PackageFinder",
+        requirements: Iterable[str],
+        message: str,
+        path: str,
+    ) -> None:
+        if self._cache is not None and self._cache.install_in_process:
+            if finder.target_python.get_tags() == TargetPython().get_tags():
+                _install_requirements_in_process(
+                    finder, requirements, _Prefix(path), message, self._cache
+                )
+                return
+            # The running pip would pick the requirements for the target
+            # of the finder, rather than for this interpreter.
+            logger.debug(
+                "Installing build dependencies in a subprocess, as the "
+                "target platform is not the running interpreter"
+            )
         with contextlib.ExitStack() as ctx:
             # TODO: Remove this block when dropping 3.6 support. Python 3.6
             # lacks importlib.resources and pep517 has issues loading files in
@@ -211,7 +513,7 @@ class BuildEnvironment:
                 pip_runnable,
                 finder,
                 requirements,
-                prefix,
+                _Prefix(path),
                 message,
             )
 
@@ -258,6 +560,110 @@ class BuildEnvironment:
             call_subprocess(args, spinner=spinner, extra_environ=extra_environ)
 
 
+def _install_requirements_in_process(
+    finder: "PackageFinder",
+    requirements: Iterable[str],
+    prefix: _Prefix,
+    message: str,
+    build_env_cache: BuildEnvironmentCache,
+) -> None:
+    """Install requirements into prefix the way ``pip install --prefix``
+    does, but with the running pip.
+
+    The index pages already fetched by finder, and its HTTP session with
+    its cache, are reused rather than set up again in a subprocess.
+    """
+    # These modules import most of pip, including this one.
+    from pip._internal.cache import WheelCache
+    from pip._internal.operations.prepare import RequirementPreparer
+    from pip._internal.req import install_given_reqs
+    from pip._internal.req.constructors import install_req_from_req_string
+    from pip._internal.req.req_tracker import get_requirement_tracker
+    from pip._internal.resolution.resolvelib.resolver import Resolver
+    from pip._internal.wheel_builder import (
+        build,
+        get_check_binary_allowed,
+        should_build_for_install_command,
+    )
+
+    logger.info("%s", message)
+    with contextlib.ExitStack() as ctx:
+        ctx.enter_context(indent_log())
+        req_tracker = ctx.enter_context(get_requirement_tracker())
+        temp_dir = ctx.enter_context(TempDirectory(kind="build-deps"))
+
+        preparer = RequirementPreparer(
+            build_dir=temp_dir.path,
+            download_dir=None,
+            src_dir=temp_dir.path,
+            build_isolation=True,
+            req_tracker=req_tracker,
+            session=finder.session,
+            progress_bar="off",
+            finder=finder,
+            require_hashes=False,
+            use_user_site=False,
+            lazy_wheel=False,
+            in_tree_build=False,
+            build_env_cache=build_env_cache,
+        )
+        resolver = Resolver(
+            preparer=preparer,
+            finder=finder,
+            wheel_cache=None,
+            make_install_req=functools.partial(
+                install_req_from_req_string, isolated=False, use_pep517=None
+            ),
+            use_user_site=False,
+            ignore_dependencies=False,
+            ignore_installed=True,
+            ignore_requires_python=False,
+            force_reinstall=False,
+            upgrade_strategy="to-satisfy-only",
+            # The prefetches of the resolution this build environment is
+            # installed for are still needed.
+            cancel_finder_prefetches=False,
+        )
+        reqs = [
+            install_req_from_req_string(req, user_supplied=True)
+            for req in requirements
+        ]
+        requirement_set = resolver.resolve(reqs, check_supported_wheels=True)
+
+        check_binary_allowed = get_check_binary_allowed(finder.format_control)
+        reqs_to_build = [
+            req for req in requirement_set.requirements.values()
+            if should_build_for_install_command(req, check_binary_allowed)
+        ]
+        _, build_failures = build(
+            reqs_to_build,
+            wheel_cache=WheelCache("", finder.format_control),
+            verify=True,
+            build_options=[],
+            global_options=[],
+        )
+        pep517_build_failures = [req for req in build_failures if req.use_pep517]
+        if pep517_build_failures:
+            raise InstallationError(
+                "Could not build wheels for {}, which are required to "
+                "install build dependencies".format(
+                    ", ".join(req.name for req in pep517_build_failures)  # type: ignore
+                )
+            )
+
+        install_given_reqs(
+            resolver.get_installation_order(requirement_set),
+            install_options=[],
+            global_options=[],
+            root=None,
+            home=None,
+            prefix=prefix.path,
+            warn_script_location=False,
+            use_user_site=False,
+            pycompile=True,
+        )
+
+
 class NoOpBuildEnvironment(BuildEnvironment):
     """A no-op drop-in replacement for BuildEnvironment
     """
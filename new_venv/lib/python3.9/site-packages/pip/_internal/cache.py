@@ -5,7 +5,9 @@ import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Set
+import time
+from email.parser import Parser
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 from pip._vendor.packaging.utils import canonicalize_name
@@ -14,6 +16,9 @@ from pip._internal.exceptions import InvalidWheelFilename
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
+from pip._internal.network.cache import SafeFileCache
+from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.misc import ensure_dir
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.urls import path_to_url
 
@@ -100,8 +105,11 @@ class Cache:
         if not self.allowed_formats.intersection(formats):
             return []
 
+        return self._list_candidates(self.get_path_for_link(link))
+
+    def _list_candidates(self, path):
+        # type: (str) -> List[Any]
         candidates = []
-        path = self.get_path_for_link(link)
         if os.path.isdir(path):
             for candidate in os.listdir(path):
                 candidates.append((candidate, path))
@@ -126,13 +134,405 @@ class Cache:
         raise NotImplementedError()
 
 
+# The size and the time of last use of the wheels in each directory of a wheel
+# cache, by name.
+_IndexEntries = Dict[str, Dict[str, Tuple[int, float]]]
+
+
+class WheelIndexEntry(NamedTuple):
+    """A wheel of a wheel cache, as recorded in its index."""
+
+    path: str
+    size: int
+    last_used: float
+
+
+class WheelCacheIndex:
+    """An index of the wheels in a wheel cache directory.
+
+    The index is a log, in which each line records a wheel that was added
+    to the cache, used or removed, along with its size and the time. It is
+    read once, into a dictionary of the wheels in each directory of the
+    cache, so that looking up the wheels of a link does not list the
+    directory of the link. Lines are only appended to the log, which is
+    rewritten once most of them are outdated. Lines that other pip
+    processes append while it is rewritten are lost, which only makes
+    their wheels be built again.
+
+    A cache without an index, such as one written by an older pip, is
+    indexed by walking it. Other pip versions may still store wheels in the
+    cache without recording them, so the mtime of each directory is
+    recorded when it is listed, and a directory is listed again when its
+    mtime changed.
+
+    When a maximum size is given, adding wheels to the cache removes the
+    least recently used ones past it. Wheels used or added by this process
+    are kept. The whole cache is walked at most once a day before that, to
+    count the wheels in directories that were not looked up.
+    """
+
+    FILENAME = "index.jsonl"
+
+    WALK_INTERVAL = 24 * 60 * 60
+
+    # Rewrite the log once it has this many lines, and more than twice as
+    # many as there are wheels and directories.
+    _COMPACT_MIN_RECORDS = 1000
+
+    def __init__(self, directory, max_size=None):
+        # type: (str, Optional[int]) -> None
+        self.directory = directory
+        self.max_size = max_size
+        self._entries = None  # type: Optional[_IndexEntries]
+        # The mtime of each directory when it was last listed.
+        self._listed = {}  # type: Dict[str, int]
+        self._walked = 0.0
+        self._records = 0
+        self._in_use = set()  # type: Set[str]
+
+    @property
+    def path(self):
+        # type: () -> str
+        return os.path.join(self.directory, self.FILENAME)
+
+    def _get_key(self, path):
+        # type: (str) -> Optional[str]
+        """Return path relative to the cache, with forward slashes, or None
+        if path is not in the cache.
+        """
+        try:
+            rel_path = os.path.relpath(path, self.directory)
+        except ValueError:
+            # On another drive.
+            return None
+        if rel_path == os.pardir or rel_path.startswith(os.pardir + os.sep):
+            return None
+        if rel_path == os.curdir:
+            return ""
+        return rel_path.replace(os.sep, "/")
+
+    def _split(self, path):
+        # type: (str) -> Optional[Tuple[str, str]]
+        """Return the directory of path, relative to the cache, and its
+        name, or None if path is not in the cache.
+        """
+        key = self._get_key(path)
+        if key is None:
+            return None
+        directory, _, name = key.rpartition("/")
+        return directory, name
+
+    def _join(self, key, name=""):
+        # type: (str, str) -> str
+        return os.path.join(self.directory, *key.split("/"), name)
+
+    def _load(self):
+        # type: () -> _IndexEntries
+        if self._entries is not None:
+            return self._entries
+
+        entries = {}  # type: _IndexEntries
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    self._records += 1
+                    try:
+                        self._apply(entries, json.loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        # A line cut short by an interrupted pip.
+                        continue
+        except FileNotFoundError:
+            self._entries = {}
+            self.refresh()
+            return self._entries
+        except OSError as e:
+            logger.debug("Could not read wheel cache index %s: %s", self.path, e)
+        self._entries = entries
+        return entries
+
+    def _apply(self, entries, record):
+        # type: (_IndexEntries, Dict[str, Any]) -> None
+        if record["op"] == "walk":
+            self._walked = float(record["time"])
+            return
+        if record["op"] == "list":
+            self._listed[record["path"]] = int(record["mtime"])
+            return
+        key, _, name = record["path"].rpartition("/")
+        if record["op"] == "remove":
+            names = entries.get(key, {})
+            names.pop(name, None)
+            if not names:
+                entries.pop(key, None)
+        else:
+            entries.setdefault(key, {})[name] = (
+                int(record["size"]), float(record["time"])
+            )
+
+    def _list(self, key):
+        # type: (str) -> List[Dict[str, Any]]
+        """Return the records that bring the wheels of a directory of the
+        cache in the index up to date, if the directory changed since it was
+        last listed.
+        """
+        assert self._entries is not None
+        path = self._join(key)
+        try:
+            mtime = os.stat(path).st_mtime_ns  # type: Optional[int]
+        except OSError:
+            mtime = None
+        if mtime is not None and self._listed.get(key) == mtime:
+            return []
+
+        found = set()  # type: Set[str]
+        if mtime is not None:
+            try:
+                found = {n for n in os.listdir(path) if n.endswith(".whl")}
+            except OSError:
+                pass
+        known = self._entries.get(key, {})
+        records = [
+            {"op": "remove", "path": f"{key}/{name}"}
+            for name in known
+            if name not in found
+        ]  # type: List[Dict[str, Any]]
+        for name in found.difference(known):
+            try:
+                st = os.stat(os.path.join(path, name))
+            except OSError:
+                continue
+            records.append({
+                "op": "add",
+                "path": f"{key}/{name}",
+                "size": st.st_size,
+                "time": st.st_mtime,
+            })
+        if mtime is not None:
+            records.append({"op": "list", "path": key, "mtime": mtime})
+        return records
+
+    def refresh(self):
+        # type: () -> None
+        """Bring the index up to date with all the directories of the cache,
+        including the wheels other pip versions stored in it.
+        """
+        entries = self._load()
+        if not entries and not os.path.isdir(self.directory):
+            return
+        keys = set(entries)
+        for root, _, files in os.walk(self.directory):
+            if any(name.endswith(".whl") for name in files):
+                key = self._get_key(root)
+                assert key is not None
+                keys.add(key)
+        records = []  # type: List[Dict[str, Any]]
+        for key in sorted(keys):
+            records.extend(self._list(key))
+        records.append({"op": "walk", "time": time.time()})
+        self._append(records)
+
+    def refresh_if_stale(self):
+        # type: () -> None
+        """Refresh the index if the cache was last walked more than
+        WALK_INTERVAL seconds ago, or never.
+        """
+        self._load()
+        if time.time() - self._walked > self.WALK_INTERVAL:
+            self.refresh()
+
+    def _compact(self):
+        # type: () -> None
+        assert self._entries is not None
+        records = [
+            {"op": "add", "path": f"{key}/{name}", "size": size, "time": used}
+            for key, names in self._entries.items()
+            for name, (size, used) in names.items()
+        ]  # type: List[Dict[str, Any]]
+        records.extend(
+            {"op": "list", "path": key, "mtime": mtime}
+            for key, mtime in self._listed.items()
+        )
+        if self._walked:
+            records.append({"op": "walk", "time": self._walked})
+        try:
+            with adjacent_tmp_file(self.path) as f:
+                f.write("".join(
+                    json.dumps(record, separators=(",", ":")) + "\n"
+                    for record in records
+                ).encode("utf-8"))
+            replace(f.name, self.path)
+        except OSError as e:
+            logger.debug("Could not write wheel cache index %s: %s", self.path, e)
+            return
+        self._records = len(records)
+
+    def _append(self, records):
+        # type: (List[Dict[str, Any]]) -> None
+        entries = self._load()
+        for record in records:
+            self._apply(entries, record)
+        try:
+            ensure_dir(self.directory)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(
+                    json.dumps(record, separators=(",", ":")) + "\n"
+                    for record in records
+                ))
+        except OSError as e:
+            logger.debug("Could not update wheel cache index %s: %s", self.path, e)
+            return
+        self._records += len(records)
+        num_wheels = sum(len(names) for names in entries.values())
+        num_live = num_wheels + len(self._listed) + 1
+        if self._records > max(self._COMPACT_MIN_RECORDS, 2 * num_live):
+            self._compact()
+
+    def _record(self, op, path):
+        # type: (str, str) -> Optional[Dict[str, Any]]
+        split = self._split(path)
+        if split is None:
+            return None
+        key, name = split
+        record = {"op": op, "path": f"{key}/{name}"}  # type: Dict[str, Any]
+        if op != "remove":
+            try:
+                record["size"] = os.stat(path).st_size
+            except OSError:
+                return None
+            record["time"] = time.time()
+        return record
+
+    def contains(self, path):
+        # type: (str) -> bool
+        return self._split(path) is not None
+
+    def names(self, directory):
+        # type: (str) -> List[str]
+        """Return the names of the wheels in a directory of the cache."""
+        key = self._get_key(directory)
+        if key is None:
+            return []
+        entries = self._load()
+        records = self._list(key)
+        if records:
+            self._append(records)
+        return list(entries.get(key, ()))
+
+    def __iter__(self):
+        # type: () -> Iterator[WheelIndexEntry]
+        for key, names in self._load().items():
+            for name, (size, used) in names.items():
+                yield WheelIndexEntry(self._join(key, name), size, used)
+
+    def use(self, path):
+        # type: (str) -> bool
+        """Record the use of a wheel of the cache.
+
+        :return: False if the wheel is gone, in which case it is removed
+            from the index.
+        """
+        record = self._record("use", path)
+        if record is None:
+            self.forget([path])
+            return False
+        self._in_use.add(path)
+        self._append([record])
+        return True
+
+    def add(self, path):
+        # type: (str) -> None
+        """Record a wheel that was stored in the cache, and remove the least
+        recently used wheels if the cache is now too large.
+        """
+        record = self._record("add", path)
+        if record is None:
+            return
+        self._in_use.add(path)
+        self._append([record])
+        self._evict()
+
+    def forget(self, paths):
+        # type: (List[str]) -> None
+        """Record wheels that were removed from the cache."""
+        records = []
+        for path in paths:
+            record = self._record("remove", path)
+            if record is not None:
+                records.append(record)
+        if records:
+            self._append(records)
+
+    def _evict(self):
+        # type: () -> None
+        if not self.max_size:
+            return
+        self.refresh_if_stale()
+        entries = list(self)
+        total = sum(entry.size for entry in entries)
+        if total <= self.max_size:
+            return
+
+        removed = []
+        for entry in sorted(entries, key=lambda entry: entry.last_used):
+            if total <= self.max_size:
+                break
+            if entry.path in self._in_use:
+                continue
+            logger.debug("Removing least recently used wheel %s", entry.path)
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug("Could not remove %s: %s", entry.path, e)
+                continue
+            self._remove_empty_dirs(os.path.dirname(entry.path))
+            total -= entry.size
+            removed.append(entry.path)
+        self.forget(removed)
+
+    def _remove_empty_dirs(self, path):
+        # type: (str) -> None
+        while self.contains(path) and path != self.directory:
+            try:
+                os.rmdir(path)
+            except OSError:
+                break
+            path = os.path.dirname(path)
+
+
 class SimpleWheelCache(Cache):
     """A cache of wheels for future installs.
     """
 
-    def __init__(self, cache_dir, format_control):
-        # type: (str, FormatControl) -> None
+    def __init__(self, cache_dir, format_control, max_size=None):
+        # type: (str, FormatControl, Optional[int]) -> None
+        """
+        :param max_size: The size in bytes past which the least recently
+            used wheels are removed. If None, the cache is not limited.
+        """
         super().__init__(cache_dir, format_control, {"binary"})
+        self._index = None  # type: Optional[WheelCacheIndex]
+        if self.cache_dir:
+            self._index = WheelCacheIndex(
+                os.path.join(self.cache_dir, "wheels"), max_size
+            )
+
+    def _list_candidates(self, path):
+        # type: (str) -> List[Any]
+        assert self._index is not None
+        return [(name, path) for name in self._index.names(path)]
+
+    def add(self, path):
+        # type: (str) -> bool
+        """Record a wheel that was built into the cache.
+
+        :return: False if path is not in the cache.
+        """
+        if self._index is None or not self._index.contains(path):
+            return False
+        self._index.add(path)
+        return True
 
     def get_path_for_link(self, link):
         # type: (Link) -> str
@@ -195,9 +595,12 @@ class SimpleWheelCache(Cache):
 
         if not candidates:
             return link
-
-        _, wheel_name, wheel_dir = min(candidates)
-        return Link(path_to_url(os.path.join(wheel_dir, wheel_name)))
+        assert self._index is not None
+        for _, wheel_name, wheel_dir in sorted(candidates):
+            path = os.path.join(wheel_dir, wheel_name)
+            if self._index.use(path):
+                return Link(path_to_url(path))
+        return link
 
 
 class EphemWheelCache(SimpleWheelCache):
@@ -231,10 +634,12 @@ class WheelCache(Cache):
     when a certain link is not found in the simple wheel cache first.
     """
 
-    def __init__(self, cache_dir, format_control):
-        # type: (str, FormatControl) -> None
+    def __init__(self, cache_dir, format_control, max_size=None):
+        # type: (str, FormatControl, Optional[int]) -> None
         super().__init__(cache_dir, format_control, {'binary'})
-        self._wheel_cache = SimpleWheelCache(cache_dir, format_control)
+        self._wheel_cache = SimpleWheelCache(
+            cache_dir, format_control, max_size=max_size
+        )
         self._ephem_cache = EphemWheelCache(format_control)
 
     def get_path_for_link(self, link):
@@ -245,6 +650,14 @@ class WheelCache(Cache):
         # type: (Link) -> str
         return self._ephem_cache.get_path_for_link(link)
 
+    def add(self, path):
+        # type: (str) -> None
+        """Record a wheel that was built into the persistent or the ephem
+        cache.
+        """
+        if not self._wheel_cache.add(path):
+            self._ephem_cache.add(path)
+
     def get(
         self,
         link,            # type: Link
@@ -285,3 +698,88 @@ class WheelCache(Cache):
             return CacheEntry(retval, persistent=False)
 
         return None
+
+
+class MetadataCache:
+    """A persistent cache of the core metadata of remote wheels.
+
+    Entries are keyed by the URL and the hash of the wheel, so an entry
+    always describes the same content. They only keep the fields resolution
+    needs, and are only written once the wheel has been checked against its
+    hash.
+    """
+
+    _FIELDS = (
+        "Metadata-Version",
+        "Name",
+        "Version",
+        "Requires-Python",
+        "Requires-Dist",
+        "Provides-Extra",
+    )
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        self._cache = SafeFileCache(directory)
+
+    @staticmethod
+    def _get_key(link):
+        # type: (Link) -> Optional[str]
+        if link.is_file or not link.is_wheel or link.hash is None:
+            return None
+        return f"{link.url_without_fragment}#{link.hash_name}={link.hash}"
+
+    def supports(self, link):
+        # type: (Link) -> bool
+        """Whether the metadata of link can be cached."""
+        return self._get_key(link) is not None
+
+    def get(self, link):
+        # type: (Link) -> Optional[bytes]
+        """Return the cached METADATA of the wheel link points to, if any."""
+        key = self._get_key(link)
+        if key is None:
+            return None
+        return self._cache.get(key)
+
+    def set(self, link, metadata):
+        # type: (Link, str) -> None
+        key = self._get_key(link)
+        if key is None:
+            return
+        message = Parser().parsestr(metadata, headersonly=True)
+        lines = [
+            f"{field}: {value}\n"
+            for field in self._FIELDS
+            for value in message.get_all(field, [])
+        ]
+        self._cache.set(key, "".join(lines).encode("utf-8"))
+
+
+class ResolutionCache:
+    """A persistent record of what installing a set of requirements led to.
+
+    Entries are keyed by a digest of everything the resolution depends on
+    besides the installed distributions. An entry maps the name of each
+    distribution in the installed dependency tree to its version and
+    requirements, as read from its metadata after the install.
+    """
+
+    def __init__(self, directory):
+        # type: (str) -> None
+        self._cache = SafeFileCache(directory)
+
+    def get(self, key):
+        # type: (str) -> Optional[Dict[str, Any]]
+        data = self._cache.get(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except ValueError:
+            return None
+
+    def set(self, key, snapshot):
+        # type: (str, Dict[str, Any]) -> None
+        data = json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
+        self._cache.set(key, data.encode("utf-8"))
@@ -11,6 +11,7 @@ pass on state. To be consistent, all options will follow this design.
 # mypy: strict-optional=False
 
 import os
+import re
 import textwrap
 import warnings
 from functools import partial
@@ -19,6 +20,7 @@ from textwrap import dedent
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 
 from pip._internal.cli.parser import ConfigOptionParser
 from pip._internal.cli.progress_bars import BAR_TYPES
@@ -230,6 +232,129 @@ progress_bar: Callable[..., Option] = partial(
     ),
 )
 
+
+def _handle_positive_int(
+    option: Option, opt_str: str, value: int, parser: OptionParser
+) -> None:
+    if value < 1:
+        raise_option_error(parser, option=option, msg="must be at least 1")
+    setattr(parser.values, option.dest, value)
+
+
+download_concurrency: Callable[..., Option] = partial(
+    Option,
+    "--download-concurrency",
+    dest="download_concurrency",
+    type="int",
+    metavar="n",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Maximum number of files to download at the same time when "
+        "fetching several distributions in a batch (default: %default)."
+    ),
+)
+
+
+install_jobs: Callable[..., Option] = partial(
+    Option,
+    "--install-jobs",
+    dest="install_jobs",
+    type="int",
+    metavar="n",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Install up to <n> wheels at the same time. Wheels sharing files "
+        "with another package being installed are still installed one at a "
+        "time (default: %default)."
+    ),
+)
+
+build_jobs: Callable[..., Option] = partial(
+    Option,
+    "--build-jobs",
+    dest="build_jobs",
+    type="int",
+    metavar="n",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Build up to <n> wheels from source distributions at the same "
+        "time (default: %default)."
+    ),
+)
+
+index_workers: Callable[..., Option] = partial(
+    Option,
+    "--index-workers",
+    dest="index_workers",
+    type="int",
+    metavar="n",
+    action="callback",
+    callback=_handle_positive_int,
+    default=DEFAULT_POOLSIZE,
+    help=(
+        "Maximum number of index pages to fetch at the same time with "
+        "--outdated or --uptodate (default: %default)."
+    ),
+)
+
+_SIZE_UNITS = {"": 1, "K": 1000, "M": 1000 ** 2, "G": 1000 ** 3, "T": 1000 ** 4}
+
+
+def _parse_size(value: str) -> Optional[int]:
+    """Parse a size in bytes, such as ``500M`` or ``2GB``."""
+    match = re.match(r"(\d+)\s*([KMGT]?)B?$", value.strip(), re.IGNORECASE)
+    if match is None:
+        return None
+    number, unit = match.groups()
+    return int(number) * _SIZE_UNITS[unit.upper()]
+
+
+def _handle_max_size(
+    option: Option, opt_str: str, value: str, parser: OptionParser
+) -> None:
+    """Process a maximum size, where 0 means no limit."""
+    size = _parse_size(value)
+    if size is None:
+        msg = f"invalid size: {value!r} (expected a number of bytes, such as 5G)"
+        raise_option_error(parser, option=option, msg=msg)
+    setattr(parser.values, option.dest, size or None)
+
+
+wheel_cache_max_size: Callable[..., Option] = partial(
+    Option,
+    "--wheel-cache-max-size",
+    dest="wheel_cache_max_size",
+    type="str",
+    metavar="size",
+    action="callback",
+    callback=_handle_max_size,
+    default=5 * 1000 ** 3,
+    help=(
+        "Remove the least recently used wheels from the wheel cache once it "
+        "is larger than <size>, such as 500M or 5G (default: 5G). 0 means "
+        "no limit."
+    ),
+)
+
+resolver_profile: Callable[..., Option] = partial(
+    PipOption,
+    "--resolver-profile",
+    dest="resolver_profile",
+    metavar="path",
+    type="path",
+    default=None,
+    help=(
+        "Write a JSON profile of the dependency resolution to <path>, with "
+        "the time spent on each project, network bytes and backtracks."
+    ),
+)
+
 log: Callable[..., Option] = partial(
     PipOption,
     "--log",
@@ -376,6 +501,19 @@ def find_links() -> Option:
     )
 
 
+html_parser: Callable[..., Option] = partial(
+    Option,
+    "--html-parser",
+    dest="html_parser",
+    choices=["html.parser", "html5lib"],
+    default="html5lib",
+    help="Parser used to extract links from HTML index pages. html.parser "
+    "only looks at anchor and base tags and is much faster, falling back "
+    "to html5lib for pages it cannot parse exactly like it. "
+    "(default: %default)",
+)
+
+
 def trusted_host() -> Option:
     return Option(
         "--trusted-host",
@@ -709,6 +847,22 @@ no_cache: Callable[..., Option] = partial(
     help="Disable the cache.",
 )
 
+http_cache_max_size: Callable[..., Option] = partial(
+    Option,
+    "--http-cache-max-size",
+    dest="http_cache_max_size",
+    type="str",
+    metavar="size",
+    action="callback",
+    callback=_handle_max_size,
+    default=5 * 1000 ** 3,
+    help=(
+        "Remove the least recently used responses from the HTTP cache once "
+        "it is larger than <size>, such as 500M or 5G (default: 5G), along "
+        "with those not used for 30 days. 0 means no limit."
+    ),
+)
+
 no_deps: Callable[..., Option] = partial(
     Option,
     "--no-deps",
@@ -950,7 +1104,13 @@ use_new_feature: Callable[..., Option] = partial(
     metavar="feature",
     action="append",
     default=[],
-    choices=["2020-resolver", "fast-deps", "in-tree-build"],
+    choices=[
+        "2020-resolver",
+        "backjumping",
+        "fast-deps",
+        "in-tree-build",
+        "in-process-build-deps",
+    ],
     help="Enable new functionality, that may be backward incompatible.",
 )
 
@@ -990,6 +1150,7 @@ general_group: Dict[str, Any] = {
         client_cert,
         cache_dir,
         no_cache,
+        http_cache_max_size,
         disable_pip_version_check,
         no_color,
         no_python_version_warning,
@@ -1005,5 +1166,6 @@ index_group: Dict[str, Any] = {
         extra_index_url,
         no_index,
         find_links,
+        html_parser,
     ],
 }
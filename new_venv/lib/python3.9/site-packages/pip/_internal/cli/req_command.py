@@ -12,7 +12,8 @@ from functools import partial
 from optparse import Values
 from typing import Any, List, Optional, Tuple
 
-from pip._internal.cache import WheelCache
+from pip._internal.build_env import BuildEnvironmentCache
+from pip._internal.cache import MetadataCache, WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.command_context import CommandContextMixIn
@@ -89,6 +90,7 @@ class SessionCommandMixin(CommandContextMixIn):
             cache=(
                 os.path.join(options.cache_dir, "http") if options.cache_dir else None
             ),
+            cache_max_size=options.http_cache_max_size,
             retries=retries if retries is not None else options.retries,
             trusted_hosts=options.trusted_hosts,
             index_urls=self._get_index_urls(options),
@@ -243,15 +245,18 @@ class RequirementCommand(IndexGroupCommand):
         assert temp_build_dir_path is not None
 
         resolver_variant = cls.determine_resolver_variant(options)
+        metadata_cache = None
         if resolver_variant == "2020-resolver":
+            if options.cache_dir:
+                metadata_cache = MetadataCache(
+                    os.path.join(options.cache_dir, "metadata")
+                )
             lazy_wheel = "fast-deps" in options.features_enabled
             if lazy_wheel:
-                logger.warning(
+                logger.debug(
                     "pip is using lazily downloaded wheels using HTTP "
-                    "range requests to obtain dependency information. "
-                    "This experimental feature is enabled through "
-                    "--use-feature=fast-deps and it is not ready for "
-                    "production."
+                    "range requests to obtain dependency information, "
+                    "as enabled through --use-feature=fast-deps."
                 )
         else:
             lazy_wheel = False
@@ -260,6 +265,17 @@ class RequirementCommand(IndexGroupCommand):
                     "fast-deps has no effect when used with the legacy resolver."
                 )
 
+        install_in_process = "in-process-build-deps" in options.features_enabled
+        if options.cache_dir:
+            build_env_cache = BuildEnvironmentCache(
+                os.path.join(options.cache_dir, "build-envs"),
+                install_in_process=install_in_process,
+            )
+        else:
+            build_env_cache = BuildEnvironmentCache(
+                install_in_process=install_in_process,
+            )
+
         return RequirementPreparer(
             build_dir=temp_build_dir_path,
             src_dir=options.src_dir,
@@ -273,6 +289,10 @@ class RequirementCommand(IndexGroupCommand):
             use_user_site=use_user_site,
             lazy_wheel=lazy_wheel,
             in_tree_build="in-tree-build" in options.features_enabled,
+            download_concurrency=options.download_concurrency,
+            use_metadata_files=resolver_variant == "2020-resolver",
+            metadata_cache=metadata_cache,
+            build_env_cache=build_env_cache,
         )
 
     @classmethod
@@ -317,6 +337,13 @@ class RequirementCommand(IndexGroupCommand):
                 force_reinstall=force_reinstall,
                 upgrade_strategy=upgrade_strategy,
                 py_version_info=py_version_info,
+                backjumping="backjumping" in options.features_enabled,
+                profile_path=options.resolver_profile,
+            )
+        if options.resolver_profile:
+            logger.warning(
+                "--resolver-profile has no effect when used with the legacy "
+                "resolver."
             )
         import pip._internal.resolution.legacy.resolver
 
@@ -2,6 +2,7 @@ import contextlib
 import itertools
 import logging
 import sys
+import threading
 import time
 from typing import IO, Iterator
 
@@ -121,7 +122,13 @@ def open_spinner(message: str) -> Iterator[SpinnerInterface]:
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
     # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # Interactive spinners of several threads would overwrite each other, so
+    # only the main thread gets one.
+    if (
+        sys.stdout.isatty()
+        and logger.getEffectiveLevel() <= logging.INFO
+        and threading.current_thread() is threading.main_thread()
+    ):
         spinner: SpinnerInterface = InteractiveSpinner(message)
     else:
         spinner = NonInteractiveSpinner(message)
@@ -1,13 +1,17 @@
+import fnmatch
 import os
 import textwrap
 from optparse import Values
-from typing import Any, List
+from typing import Any, List, Optional
 
 import pip._internal.utils.filesystem as filesystem
+from pip._internal.cache import WheelCacheIndex
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, PipError
+from pip._internal.network.cache import SafeFileCache
 from pip._internal.utils.logging import getLogger
+from pip._internal.utils.misc import format_size, rmtree
 
 logger = getLogger(__name__)
 
@@ -92,20 +96,53 @@ class CacheCommand(Command):
         if args:
             raise CommandError('Too many arguments')
 
-        num_http_files = len(self._find_http_files(options))
-        num_packages = len(self._find_wheels(options, '*'))
+        http_files = self._find_http_files(options)
+        num_http_files = len(http_files)
+        num_links_files = len(self._find_links_files(options))
+        num_metadata_files = len(self._find_metadata_files(options))
+        num_resolution_files = len(self._find_resolution_files(options))
+        num_build_envs = len(self._find_build_envs(options))
+        wheels = list(self._wheel_index(options))
 
         http_cache_location = self._cache_dir(options, 'http')
+        links_cache_location = self._cache_dir(options, 'links')
+        metadata_cache_location = self._cache_dir(options, 'metadata')
+        resolutions_cache_location = self._cache_dir(options, 'resolutions')
+        build_envs_cache_location = self._cache_dir(options, 'build-envs')
         wheels_cache_location = self._cache_dir(options, 'wheels')
-        http_cache_size = filesystem.format_directory_size(http_cache_location)
-        wheels_cache_size = filesystem.format_directory_size(
-            wheels_cache_location
+        http_cache_size = format_size(
+            sum(filesystem.file_size(path) for path in http_files)
         )
+        links_cache_size = filesystem.format_directory_size(
+            links_cache_location
+        )
+        metadata_cache_size = filesystem.format_directory_size(
+            metadata_cache_location
+        )
+        resolutions_cache_size = filesystem.format_directory_size(
+            resolutions_cache_location
+        )
+        build_envs_cache_size = filesystem.format_directory_size(
+            build_envs_cache_location
+        )
+        wheels_cache_size = format_size(sum(wheel.size for wheel in wheels))
 
         message = textwrap.dedent("""
             Package index page cache location: {http_cache_location}
             Package index page cache size: {http_cache_size}
             Number of HTTP files: {num_http_files}
+            Parsed links cache location: {links_cache_location}
+            Parsed links cache size: {links_cache_size}
+            Number of parsed pages: {num_links_files}
+            Wheel metadata cache location: {metadata_cache_location}
+            Wheel metadata cache size: {metadata_cache_size}
+            Number of wheel metadata files: {num_metadata_files}
+            Resolution snapshots location: {resolutions_cache_location}
+            Resolution snapshots size: {resolutions_cache_size}
+            Number of resolution snapshots: {num_resolution_files}
+            Build environments location: {build_envs_cache_location}
+            Build environments size: {build_envs_cache_size}
+            Number of build environments: {num_build_envs}
             Wheels location: {wheels_cache_location}
             Wheels size: {wheels_cache_size}
             Number of wheels: {package_count}
@@ -113,8 +150,20 @@ class CacheCommand(Command):
             http_cache_location=http_cache_location,
             http_cache_size=http_cache_size,
             num_http_files=num_http_files,
+            links_cache_location=links_cache_location,
+            links_cache_size=links_cache_size,
+            num_links_files=num_links_files,
+            metadata_cache_location=metadata_cache_location,
+            metadata_cache_size=metadata_cache_size,
+            num_metadata_files=num_metadata_files,
+            resolutions_cache_location=resolutions_cache_location,
+            resolutions_cache_size=resolutions_cache_size,
+            num_resolution_files=num_resolution_files,
+            build_envs_cache_location=build_envs_cache_location,
+            build_envs_cache_size=build_envs_cache_size,
+            num_build_envs=num_build_envs,
             wheels_cache_location=wheels_cache_location,
-            package_count=num_packages,
+            package_count=len(wheels),
             wheels_cache_size=wheels_cache_size,
         ).strip()
 
@@ -165,11 +214,31 @@ class CacheCommand(Command):
         if not args:
             raise CommandError('Please provide a pattern')
 
-        files = self._find_wheels(options, args[0])
+        index = self._wheel_index(options)
+        wheels = self._find_wheels(options, args[0], index)
+        files = list(wheels)
 
-        # Only fetch http files if no specific pattern given
+        # Only fetch http, parsed links, metadata, resolution and build
+        # environment files if no specific pattern given
+        build_envs_dir = None
         if args[0] == '*':
+            # Along with the wheels the index does not know about, and the
+            # index itself.
+            wheel_dir = self._cache_dir(options, 'wheels')
+            files = filesystem.find_files(wheel_dir, '*.whl')
+            if os.path.exists(index.path):
+                files.append(index.path)
             files += self._find_http_files(options)
+            http_stamp = os.path.join(
+                self._cache_dir(options, 'http'), SafeFileCache.SWEEP_STAMP
+            )
+            if os.path.exists(http_stamp):
+                files.append(http_stamp)
+            files += self._find_links_files(options)
+            files += self._find_metadata_files(options)
+            files += self._find_resolution_files(options)
+            build_envs_dir = self._cache_dir(options, 'build-envs')
+            files += filesystem.find_files(build_envs_dir, '*')
 
         if not files:
             raise CommandError('No matching packages')
@@ -177,6 +246,11 @@ class CacheCommand(Command):
         for filename in files:
             os.unlink(filename)
             logger.verbose("Removed %s", filename)
+        if build_envs_dir is None:
+            index.forget(wheels)
+        else:
+            # Build environments are directory trees, which are left empty.
+            rmtree(build_envs_dir, ignore_errors=True)
         logger.info("Files removed: %s", len(files))
 
     def purge_cache(self, options: Values, args: List[Any]) -> None:
@@ -190,11 +264,47 @@ class CacheCommand(Command):
 
     def _find_http_files(self, options: Values) -> List[str]:
         http_dir = self._cache_dir(options, 'http')
-        return filesystem.find_files(http_dir, '*')
-
-    def _find_wheels(self, options: Values, pattern: str) -> List[str]:
-        wheel_dir = self._cache_dir(options, 'wheels')
-
+        # Without the file that records when the cache was last swept.
+        return [
+            path for path in filesystem.find_files(http_dir, '*')
+            if os.path.basename(path) != SafeFileCache.SWEEP_STAMP
+        ]
+
+    def _find_links_files(self, options: Values) -> List[str]:
+        links_dir = self._cache_dir(options, 'links')
+        return filesystem.find_files(links_dir, '*')
+
+    def _find_metadata_files(self, options: Values) -> List[str]:
+        metadata_dir = self._cache_dir(options, 'metadata')
+        return filesystem.find_files(metadata_dir, '*')
+
+    def _find_resolution_files(self, options: Values) -> List[str]:
+        resolutions_dir = self._cache_dir(options, 'resolutions')
+        return filesystem.find_files(resolutions_dir, '*')
+
+    def _find_build_envs(self, options: Values) -> List[str]:
+        build_envs_dir = self._cache_dir(options, 'build-envs')
+        prefixes_dir = os.path.join(build_envs_dir, 'prefixes')
+        try:
+            names = os.listdir(prefixes_dir)
+        except OSError:
+            return []
+        return [
+            os.path.join(prefixes_dir, name)
+            for name in names
+            if not name.startswith('.')
+        ]
+
+    def _wheel_index(self, options: Values) -> WheelCacheIndex:
+        # The wheels stored by pip versions that do not index them are only
+        # picked up by the daily walk; purge finds them by walking the cache.
+        index = WheelCacheIndex(self._cache_dir(options, 'wheels'))
+        index.refresh_if_stale()
+        return index
+
+    def _find_wheels(
+        self, options: Values, pattern: str, index: Optional[WheelCacheIndex] = None
+    ) -> List[str]:
         # The wheel filename format, as specified in PEP 427, is:
         #     {distribution}-{version}(-{build})?-{python}-{abi}-{platform}.whl
         #
@@ -213,4 +323,12 @@ class CacheCommand(Command):
         # PEP 427: https://www.python.org/dev/peps/pep-0427/
         pattern = pattern + ("*.whl" if "-" in pattern else "-*.whl")
 
-        return filesystem.find_files(wheel_dir, pattern)
+        if index is None:
+            index = self._wheel_index(options)
+        # The index may still list wheels that were deleted by hand.
+        return [
+            wheel.path
+            for wheel in index
+            if fnmatch.fnmatch(os.path.basename(wheel.path), pattern)
+            and os.path.isfile(wheel.path)
+        ]
@@ -1,14 +1,17 @@
 import errno
+import hashlib
+import json
 import operator
 import os
 import shutil
 import site
 from optparse import SUPPRESS_HELP, Values
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from pip._vendor.packaging.markers import default_environment
 from pip._vendor.packaging.utils import canonicalize_name
 
-from pip._internal.cache import WheelCache
+from pip._internal.cache import ResolutionCache, WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.req_command import (
@@ -19,8 +22,8 @@ from pip._internal.cli.req_command import (
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, InstallationError
 from pip._internal.locations import get_scheme
-from pip._internal.metadata import get_environment
-from pip._internal.models.format_control import FormatControl
+from pip._internal.metadata import BaseEnvironment, get_environment
+from pip._internal.models.target_python import TargetPython
 from pip._internal.operations.check import ConflictDetails, check_install_conflicts
 from pip._internal.req import install_given_reqs
 from pip._internal.req.req_install import InstallRequirement
@@ -41,23 +44,14 @@ from pip._internal.utils.virtualenv import (
     virtualenv_no_global,
 )
 from pip._internal.wheel_builder import (
-    BinaryAllowedPredicate,
     build,
+    get_check_binary_allowed,
     should_build_for_install_command,
 )
 
 logger = getLogger(__name__)
 
 
-def get_check_binary_allowed(format_control: FormatControl) -> BinaryAllowedPredicate:
-    def check_binary_allowed(req: InstallRequirement) -> bool:
-        canonical_name = canonicalize_name(req.name or "")
-        allowed_formats = format_control.get_allowed_formats(canonical_name)
-        return "binary" in allowed_formats
-
-    return check_binary_allowed
-
-
 class InstallCommand(RequirementCommand):
     """
     Install packages from:
@@ -212,6 +206,11 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.prefer_binary())
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.install_jobs())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.wheel_cache_max_size())
+        self.cmd_opts.add_option(cmdoptions.resolver_profile())
 
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group,
@@ -272,7 +271,11 @@ class InstallCommand(RequirementCommand):
             target_python=target_python,
             ignore_requires_python=options.ignore_requires_python,
         )
-        wheel_cache = WheelCache(options.cache_dir, options.format_control)
+        wheel_cache = WheelCache(
+            options.cache_dir,
+            options.format_control,
+            max_size=options.wheel_cache_max_size,
+        )
 
         req_tracker = self.enter_context(get_requirement_tracker())
 
@@ -289,6 +292,27 @@ class InstallCommand(RequirementCommand):
                 reqs, options.install_options
             )
 
+            resolution_cache = None
+            resolution_key = self._get_resolution_key(options, reqs, target_python)
+            if resolution_key is not None:
+                resolution_cache = ResolutionCache(
+                    os.path.join(options.cache_dir, "resolutions")
+                )
+                snapshot = resolution_cache.get(resolution_key)
+                if (
+                    snapshot is not None and
+                    snapshot == get_installed_tree(get_environment(None), reqs)
+                ):
+                    for req in reqs:
+                        if not req.constraint:
+                            logger.info("Requirement already satisfied: %s", req)
+                    logger.verbose(
+                        "Skipping resolution, the installed distributions are "
+                        "the ones these requirements last resolved to."
+                    )
+                    warn_if_run_as_root()
+                    return SUCCESS
+
             preparer = self.make_requirement_preparer(
                 temp_build_dir=directory,
                 options=options,
@@ -345,6 +369,7 @@ class InstallCommand(RequirementCommand):
                 verify=True,
                 build_options=[],
                 global_options=[],
+                jobs=options.build_jobs,
             )
 
             # If we're using PEP 517, we cannot do a direct install
@@ -397,6 +422,7 @@ class InstallCommand(RequirementCommand):
                 warn_script_location=warn_script_location,
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
+                jobs=options.install_jobs,
             )
 
             lib_locations = get_lib_location_guesses(
@@ -431,6 +457,12 @@ class InstallCommand(RequirementCommand):
                 write_output(
                     'Successfully installed %s', installed_desc,
                 )
+
+            if resolution_cache is not None:
+                assert resolution_key is not None
+                snapshot = get_installed_tree(get_environment(None), reqs)
+                if snapshot is not None:
+                    resolution_cache.set(resolution_key, snapshot)
         except OSError as error:
             show_traceback = (self.verbosity >= 1)
 
@@ -450,6 +482,56 @@ class InstallCommand(RequirementCommand):
         warn_if_run_as_root()
         return SUCCESS
 
+    def _get_resolution_key(
+        self,
+        options: Values,
+        reqs: List[InstallRequirement],
+        target_python: TargetPython,
+    ) -> Optional[str]:
+        """Return the key of the resolution snapshot for these requirements.
+
+        This is a digest of the requirements, the environment markers, the
+        indexes and the options resolving depends on. None is returned when
+        a snapshot does not apply: when the resolver has to look for newer
+        versions, when installing elsewhere than the environment, or when a
+        requirement points to a path or URL, whose content may change.
+        """
+        if (
+            not options.cache_dir or
+            self.determine_resolver_variant(options) != "2020-resolver" or
+            options.upgrade or
+            options.force_reinstall or
+            options.ignore_installed or
+            options.target_dir or
+            options.prefix_path or
+            options.root_path
+        ):
+            return None
+
+        requirements = []
+        for req in reqs:
+            if req.editable or req.link is not None or req.req is None:
+                return None
+            requirements.append([str(req.req), req.constraint, req.hash_options])
+
+        key = {
+            "requirements": requirements,
+            "environment": default_environment(),
+            "target_python": target_python.format_given(),
+            "index_urls": self._get_index_urls(options),
+            "find_links": options.find_links,
+            "options": [
+                options.pre,
+                options.prefer_binary,
+                repr(options.format_control),
+                options.ignore_dependencies,
+                options.ignore_requires_python,
+                options.use_user_site,
+            ],
+        }
+        data = json.dumps(key, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
     def _handle_target_dir(
         self, target_dir: str, target_temp_dir: TempDirectory, upgrade: bool
     ) -> None:
@@ -574,6 +656,46 @@ class InstallCommand(RequirementCommand):
         logger.critical("\n".join(parts))
 
 
+def get_installed_tree(
+    env: BaseEnvironment, reqs: List[InstallRequirement]
+) -> Optional[Dict[str, Any]]:
+    """Describe the installed distributions the requirements depend on.
+
+    This maps the name of each distribution reachable from the requirements
+    to its version and the requirements it was reached with, all read from
+    installed metadata. None is returned if a distribution is missing.
+    """
+    dists = {dist.canonical_name: dist for dist in env.iter_distributions()}
+    tree: Dict[str, Any] = {}
+    seen: Set[Tuple[str, Tuple[str, ...]]] = set()
+    to_visit = [
+        (req.req.name, tuple(sorted(req.extras)))
+        for req in reqs
+        if req.req is not None and not req.constraint and req.match_markers()
+    ]
+    while to_visit:
+        name, extras = to_visit.pop()
+        key = (canonicalize_name(name), extras)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        dist = dists.get(key[0])
+        if dist is None:
+            return None
+        entry = tree.setdefault(
+            dist.canonical_name, {"version": str(dist.version), "requires": []}
+        )
+        for dep in dist.iter_dependencies(extras):
+            if str(dep) not in entry["requires"]:
+                entry["requires"].append(str(dep))
+            to_visit.append((dep.name, tuple(sorted(dep.extras))))
+
+    for entry in tree.values():
+        entry["requires"].sort()
+    return tree
+
+
 def get_lib_location_guesses(
         user: bool = False,
         home: Optional[str] = None,
@@ -1,9 +1,23 @@
 import json
-import logging
+import threading
+import time
+import urllib.parse
 from optparse import Values
-from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
+from pip._vendor.requests.models import Response
 
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.req_command import IndexGroupCommand
@@ -14,8 +28,13 @@ from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution, get_environment
 from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.network.session import PipSession
-from pip._internal.utils.misc import stdlib_pkgs, tabulate, write_output
-from pip._internal.utils.parallel import map_multithread
+from pip._internal.utils.logging import getLogger
+from pip._internal.utils.misc import (
+    redact_auth_from_url,
+    stdlib_pkgs,
+    tabulate,
+    write_output,
+)
 
 if TYPE_CHECKING:
     from pip._internal.metadata.base import DistributionVersion
@@ -32,7 +51,49 @@ if TYPE_CHECKING:
     _ProcessedDists = Sequence[_DistWithLatestInfo]
 
 
-logger = logging.getLogger(__name__)
+logger = getLogger(__name__)
+
+
+class _IndexTimings:
+    """Time the requests made to each index, as a session response hook.
+
+    Responses may come from several threads at once.
+    """
+
+    def __init__(self, index_urls: List[str]) -> None:
+        self._index_urls = [url.rstrip("/") + "/" for url in index_urls]
+        self._lock = threading.Lock()
+        # Index URL -> [first request start, last response end, requests,
+        # responses from the HTTP cache].
+        self._timings: Dict[str, List[Any]] = {}
+
+    def _index_of(self, url: str) -> str:
+        for index_url in self._index_urls:
+            if url.startswith(index_url):
+                return index_url
+        # A find-links page, or a redirect to another host.
+        parts = urllib.parse.urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}/"
+
+    def record_response(self, resp: Response, *args: Any, **kwargs: Any) -> None:
+        end = time.monotonic()
+        start = end - resp.elapsed.total_seconds()
+        index_url = self._index_of(resp.url)
+        with self._lock:
+            timing = self._timings.setdefault(index_url, [start, end, 0, 0])
+            timing[0] = min(timing[0], start)
+            timing[1] = max(timing[1], end)
+            timing[2] += 1
+            timing[3] += bool(getattr(resp, "from_cache", False))
+
+    def log(self) -> None:
+        with self._lock:
+            timings = sorted(self._timings.items())
+        for index_url, (start, end, requests, cached) in timings:
+            logger.verbose(
+                "Queried %s: %d requests (%d revalidated from cache) in %.2fs",
+                redact_auth_from_url(index_url), requests, cached, end - start,
+            )
 
 
 class ListCommand(IndexGroupCommand):
@@ -116,6 +177,7 @@ class ListCommand(IndexGroupCommand):
             default=True,
         )
         self.cmd_opts.add_option(cmdoptions.list_exclude())
+        self.cmd_opts.add_option(cmdoptions.index_workers())
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group, self.parser
         )
@@ -214,6 +276,8 @@ class ListCommand(IndexGroupCommand):
     ) -> Iterator["_DistWithLatestInfo"]:
         with self._build_session(options) as session:
             finder = self._build_package_finder(options, session)
+            timings = _IndexTimings(finder.search_scope.index_urls)
+            session.hooks["response"].append(timings.record_response)
 
             def latest_info(
                 dist: "_DistWithLatestInfo"
@@ -240,9 +304,31 @@ class ListCommand(IndexGroupCommand):
                 dist.latest_filetype = typ
                 return dist
 
-            for dist in map_multithread(latest_info, packages):
-                if dist is not None:
-                    yield dist
+            # The index pages are fetched in the background, so that only
+            # picking the latest versions out of them is done in turn.
+            workers = options.index_workers
+            if workers > DEFAULT_POOLSIZE:
+                logger.warning(
+                    "Limiting index workers to the connection pool size %d",
+                    DEFAULT_POOLSIZE,
+                )
+                workers = DEFAULT_POOLSIZE
+            start = time.monotonic()
+            finder.prefetch_all_candidates(
+                (dist.canonical_name for dist in packages), max_workers=workers,
+            )
+            try:
+                for dist in packages:
+                    latest = latest_info(dist)
+                    if latest is not None:
+                        yield latest
+            finally:
+                finder.cancel_prefetches()
+                timings.log()
+                logger.verbose(
+                    "Found the latest versions of %d packages in %.2fs",
+                    len(packages), time.monotonic() - start,
+                )
 
     def output_package_listing(
         self, packages: "_ProcessedDists", options: Values
@@ -64,6 +64,10 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.build_dir())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
+        self.cmd_opts.add_option(cmdoptions.wheel_cache_max_size())
+        self.cmd_opts.add_option(cmdoptions.resolver_profile())
 
         self.cmd_opts.add_option(
             '--no-verify',
@@ -101,7 +105,11 @@ class WheelCommand(RequirementCommand):
         session = self.get_default_session(options)
 
         finder = self._build_package_finder(options, session)
-        wheel_cache = WheelCache(options.cache_dir, options.format_control)
+        wheel_cache = WheelCache(
+            options.cache_dir,
+            options.format_control,
+            max_size=options.wheel_cache_max_size,
+        )
 
         options.wheel_dir = normalize_path(options.wheel_dir)
         ensure_dir(options.wheel_dir)
@@ -155,6 +163,7 @@ class WheelCommand(RequirementCommand):
             verify=(not options.no_verify),
             build_options=options.build_options or [],
             global_options=options.global_options or [],
+            jobs=options.build_jobs,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
@@ -1,11 +1,13 @@
 import abc
-from typing import Optional
-
-from pip._vendor.pkg_resources import Distribution
+from typing import TYPE_CHECKING, Optional
 
+from pip._internal.build_env import BuildEnvironmentCache
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.req import InstallRequirement
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 
 class AbstractDistribution(metaclass=abc.ABCMeta):
     """A base class for handling installable artifacts.
@@ -28,11 +30,14 @@ class AbstractDistribution(metaclass=abc.ABCMeta):
         self.req = req
 
     @abc.abstractmethod
-    def get_pkg_resources_distribution(self) -> Optional[Distribution]:
+    def get_pkg_resources_distribution(self) -> Optional["Distribution"]:
         raise NotImplementedError()
 
     @abc.abstractmethod
     def prepare_distribution_metadata(
-        self, finder: PackageFinder, build_isolation: bool
+        self,
+        finder: PackageFinder,
+        build_isolation: bool,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
     ) -> None:
         raise NotImplementedError()
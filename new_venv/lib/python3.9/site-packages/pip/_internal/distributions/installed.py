@@ -1,10 +1,12 @@
-from typing import Optional
-
-from pip._vendor.pkg_resources import Distribution
+from typing import TYPE_CHECKING, Optional
 
+from pip._internal.build_env import BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 
 class InstalledDistribution(AbstractDistribution):
     """Represents an installed package.
@@ -13,10 +15,13 @@ class InstalledDistribution(AbstractDistribution):
     been computed.
     """
 
-    def get_pkg_resources_distribution(self) -> Optional[Distribution]:
+    def get_pkg_resources_distribution(self) -> Optional["Distribution"]:
         return self.req.satisfied_by
 
     def prepare_distribution_metadata(
-        self, finder: PackageFinder, build_isolation: bool
+        self,
+        finder: PackageFinder,
+        build_isolation: bool,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
     ) -> None:
         pass
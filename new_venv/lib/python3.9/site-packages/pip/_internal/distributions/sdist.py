@@ -1,14 +1,15 @@
 import logging
-from typing import Set, Tuple
+from typing import TYPE_CHECKING, Optional, Set, Tuple
 
-from pip._vendor.pkg_resources import Distribution
-
-from pip._internal.build_env import BuildEnvironment
+from pip._internal.build_env import BuildEnvironment, BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.exceptions import InstallationError
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.utils.subprocess import runner_with_spinner_message
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,11 +20,14 @@ class SourceDistribution(AbstractDistribution):
     generated, either using PEP 517 or using the legacy `setup.py egg_info`.
     """
 
-    def get_pkg_resources_distribution(self) -> Distribution:
+    def get_pkg_resources_distribution(self) -> "Distribution":
         return self.req.get_dist()
 
     def prepare_distribution_metadata(
-        self, finder: PackageFinder, build_isolation: bool
+        self,
+        finder: PackageFinder,
+        build_isolation: bool,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
     ) -> None:
         # Load pyproject.toml, to determine whether PEP 517 is to be used
         self.req.load_pyproject_toml()
@@ -31,11 +35,15 @@ class SourceDistribution(AbstractDistribution):
         # Set up the build isolation, if this requirement should be isolated
         should_isolate = self.req.use_pep517 and build_isolation
         if should_isolate:
-            self._setup_isolation(finder)
+            self._setup_isolation(finder, build_env_cache)
 
         self.req.prepare_metadata()
 
-    def _setup_isolation(self, finder: PackageFinder) -> None:
+    def _setup_isolation(
+        self,
+        finder: PackageFinder,
+        build_env_cache: Optional[BuildEnvironmentCache],
+    ) -> None:
         def _raise_conflicts(
             conflicting_with: str, conflicting_reqs: Set[Tuple[str, str]]
         ) -> None:
@@ -58,7 +66,7 @@ class SourceDistribution(AbstractDistribution):
         pyproject_requires = self.req.pyproject_requires
         assert pyproject_requires is not None
 
-        self.req.build_env = BuildEnvironment()
+        self.req.build_env = BuildEnvironment(build_env_cache)
         self.req.build_env.install_requirements(
             finder, pyproject_requires, "overlay", "Installing build dependencies"
         )
@@ -1,11 +1,14 @@
+from typing import TYPE_CHECKING, Optional
 from zipfile import ZipFile
 
-from pip._vendor.pkg_resources import Distribution
-
+from pip._internal.build_env import BuildEnvironmentCache
 from pip._internal.distributions.base import AbstractDistribution
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.utils.wheel import pkg_resources_distribution_for_wheel
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 
 class WheelDistribution(AbstractDistribution):
     """Represents a wheel distribution.
@@ -13,7 +16,7 @@ class WheelDistribution(AbstractDistribution):
     This does not need any preparation as wheels can be directly unpacked.
     """
 
-    def get_pkg_resources_distribution(self) -> Distribution:
+    def get_pkg_resources_distribution(self) -> "Distribution":
         """Loads the metadata from the wheel file into memory and returns a
         Distribution that uses it, not relying on the wheel file or
         requirement.
@@ -29,6 +32,9 @@ class WheelDistribution(AbstractDistribution):
             )
 
     def prepare_distribution_metadata(
-        self, finder: PackageFinder, build_isolation: bool
+        self,
+        finder: PackageFinder,
+        build_isolation: bool,
+        build_env_cache: Optional[BuildEnvironmentCache] = None,
     ) -> None:
         pass
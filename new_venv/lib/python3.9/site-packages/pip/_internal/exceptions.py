@@ -4,12 +4,13 @@ import configparser
 from itertools import chain, groupby, repeat
 from typing import TYPE_CHECKING, Dict, List, Optional
 
-from pip._vendor.pkg_resources import Distribution
 from pip._vendor.requests.models import Request, Response
 
 if TYPE_CHECKING:
     from hashlib import _Hash
 
+    from pip._vendor.pkg_resources import Distribution
+
     from pip._internal.req.req_install import InstallRequirement
 
 
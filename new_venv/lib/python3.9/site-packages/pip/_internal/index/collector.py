@@ -3,10 +3,15 @@ The main purpose of this module is to expose LinkCollector.collect_sources().
 """
 
 import cgi
+import codecs
 import collections
 import functools
+import hashlib
 import html
+import html.entities
+import html.parser
 import itertools
+import json
 import logging
 import os
 import re
@@ -15,13 +20,16 @@ import urllib.request
 import xml.etree.ElementTree
 from optparse import Values
 from typing import (
+    Any,
     Callable,
+    Dict,
     Iterable,
     List,
     MutableMapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
@@ -32,7 +40,8 @@ from pip._vendor.requests.exceptions import RetryError, SSLError
 from pip._internal.exceptions import NetworkConnectionError
 from pip._internal.models.link import Link
 from pip._internal.models.search_scope import SearchScope
-from pip._internal.network.session import PipSession
+from pip._internal.network.cache import SafeFileCache
+from pip._internal.network.session import SIMPLE_API_JSON, PipSession
 from pip._internal.network.utils import raise_for_status
 from pip._internal.utils.filetypes import is_archive_file
 from pip._internal.utils.misc import pairwise, redact_auth_from_url
@@ -45,6 +54,17 @@ logger = logging.getLogger(__name__)
 HTMLElement = xml.etree.ElementTree.Element
 ResponseHeaders = MutableMapping[str, str]
 
+# The content types of the simple repository API (PEP 503 and PEP 691).
+SIMPLE_API_HTML = "application/vnd.pypi.simple.v1+html"
+_SIMPLE_API_CONTENT_TYPES = (SIMPLE_API_JSON, SIMPLE_API_HTML, "text/html")
+
+# Prefer the JSON form, which needs no HTML parsing.
+_SIMPLE_API_ACCEPT = ", ".join([
+    SIMPLE_API_JSON,
+    f"{SIMPLE_API_HTML}; q=0.1",
+    "text/html; q=0.01",
+])
+
 
 def _match_vcs_scheme(url: str) -> Optional[str]:
     """Look for VCS schemes in the URL.
@@ -65,12 +85,13 @@ class _NotHTML(Exception):
 
 
 def _ensure_html_header(response: Response) -> None:
-    """Check the Content-Type header to ensure the response contains HTML.
+    """Check the Content-Type header to ensure the response contains a simple
+    repository page, either as HTML or as JSON.
 
-    Raises `_NotHTML` if the content type is not text/html.
+    Raises `_NotHTML` if the content type is not one of those.
     """
     content_type = response.headers.get("Content-Type", "")
-    if not content_type.lower().startswith("text/html"):
+    if not content_type.lower().startswith(_SIMPLE_API_CONTENT_TYPES):
         raise _NotHTML(content_type, response.request.method)
 
 
@@ -82,13 +103,15 @@ def _ensure_html_response(url: str, session: PipSession) -> None:
     """Send a HEAD request to the URL, and ensure the response contains HTML.
 
     Raises `_NotHTTP` if the URL is not available for a HEAD request, or
-    `_NotHTML` if the content type is not text/html.
+    `_NotHTML` if the content type is not a simple repository page.
     """
     scheme, netloc, path, query, fragment = urllib.parse.urlsplit(url)
     if scheme not in {'http', 'https'}:
         raise _NotHTTP()
 
-    resp = session.head(url, allow_redirects=True)
+    resp = session.head(
+        url, allow_redirects=True, headers={"Accept": _SIMPLE_API_ACCEPT},
+    )
     raise_for_status(resp)
 
     _ensure_html_header(resp)
@@ -104,8 +127,8 @@ def _get_html_response(url: str, session: PipSession) -> Response:
        Raise `_NotHTTP` if the content type cannot be determined, or
        `_NotHTML` if it is not HTML.
     2. Actually perform the request. Raise HTTP exceptions on network failures.
-    3. Check the Content-Type header to make sure we got HTML, and raise
-       `_NotHTML` otherwise.
+    3. Check the Content-Type header to make sure we got HTML, or JSON as
+       negotiated through the Accept header, and raise `_NotHTML` otherwise.
     """
     if is_archive_file(Link(url).filename):
         _ensure_html_response(url, session=session)
@@ -115,7 +138,7 @@ def _get_html_response(url: str, session: PipSession) -> Response:
     resp = session.get(
         url,
         headers={
-            "Accept": "text/html",
+            "Accept": _SIMPLE_API_ACCEPT,
             # We don't want to blindly returned cached data for
             # /simple/, because authors generally expecting that
             # twine upload && pip install will function, but if
@@ -235,8 +258,69 @@ def _clean_link(url: str) -> str:
     return urllib.parse.urlunparse(result._replace(path=path))
 
 
+# Hashes Link understands, strongest first.
+_PREFERRED_HASHES = ("sha256", "sha384", "sha512", "sha224", "sha1", "md5")
+
+
+def _create_link_from_file(
+    file: Dict[str, Any],
+    page_url: str,
+) -> Optional[Link]:
+    """
+    Convert a file of a simple repository JSON page (PEP 691) to a Link.
+    """
+    href = file.get("url")
+    if not href or not isinstance(href, str):
+        return None
+
+    url = _clean_link(urllib.parse.urljoin(page_url, href))
+    hashes = file.get("hashes")
+    if isinstance(hashes, dict) and "#" not in url:
+        # Links carry their hash in the URL fragment, as in the HTML form.
+        for name in _PREFERRED_HASHES:
+            value = hashes.get(name)
+            if isinstance(value, str):
+                url = f"{url}#{name}={value.lower()}"
+                break
+
+    pyrequire = file.get("requires-python") or None
+
+    # Either a boolean or the hashes of the metadata file.
+    dist_info_metadata = file.get("dist-info-metadata")
+    if isinstance(dist_info_metadata, dict):
+        dist_info_metadata = next(
+            (
+                f"{name}={dist_info_metadata[name]}"
+                for name in _PREFERRED_HASHES
+                if isinstance(dist_info_metadata.get(name), str)
+            ),
+            "true",
+        )
+    elif dist_info_metadata:
+        dist_info_metadata = "true"
+    else:
+        dist_info_metadata = None
+
+    # The yanked key is either a boolean or the reason as a string.
+    yanked = file.get("yanked", False)
+    if isinstance(yanked, str):
+        yanked_reason: Optional[str] = yanked
+    elif yanked:
+        yanked_reason = ""
+    else:
+        yanked_reason = None
+
+    return Link(
+        url,
+        comes_from=page_url,
+        requires_python=pyrequire,
+        yanked_reason=yanked_reason,
+        dist_info_metadata=dist_info_metadata,
+    )
+
+
 def _create_link_from_element(
-    anchor: HTMLElement,
+    anchor: Union[HTMLElement, Dict[str, str]],
     page_url: str,
     base_url: str,
 ) -> Optional[Link]:
@@ -255,11 +339,15 @@ def _create_link_from_element(
     if yanked_reason:
         yanked_reason = html.unescape(yanked_reason)
 
+    # PEP 658: the metadata file is served at the file URL + ".metadata".
+    dist_info_metadata = anchor.get('data-dist-info-metadata')
+
     link = Link(
         url,
         comes_from=page_url,
         requires_python=pyrequire,
         yanked_reason=yanked_reason,
+        dist_info_metadata=dist_info_metadata,
     )
 
     return link
@@ -279,41 +367,257 @@ class CacheablePageContent:
 
 
 def with_cached_html_pages(
-    fn: Callable[["HTMLPage"], Iterable[Link]],
-) -> Callable[["HTMLPage"], List[Link]]:
+    fn: Callable[..., Iterable[Link]],
+) -> Callable[..., List[Link]]:
     """
     Given a function that parses an Iterable[Link] from an HTMLPage, cache the
-    function's result (keyed by CacheablePageContent), unless the HTMLPage
-    `page` has `page.cache_link_parsing == False`.
+    function's result (keyed by CacheablePageContent and the other arguments),
+    unless the HTMLPage `page` has `page.cache_link_parsing == False`.
     """
 
     @functools.lru_cache(maxsize=None)
-    def wrapper(cacheable_page: CacheablePageContent) -> List[Link]:
-        return list(fn(cacheable_page.page))
+    def wrapper(cacheable_page: CacheablePageContent, *args: Any) -> List[Link]:
+        return list(fn(cacheable_page.page, *args))
 
     @functools.wraps(fn)
-    def wrapper_wrapper(page: "HTMLPage") -> List[Link]:
+    def wrapper_wrapper(page: "HTMLPage", *args: Any) -> List[Link]:
         if page.cache_link_parsing:
-            return wrapper(CacheablePageContent(page))
-        return list(fn(page))
+            return wrapper(CacheablePageContent(page), *args)
+        return list(fn(page, *args))
 
     return wrapper_wrapper
 
 
+class _UnsupportedPage(Exception):
+    """Raised when _AnchorParser cannot guarantee html5lib's result."""
+
+
+# Elements that html5lib moves, drops or parses as foreign content, so that
+# anchors within or after them may not end up where the tokens are.
+_UNSUPPORTED_TAGS = frozenset([
+    "frameset", "math", "noscript", "plaintext", "select", "svg", "table",
+    "template",
+])
+
+# A start tag whose attributes are tokenized identically by html.parser and
+# html5lib: no duplicate "=", stray quotes or "<" in names or values.
+_SIMPLE_START_TAG_RE = re.compile(
+    r"""<[a-zA-Z]+"""
+    r"""(?:[\t\n\f ]+[a-zA-Z_:][-a-zA-Z0-9_:.]*"""
+    r"""(?:[\t\n\f ]*=[\t\n\f ]*(?:"[^"]*"|'[^']*'|[^\t\n\f "'=<>`]+))?)*"""
+    r"""[\t\n\f ]*/?>\Z""",
+)
+
+_ANCHOR_START_RE = re.compile(r"<a[\t\n\f />]", re.IGNORECASE)
+
+# Comments html5lib ends where html.parser does not: empty ones closed right
+# away, as in "<!-->", ones closed by "--!>", and marked sections such as
+# "<![CDATA[", which html5lib ends at the first ">".
+_AMBIGUOUS_COMMENT_RE = re.compile(r"<!---?>|--!>|<!\[")
+
+_CHARREF_RE = re.compile(
+    r"&(?=[#a-zA-Z0-9])(?:#([0-9]+);|#[xX]([0-9a-fA-F]+);|([a-zA-Z0-9]+;))?"
+)
+
+
+def _has_ambiguous_charrefs(text: str) -> bool:
+    """Check for character references html.unescape() and html5lib may
+    decode differently, e.g. "&copy=" in an attribute value.
+    """
+    for match in _CHARREF_RE.finditer(text):
+        decimal, hexadecimal, name = match.groups()
+        if name is not None:
+            if name not in html.entities.html5:
+                return True
+            continue
+        if decimal is not None:
+            codepoint = int(decimal)
+        elif hexadecimal is not None:
+            codepoint = int(hexadecimal, 16)
+        else:
+            return True
+        # Both replace invalid code points, but not always in the same way.
+        if not 0x20 <= codepoint < 0x7F:
+            return True
+    return False
+
+
+def _decode_for_anchor_parser(page: "HTMLPage") -> Optional[str]:
+    """Decode the page the way html5lib would, or return None if that cannot
+    be done without guessing the encoding.
+    """
+    content = page.content
+    boms = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+    if content.startswith(boms):
+        return None
+    encoding = None
+    if page.encoding:
+        try:
+            encoding = codecs.lookup(page.encoding).name
+        except LookupError:
+            return None
+    if encoding is not None and encoding.startswith(("utf-16", "utf-32")):
+        return None
+    try:
+        if content.isascii():
+            text = content.decode("ascii")
+        elif encoding == "utf-8":
+            text = content.decode("utf-8")
+        else:
+            return None
+    except UnicodeDecodeError:
+        return None
+    if "\0" in text:
+        return None
+    # html5lib normalizes newlines before tokenizing.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _AnchorParser(html.parser.HTMLParser):
+    """Collect the attributes of the anchor and base tags of a page.
+
+    Unlike html5lib, no tree is built, so any markup that html5lib would
+    restructure is rejected by raising _UnsupportedPage.
+    """
+
+    # Raw text elements, whose content html5lib does not parse as markup.
+    CDATA_CONTENT_ELEMENTS = (
+        "iframe", "noembed", "noframes", "script", "style", "textarea",
+        "title", "xmp",
+    )
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.anchors: List[Dict[str, str]] = []
+        self.base_url: Optional[str] = None
+        self.in_anchor = False
+
+    def handle_starttag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        # Anything within an anchor could make html5lib reopen it later.
+        if self.in_anchor or tag in _UNSUPPORTED_TAGS:
+            raise _UnsupportedPage()
+        if tag not in ("a", "base"):
+            return
+        start_tag = self.get_starttag_text()
+        if start_tag is None or not _SIMPLE_START_TAG_RE.match(start_tag):
+            raise _UnsupportedPage()
+        # html5lib keeps the first of duplicated attributes, and gives
+        # attributes without a value an empty one.
+        attributes: Dict[str, str] = {}
+        for name, value in attrs:
+            attributes.setdefault(name, value or "")
+        if tag == "base":
+            if self.base_url is None and "href" in attributes:
+                self.base_url = attributes["href"]
+        else:
+            self.anchors.append(attributes)
+            self.in_anchor = True
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        # The self-closing flag is ignored on HTML elements.
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a":
+            self.in_anchor = False
+
+
+def _parse_anchors_fast(
+    page: "HTMLPage",
+) -> Optional[Tuple[List[Dict[str, str]], Optional[str]]]:
+    """Return the anchors and base URL of the page, as html5lib would find
+    them, or None if the page has to be parsed by html5lib.
+    """
+    text = _decode_for_anchor_parser(page)
+    if text is None or _has_ambiguous_charrefs(text):
+        return None
+    if _AMBIGUOUS_COMMENT_RE.search(text):
+        return None
+    parser = _AnchorParser()
+    try:
+        parser.feed(text)
+        # Markup left unfinished at the end of the page, such as a comment
+        # that is never closed, would be read as text by close(), where
+        # html5lib hides everything after it.
+        if "<" in parser.rawdata:
+            return None
+        parser.close()
+    except (_UnsupportedPage, AssertionError):
+        return None
+    if parser.in_anchor:
+        return None
+    # Anchors hidden from html.parser (e.g. in a comment html5lib ends
+    # earlier) or misread by it.
+    if len(parser.anchors) != len(_ANCHOR_START_RE.findall(text)):
+        return None
+    return parser.anchors, parser.base_url
+
+
+def _parse_json_links(page: "HTMLPage") -> Iterable[Link]:
+    """
+    Parse a simple repository JSON page (PEP 691), and yield its files as
+    Link objects.
+    """
+    try:
+        data = json.loads(page.content)
+        version = data["meta"]["api-version"]
+        files = data["files"]
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Skipping invalid JSON simple API page %s", page)
+        return
+    if not isinstance(version, str) or version.split(".")[0] != "1":
+        logger.warning(
+            "Skipping page %s with unsupported simple API version %s",
+            page,
+            version,
+        )
+        return
+    for file in files:
+        if not isinstance(file, dict):
+            continue
+        link = _create_link_from_file(file, page_url=page.url)
+        if link is None:
+            continue
+        yield link
+
+
 @with_cached_html_pages
-def parse_links(page: "HTMLPage") -> Iterable[Link]:
+def parse_links(page: "HTMLPage", html_parser: str = "html5lib") -> Iterable[Link]:
     """
     Parse an HTML document, and yield its anchor elements as Link objects.
+
+    With html_parser="html.parser", anchors are extracted by a streaming
+    parser when the page is simple enough for it to find the same ones as
+    html5lib, which is used otherwise. JSON pages are not parsed as HTML.
     """
-    document = html5lib.parse(
-        page.content,
-        transport_encoding=page.encoding,
-        namespaceHTMLElements=False,
-    )
+    if page.content_type.lower().startswith(SIMPLE_API_JSON):
+        yield from _parse_json_links(page)
+        return
 
     url = page.url
-    base_url = _determine_base_url(document, url)
-    for anchor in document.findall(".//a"):
+    anchors: Optional[Iterable[Union[HTMLElement, Dict[str, str]]]] = None
+    if html_parser == "html.parser":
+        parsed = _parse_anchors_fast(page)
+        if parsed is None:
+            logger.debug("Falling back to html5lib to parse %s", page)
+        else:
+            anchors, base = parsed
+            base_url = url if base is None else base
+
+    if anchors is None:
+        document = html5lib.parse(
+            page.content,
+            transport_encoding=page.encoding,
+            namespaceHTMLElements=False,
+        )
+        base_url = _determine_base_url(document, url)
+        anchors = document.findall(".//a")
+
+    for anchor in anchors:
         link = _create_link_from_element(
             anchor,
             page_url=url,
@@ -333,6 +637,8 @@ class HTMLPage:
         encoding: Optional[str],
         url: str,
         cache_link_parsing: bool = True,
+        etag: Optional[str] = None,
+        content_type: str = "text/html",
     ) -> None:
         """
         :param encoding: the encoding to decode the given content.
@@ -340,11 +646,16 @@ class HTMLPage:
         :param cache_link_parsing: whether links parsed from this page's url
                                    should be cached. PyPI index urls should
                                    have this set to False, for example.
+        :param etag: the ETag header the page was served with, if any.
+        :param content_type: the Content-Type of the page, which is JSON
+            rather than HTML if the index negotiated PEP 691.
         """
         self.content = content
         self.encoding = encoding
         self.url = url
         self.cache_link_parsing = cache_link_parsing
+        self.etag = etag
+        self.content_type = content_type
 
     def __str__(self) -> str:
         return redact_auth_from_url(self.url)
@@ -366,7 +677,78 @@ def _make_html_page(response: Response, cache_link_parsing: bool = True) -> HTML
         response.content,
         encoding=encoding,
         url=response.url,
-        cache_link_parsing=cache_link_parsing)
+        cache_link_parsing=cache_link_parsing,
+        etag=response.headers.get("ETag"),
+        content_type=response.headers.get("Content-Type", "text/html"))
+
+
+class ParsedLinksCache:
+    """A persistent cache of the links parsed from pages.
+
+    Unlike the in-process memoization of parse_links(), entries survive
+    across pip runs. Each entry is keyed by the page URL and validated
+    against the page's strong ETag, or the SHA-256 of its content when it
+    has none, so that a page served unchanged (typically from the HTTP
+    cache after a 304) is never parsed twice.
+    """
+
+    # Bump this when the serialized form of the links changes.
+    _FORMAT_VERSION = 2
+
+    def __init__(self, directory: str) -> None:
+        self._cache = SafeFileCache(directory)
+
+    @staticmethod
+    def _get_validator(page: HTMLPage) -> str:
+        # Weak ETags only promise semantically equivalent content, which
+        # could still differ in the links it lists.
+        if page.etag and not page.etag.startswith("W/"):
+            return f"etag:{page.etag}"
+        return "sha256:{}".format(hashlib.sha256(page.content).hexdigest())
+
+    def get(self, page: HTMLPage) -> Optional[List[Link]]:
+        """Return the links cached for page, if its content is unchanged."""
+        data = self._cache.get(page.url)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data.decode("utf-8"))
+            if (
+                entry["version"] != self._FORMAT_VERSION or
+                entry["validator"] != self._get_validator(page)
+            ):
+                return None
+            return [
+                Link(
+                    url,
+                    comes_from=page.url,
+                    requires_python=requires_python,
+                    yanked_reason=yanked_reason,
+                    dist_info_metadata=dist_info_metadata,
+                )
+                for (
+                    url, requires_python, yanked_reason, dist_info_metadata
+                ) in entry["links"]
+            ]
+        except (ValueError, KeyError, TypeError):
+            logger.debug("Ignoring corrupt parsed links cache entry for %s", page)
+            return None
+
+    def set(self, page: HTMLPage, links: Iterable[Link]) -> None:
+        entry = {
+            "version": self._FORMAT_VERSION,
+            "validator": self._get_validator(page),
+            "links": [
+                [
+                    link.url,
+                    link.requires_python,
+                    link.yanked_reason,
+                    link.dist_info_metadata,
+                ]
+                for link in links
+            ],
+        }
+        self._cache.set(page.url, json.dumps(entry).encode("utf-8"))
 
 
 def _get_html_page(
@@ -405,9 +787,10 @@ def _get_html_page(
         )
     except _NotHTML as exc:
         logger.warning(
-            'Skipping page %s because the %s request got Content-Type: %s.'
-            'The only supported Content-Type is text/html',
+            'Skipping page %s because the %s request got Content-Type: %s. '
+            'The only supported Content-Types are %s',
             link, exc.request_desc, exc.content_type,
+            ', '.join(_SIMPLE_API_CONTENT_TYPES),
         )
     except NetworkConnectionError as exc:
         _handle_get_page_fail(link, exc)
@@ -445,9 +828,13 @@ class LinkCollector:
         self,
         session: PipSession,
         search_scope: SearchScope,
+        links_cache: Optional[ParsedLinksCache] = None,
+        html_parser: str = "html5lib",
     ) -> None:
         self.search_scope = search_scope
         self.session = session
+        self.links_cache = links_cache
+        self.html_parser = html_parser
 
     @classmethod
     def create(
@@ -474,8 +861,17 @@ class LinkCollector:
         search_scope = SearchScope.create(
             find_links=find_links, index_urls=index_urls,
         )
+
+        links_cache = None
+        cache_dir = getattr(options, "cache_dir", None)
+        if cache_dir:
+            links_cache = ParsedLinksCache(os.path.join(cache_dir, "links"))
+
         link_collector = LinkCollector(
-            session=session, search_scope=search_scope,
+            session=session,
+            search_scope=search_scope,
+            links_cache=links_cache,
+            html_parser=getattr(options, "html_parser", "html5lib"),
         )
         return link_collector
 
@@ -485,10 +881,26 @@ class LinkCollector:
 
     def fetch_page(self, location: Link) -> Optional[HTMLPage]:
         """
-        Fetch an HTML page containing package links.
+        Fetch an HTML page containing package links, or its JSON form if
+        the index supports it.
         """
         return _get_html_page(location, session=self.session)
 
+    def parse_links(self, page: HTMLPage) -> List[Link]:
+        """
+        Parse the links of a page, reusing the result of a previous run if
+        the page has not changed since.
+        """
+        if self.links_cache is None:
+            return parse_links(page, self.html_parser)
+        links = self.links_cache.get(page)
+        if links is None:
+            links = parse_links(page, self.html_parser)
+            self.links_cache.set(page, links)
+        else:
+            logger.debug("Using cached links for %s", page)
+        return links
+
     def collect_sources(
         self,
         project_name: str,
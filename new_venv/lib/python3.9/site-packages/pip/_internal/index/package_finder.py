@@ -3,17 +3,32 @@
 # The following comment should be removed at some point in the future.
 # mypy: strict-optional=False
 
+import collections
 import functools
 import itertools
 import logging
 import re
-from typing import FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.tags import Tag
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import _BaseVersion
 from pip._vendor.packaging.version import parse as parse_version
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 
 from pip._internal.exceptions import (
     BestVersionAlreadyInstalled,
@@ -21,7 +36,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import LinkCollector
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
@@ -29,6 +44,7 @@ from pip._internal.models.search_scope import SearchScope
 from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.models.target_python import TargetPython
 from pip._internal.models.wheel import Wheel
+from pip._internal.network.session import PipSession
 from pip._internal.req import InstallRequirement
 from pip._internal.utils._log import getLogger
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
@@ -49,6 +65,22 @@ CandidateSortingKey = (
     Tuple[int, int, int, _BaseVersion, Optional[int], BuildTag]
 )
 
+# How many LinkEvaluators, one per project looked up, the results of
+# evaluating links are kept for.
+_MAX_LINK_MEMOS = 64
+
+# How many parsed wheel filenames are kept. That is enough for the wheels
+# of all the releases of a large project, which are parsed once to guess
+# their versions and again to evaluate the links left.
+_MAX_PARSED_WHEEL_FILENAMES = 10000
+
+
+class _LinkMemo(NamedTuple):
+    """The results of evaluating links with a LinkEvaluator."""
+
+    versions: Dict[Link, Optional[str]]
+    candidates: Dict[Link, Optional["InstallationCandidate"]]
+
 
 def _check_link_requires_python(
     link: Link,
@@ -92,6 +124,15 @@ def _check_link_requires_python(
     return True
 
 
+@functools.lru_cache(maxsize=_MAX_PARSED_WHEEL_FILENAMES)
+def _parse_wheel_filename(filename: str) -> Wheel:
+    """Parse a wheel filename, once for all the evaluators that look at it.
+
+    :raises InvalidWheelFilename: when the filename is invalid for a wheel
+    """
+    return Wheel(filename)
+
+
 class LinkEvaluator:
 
     """
@@ -141,6 +182,33 @@ class LinkEvaluator:
 
         self.project_name = project_name
 
+    def guess_version(self, link: Link) -> Optional[str]:
+        """
+        Return the version evaluate_link() would find for link, going by its
+        filename alone.
+
+        Nothing else is checked, so this is only suitable to rule out links
+        quickly. None is returned if no version can be found.
+        """
+        if link.egg_fragment:
+            egg_info = link.egg_fragment
+        else:
+            egg_info, ext = link.splitext()
+            if ext == WHEEL_EXTENSION:
+                try:
+                    return _parse_wheel_filename(link.filename).version
+                except InvalidWheelFilename:
+                    return None
+
+        version = _extract_version_from_fragment(
+            egg_info, self._canonical_name,
+        )
+        if version:
+            match = self._py_version_re.search(version)
+            if match:
+                version = version[:match.start()]
+        return version
+
     def evaluate_link(self, link: Link) -> Tuple[bool, Optional[str]]:
         """
         Determine whether a link is a candidate for installation.
@@ -172,7 +240,7 @@ class LinkEvaluator:
                 return (False, 'macosx10 one')
             if ext == WHEEL_EXTENSION:
                 try:
-                    wheel = Wheel(link.filename)
+                    wheel = _parse_wheel_filename(link.filename)
                 except InvalidWheelFilename:
                     return (False, 'invalid wheel filename')
                 if canonicalize_name(wheel.name) != self._canonical_name:
@@ -180,8 +248,8 @@ class LinkEvaluator:
                         self.project_name)
                     return (False, reason)
 
-                supported_tags = self._target_python.get_tags()
-                if not wheel.supported(supported_tags):
+                tag_priorities = self._target_python.get_tag_priorities()
+                if not any(tag in tag_priorities for tag in wheel.file_tags):
                     # Include the wheel's tags in the reason string to
                     # simplify troubleshooting compatibility issues.
                     file_tags = wheel.get_formatted_file_tags()
@@ -401,6 +469,7 @@ class CandidateEvaluator:
         return cls(
             project_name=project_name,
             supported_tags=supported_tags,
+            tag_priorities=target_python.get_tag_priorities(),
             specifier=specifier,
             prefer_binary=prefer_binary,
             allow_all_prereleases=allow_all_prereleases,
@@ -415,10 +484,13 @@ class CandidateEvaluator:
         prefer_binary: bool = False,
         allow_all_prereleases: bool = False,
         hashes: Optional[Hashes] = None,
+        tag_priorities: Optional[Dict[Tag, int]] = None,
     ) -> None:
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: The index of each tag in supported_tags, if
+            already computed (see TargetPython.get_tag_priorities()).
         """
         self._allow_all_prereleases = allow_all_prereleases
         self._hashes = hashes
@@ -429,9 +501,9 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = {tag: idx for idx, tag in enumerate(supported_tags)}
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -507,7 +579,7 @@ class CandidateEvaluator:
         link = candidate.link
         if link.is_wheel:
             # can raise InvalidWheelFilename
-            wheel = Wheel(link.filename)
+            wheel = _parse_wheel_filename(link.filename)
             try:
                 pri = -(wheel.find_most_preferred_tag(
                     valid_tags, self._wheel_tag_preferences
@@ -605,6 +677,23 @@ class PackageFinder:
         # These are boring links that have already been logged somehow.
         self._logged_links: Set[Link] = set()
 
+        # Links are evaluated at most once by each LinkEvaluator, whether
+        # to guess their version or to make candidates of them. Only the
+        # results of the most recently used LinkEvaluators are kept, so that
+        # looking up many projects does not keep all their links.
+        self._link_memos: "collections.OrderedDict[LinkEvaluator, _LinkMemo]" = (
+            collections.OrderedDict()
+        )
+        self._link_memos_lock = threading.Lock()
+
+        # The projects find_all_candidates() was called for, mapped to their
+        # prefetch if they had one.
+        self._prefetches: Dict[str, Optional[Future]] = {}
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        # Set by cancel_prefetches() for the prefetches of the executor.
+        self._prefetch_cancelled = threading.Event()
+
     # Don't include an allow_yanked default value to make sure each call
     # site considers whether yanked releases are allowed. This also causes
     # that decision to be made explicit in the calling code, which helps
@@ -657,6 +746,10 @@ class PackageFinder:
     def find_links(self) -> List[str]:
         return self._link_collector.find_links
 
+    @property
+    def session(self) -> PipSession:
+        return self._link_collector.session
+
     @property
     def index_urls(self) -> List[str]:
         return self.search_scope.index_urls
@@ -693,6 +786,10 @@ class PackageFinder:
             ignore_requires_python=self._ignore_requires_python,
         )
 
+    @functools.lru_cache(maxsize=None)
+    def _get_link_evaluator(self, project_name: str) -> LinkEvaluator:
+        return self.make_link_evaluator(project_name)
+
     def _sort_links(self, links: Iterable[Link]) -> List[Link]:
         """
         Returns elements of links in order, non-egg links first, egg links
@@ -735,23 +832,61 @@ class PackageFinder:
             version=result,
         )
 
+    def _get_link_memo(self, link_evaluator: LinkEvaluator) -> _LinkMemo:
+        # Prefetches evaluate links from other threads.
+        with self._link_memos_lock:
+            memo = self._link_memos.get(link_evaluator)
+            if memo is not None:
+                self._link_memos.move_to_end(link_evaluator)
+                return memo
+            memo = self._link_memos[link_evaluator] = _LinkMemo({}, {})
+            if len(self._link_memos) > _MAX_LINK_MEMOS:
+                self._link_memos.popitem(last=False)
+            return memo
+
     def evaluate_links(
-        self, link_evaluator: LinkEvaluator, links: Iterable[Link]
+        self,
+        link_evaluator: LinkEvaluator,
+        links: Iterable[Link],
+        specifier: Optional[specifiers.BaseSpecifier] = None,
     ) -> List[InstallationCandidate]:
         """
         Convert links that are candidates to InstallationCandidate objects.
+
+        :param specifier: An optional specifier the versions of the candidates
+            must match. Links whose filename shows a version it does not
+            match are dropped without being evaluated.
         """
         candidates = []
+        memo = self._get_link_memo(link_evaluator)
+        # Most versions are shared by many files.
+        version_matches: Dict[str, bool] = {}
         for link in self._sort_links(links):
-            candidate = self.get_install_candidate(link_evaluator, link)
+            if specifier is not None:
+                try:
+                    version = memo.versions[link]
+                except KeyError:
+                    version = link_evaluator.guess_version(link)
+                    memo.versions[link] = version
+                if version is not None:
+                    if version not in version_matches:
+                        version_matches[version] = specifier.contains(
+                            version, prereleases=True,
+                        )
+                    if not version_matches[version]:
+                        continue
+            try:
+                candidate = memo.candidates[link]
+            except KeyError:
+                candidate = self.get_install_candidate(link_evaluator, link)
+                memo.candidates[link] = candidate
             if candidate is not None:
                 candidates.append(candidate)
 
         return candidates
 
-    def process_project_url(
-        self, project_url: Link, link_evaluator: LinkEvaluator
-    ) -> List[InstallationCandidate]:
+    @functools.lru_cache(maxsize=None)
+    def _get_page_links(self, project_url: Link) -> List[Link]:
         logger.debug(
             'Fetching project page and analyzing links: %s', project_url,
         )
@@ -759,16 +894,73 @@ class PackageFinder:
         if html_page is None:
             return []
 
-        page_links = list(parse_links(html_page))
+        return self._link_collector.parse_links(html_page)
+
+    def process_project_url(
+        self,
+        project_url: Link,
+        link_evaluator: LinkEvaluator,
+        specifier: Optional[specifiers.BaseSpecifier] = None,
+    ) -> List[InstallationCandidate]:
+        page_links = self._get_page_links(project_url)
 
         with indent_log():
             package_links = self.evaluate_links(
                 link_evaluator,
                 links=page_links,
+                specifier=specifier,
             )
 
         return package_links
 
+    def prefetch_all_candidates(
+        self,
+        project_names: Iterable[str],
+        max_workers: int = DEFAULT_POOLSIZE,
+    ) -> None:
+        """Start finding the candidates of the given projects concurrently,
+        in the background.
+
+        Only the pages listing the files of the projects are fetched, and
+        find_all_candidates() or find_best_candidate() waits for these rather
+        than fetching them again. Projects they have already been called for
+        are skipped.
+
+        :param max_workers: How many pages to fetch at the same time. Only
+            the first call starting prefetches sets it.
+        """
+        with self._prefetch_lock:
+            for project_name in project_names:
+                if project_name in self._prefetches:
+                    continue
+                if self._prefetch_executor is None:
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix="pip-prefetch",
+                    )
+                    self._prefetch_cancelled = threading.Event()
+                logger.debug("Prefetching candidates for %s", project_name)
+                self._prefetches[project_name] = self._prefetch_executor.submit(
+                    self._fetch_pages, project_name, self._prefetch_cancelled,
+                )
+
+    def cancel_prefetches(self) -> None:
+        """Cancel the prefetches that have not started yet, stop the running
+        ones after the page they are fetching, and shut the workers down.
+
+        Prefetches can be started again afterwards.
+        """
+        with self._prefetch_lock:
+            for project_name, future in list(self._prefetches.items()):
+                if future is not None and future.cancel():
+                    del self._prefetches[project_name]
+            self._prefetch_cancelled.set()
+            if self._prefetch_executor is not None:
+                # The interpreter joins the workers when it exits, which no
+                # longer waits for more than the pages being fetched.
+                self._prefetch_executor.shutdown(wait=False)
+                self._prefetch_executor = None
+
     @functools.lru_cache(maxsize=None)
     def find_all_candidates(self, project_name: str) -> List[InstallationCandidate]:
         """Find all available InstallationCandidate for project_name
@@ -779,24 +971,56 @@ class PackageFinder:
         See LinkEvaluator.evaluate_link() for details on which files
         are accepted.
         """
-        link_evaluator = self.make_link_evaluator(project_name)
+        return list(self._iter_candidates(project_name))
+
+    def _fetch_pages(self, project_name: str, cancelled: threading.Event) -> None:
+        """Fetch and parse the pages listing the files of project_name, until
+        cancelled is set.
+
+        The links are not evaluated, since which versions are wanted is not
+        known yet.
+        """
+        def fetch_page(page_url: Link) -> List[InstallationCandidate]:
+            self._get_page_links(page_url)
+            return []
+
+        collected_sources = self._link_collector.collect_sources(
+            project_name=project_name,
+            candidates_from_page=fetch_page,
+        )
+        for sources in collected_sources:
+            for source in sources:
+                if cancelled.is_set():
+                    return
+                if source is not None:
+                    list(source.page_candidates())
+
+    def _iter_candidates(
+        self,
+        project_name: str,
+        specifier: Optional[specifiers.BaseSpecifier] = None,
+    ) -> Iterator[InstallationCandidate]:
+        """Find the candidates of project_name, a page at a time.
+
+        :param specifier: An optional specifier to drop the links of other
+            versions with, before they are evaluated.
+        """
+        with self._prefetch_lock:
+            future = self._prefetches.setdefault(project_name, None)
+        if future is not None:
+            future.result()
+
+        link_evaluator = self._get_link_evaluator(project_name)
 
         collected_sources = self._link_collector.collect_sources(
             project_name=project_name,
             candidates_from_page=functools.partial(
                 self.process_project_url,
                 link_evaluator=link_evaluator,
+                specifier=specifier,
             ),
         )
 
-        page_candidates_it = itertools.chain.from_iterable(
-            source.page_candidates()
-            for sources in collected_sources
-            for source in sources
-            if source is not None
-        )
-        page_candidates = list(page_candidates_it)
-
         file_links_it = itertools.chain.from_iterable(
             source.file_links()
             for sources in collected_sources
@@ -806,6 +1030,7 @@ class PackageFinder:
         file_candidates = self.evaluate_links(
             link_evaluator,
             sorted(file_links_it, reverse=True),
+            specifier=specifier,
         )
 
         if logger.isEnabledFor(logging.DEBUG) and file_candidates:
@@ -813,7 +1038,11 @@ class PackageFinder:
             logger.debug("Local files found: %s", ", ".join(paths))
 
         # This is an intentional priority ordering
-        return file_candidates + page_candidates
+        yield from file_candidates
+        for sources in collected_sources:
+            for source in sources:
+                if source is not None:
+                    yield from source.page_candidates()
 
     def make_candidate_evaluator(
         self,
@@ -844,11 +1073,18 @@ class PackageFinder:
 
         :param specifier: An optional object implementing `filter`
             (e.g. `packaging.specifiers.SpecifierSet`) to filter applicable
-            versions.
+            versions. The result's `iter_all()` only yields the candidates
+            of versions it allows; use `find_all_candidates()` for the rest.
 
         :return: A `BestCandidateResult` instance.
         """
-        candidates = self.find_all_candidates(project_name)
+        # Which candidates are applicable depends on all of them, as
+        # pre-releases are only allowed when no final release matches, and
+        # the resolver only takes yanked ones when all of them are yanked.
+        # They are collected here, after the links of versions the specifier
+        # rules out were dropped without being evaluated. FoundCandidates
+        # only gets here once the resolver iterates it.
+        candidates = list(self._iter_candidates(project_name, specifier))
         candidate_evaluator = self.make_candidate_evaluator(
             project_name=project_name,
             specifier=specifier,
@@ -886,11 +1122,12 @@ class PackageFinder:
             )) or "none"
 
         if installed_version is None and best_candidate is None:
+            # The specifier left the other versions out of the result.
             logger.critical(
                 'Could not find a version that satisfies the requirement %s '
                 '(from versions: %s)',
                 req,
-                _format_versions(best_candidate_result.iter_all()),
+                _format_versions(self.find_all_candidates(req.name)),
             )
 
             raise DistributionNotFound(
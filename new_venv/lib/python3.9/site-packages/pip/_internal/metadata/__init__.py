@@ -1,3 +1,7 @@
+import functools
+import logging
+import os
+import sys
 from typing import List, Optional
 
 from .base import BaseDistribution, BaseEnvironment
@@ -10,6 +14,28 @@ __all__ = [
     "get_wheel_distribution",
 ]
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _should_use_importlib_metadata() -> bool:
+    """Whether to use the ``importlib.metadata`` backend.
+
+    It is opted into by setting ``_PIP_USE_IMPORTLIB_METADATA`` to a true
+    value in the environment, and needs Python 3.8 or later. The
+    pkg_resources backend is used otherwise.
+    """
+    value = os.environ.get("_PIP_USE_IMPORTLIB_METADATA", "")
+    if value.lower() not in ("1", "true", "yes", "on"):
+        return False
+    if sys.version_info < (3, 8):
+        logger.debug(
+            "Not using the importlib.metadata backend, it needs Python 3.8 "
+            "or later; using pkg_resources."
+        )
+        return False
+    return True
+
 
 def get_default_environment() -> BaseEnvironment:
     """Get the default representation for the current environment.
@@ -18,7 +44,10 @@ def get_default_environment() -> BaseEnvironment:
     Environment instance should be built from ``sys.path`` and may use caching
     to share instance state accorss calls.
     """
-    from .pkg_resources import Environment
+    if _should_use_importlib_metadata():
+        from .importlib import Environment
+    else:
+        from .pkg_resources import Environment  # type: ignore[no-redef]
 
     return Environment.default()
 
@@ -30,7 +59,10 @@ def get_environment(paths: Optional[List[str]]) -> BaseEnvironment:
     given import paths. The backend must build a fresh instance representing
     the state of installed distributions when this function is called.
     """
-    from .pkg_resources import Environment
+    if _should_use_importlib_metadata():
+        from .importlib import Environment
+    else:
+        from .pkg_resources import Environment  # type: ignore[no-redef]
 
     return Environment.from_paths(paths)
 
@@ -43,6 +75,9 @@ def get_wheel_distribution(wheel_path: str, canonical_name: str) -> BaseDistribu
 
     :param canonical_name: Normalized project name of the given wheel.
     """
-    from .pkg_resources import Distribution
+    if _should_use_importlib_metadata():
+        from .importlib import Distribution
+    else:
+        from .pkg_resources import Distribution  # type: ignore[no-redef]
 
     return Distribution.from_wheel(wheel_path, canonical_name)
@@ -0,0 +1,355 @@
+"""A metadata backend built on ``importlib.metadata``.
+
+Unlike the pkg_resources backend, nothing is read up front: distributions
+are found by listing the directories on the path, and their metadata files
+are only opened when a field is asked for. Name and version only need the
+header section of the metadata file, which is read up to its first blank
+line, leaving out the (possibly long) description that follows it.
+"""
+
+import email.message
+import email.parser
+import importlib.metadata
+import itertools
+import logging
+import os
+import pathlib
+import re
+import sys
+import zipfile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.version import parse as parse_version
+
+from pip._internal.locations import site_packages, user_site
+from pip._internal.utils.misc import egg_link_path_for_name, is_local, normalize_path
+from pip._internal.utils.wheel import parse_wheel, read_wheel_metadata_file
+
+from .base import BaseDistribution, BaseEntryPoint, BaseEnvironment, DistributionVersion
+
+if TYPE_CHECKING:
+    from pip._vendor.packaging.utils import NormalizedName
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_name(name: str) -> str:
+    """The name pkg_resources gives a project, as in ``.egg-link`` files."""
+    return re.sub("[^A-Za-z0-9.]+", "-", name)
+
+
+class _EggInfoFileDistribution(importlib.metadata.Distribution):
+    """A distribution whose metadata is a single ``.egg-info`` file.
+
+    ``importlib.metadata`` only knows about metadata directories.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def read_text(self, filename: str) -> Optional[str]:
+        if filename != "PKG-INFO":
+            return None
+        with open(self._path, encoding="utf-8") as f:
+            return f.read()
+
+    def locate_file(self, path: str) -> pathlib.Path:
+        return pathlib.Path(self._path).parent / path
+
+
+class _WheelDistribution(importlib.metadata.Distribution):
+    """A distribution whose metadata files are read from a wheel."""
+
+    def __init__(self, files: Dict[str, bytes], location: str) -> None:
+        self._files = files
+        self._location = location
+
+    def read_text(self, filename: str) -> Optional[str]:
+        try:
+            return self._files[filename].decode()
+        except KeyError:
+            return None
+
+    def locate_file(self, path: str) -> pathlib.Path:
+        return pathlib.Path(self._location) / path
+
+
+class Distribution(BaseDistribution):
+    def __init__(
+        self,
+        dist: importlib.metadata.Distribution,
+        info_location: Optional[str],
+        location: Optional[str],
+    ) -> None:
+        self._dist = dist
+        self._info_location = info_location
+        self._location = location
+        self._headers: Optional[email.message.Message] = None
+
+    @classmethod
+    def from_info_location(cls, info_location: str, location: str) -> "Distribution":
+        if os.path.isdir(info_location):
+            dist: importlib.metadata.Distribution = importlib.metadata.PathDistribution(
+                pathlib.Path(info_location)
+            )
+        else:
+            dist = _EggInfoFileDistribution(info_location)
+        return cls(dist, info_location, location)
+
+    @classmethod
+    def from_wheel(cls, path: str, name: str) -> "Distribution":
+        with zipfile.ZipFile(path, allowZip64=True) as zf:
+            info_dir, _ = parse_wheel(zf, name)
+            files = {
+                p.split("/", 1)[1]: read_wheel_metadata_file(zf, p)
+                for p in zf.namelist()
+                if p.startswith(f"{info_dir}/")
+            }
+        return cls(_WheelDistribution(files, path), None, path)
+
+    @property
+    def location(self) -> Optional[str]:
+        return self._location
+
+    @property
+    def info_directory(self) -> Optional[str]:
+        return self._info_location
+
+    @property
+    def _metadata_path(self) -> Optional[str]:
+        """The file holding the core metadata, if it is on disk."""
+        if self._info_location is None:
+            return None
+        if not os.path.isdir(self._info_location):
+            return self._info_location
+        if self._info_location.lower().endswith(".dist-info"):
+            return os.path.join(self._info_location, "METADATA")
+        return os.path.join(self._info_location, "PKG-INFO")
+
+    @property
+    def _header_fields(self) -> email.message.Message:
+        """The header section of the metadata, which has all fields but the
+        description.
+        """
+        if self._headers is not None:
+            return self._headers
+        path = self._metadata_path
+        if path is None:
+            self._headers = self.metadata
+            return self._headers
+        lines = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        break
+                    lines.append(line)
+        except FileNotFoundError:
+            logger.warning("No metadata found in %s", self._location)
+        self._headers = email.parser.HeaderParser().parsestr("".join(lines))
+        return self._headers
+
+    @property
+    def raw_name(self) -> str:
+        name = self._header_fields.get("Name")
+        if name is not None:
+            return str(name)
+        # The metadata should never be missing the Name: key. If it does,
+        # fall back to the name in the metadata directory's name.
+        return self._name_from_location or ""
+
+    @property
+    def _location_parts(self) -> List[str]:
+        """The name and version in the metadata directory's name, if any."""
+        if self._info_location is None:
+            return []
+        stem, _ = os.path.splitext(os.path.basename(self._info_location))
+        return stem.split("-")
+
+    @property
+    def _name_from_location(self) -> Optional[str]:
+        parts = self._location_parts
+        return parts[0] if parts else None
+
+    @property
+    def _project_name(self) -> str:
+        """The name pkg_resources would give this distribution."""
+        return _safe_name(self._name_from_location or self.raw_name)
+
+    @property
+    def canonical_name(self) -> "NormalizedName":
+        return canonicalize_name(self.raw_name)
+
+    @property
+    def version(self) -> DistributionVersion:
+        version = self._header_fields.get("Version")
+        if version is None:
+            # As pkg_resources does, fall back to the version in the metadata
+            # directory's name.
+            parts = self._location_parts
+            version = parts[1] if len(parts) > 1 else ""
+        return parse_version(str(version))
+
+    @property
+    def installer(self) -> str:
+        try:
+            text = self.read_text("INSTALLER")
+        except FileNotFoundError:
+            return ""
+        for line in text.splitlines():
+            if line.strip():
+                return line.strip()
+        return ""
+
+    @property
+    def editable(self) -> bool:
+        egg_link_name = self._project_name + ".egg-link"
+        return any(
+            os.path.isfile(os.path.join(path_item, egg_link_name))
+            for path_item in sys.path
+        )
+
+    @property
+    def _site_location(self) -> str:
+        """Where the distribution is installed: where its ``.egg-link`` is,
+        for develop installs, or its location otherwise.
+        """
+        egg_link = egg_link_path_for_name(self._project_name)
+        if egg_link:
+            return normalize_path(egg_link)
+        return normalize_path(self._location or "")
+
+    @property
+    def local(self) -> bool:
+        return is_local(self._site_location)
+
+    @property
+    def in_usersite(self) -> bool:
+        return self._site_location.startswith(normalize_path(user_site))
+
+    @property
+    def in_site_packages(self) -> bool:
+        return self._site_location.startswith(normalize_path(site_packages))
+
+    def read_text(self, name: str) -> str:
+        text = self._dist.read_text(name)
+        if text is None:
+            raise FileNotFoundError(name)
+        return text
+
+    def iter_entry_points(self) -> Iterable[BaseEntryPoint]:
+        return self._dist.entry_points
+
+    @property
+    def metadata(self) -> email.message.Message:
+        return self._dist.metadata
+
+    def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
+        # Like pkg_resources, markers are evaluated against the extras asked
+        # for, and the requirements of unknown extras are none.
+        contexts = [{"extra": extra} for extra in ("", *extras)]
+        for req_string in self._dist.requires or ():
+            req = Requirement(req_string)
+            if not req.marker:
+                yield req
+            elif any(req.marker.evaluate(context) for context in contexts):
+                yield req
+
+
+def _read_egg_link(path: str) -> Optional[str]:
+    """Return the project directory an ``.egg-link`` file points to."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    return os.path.join(os.path.dirname(path), line.rstrip())
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def _by_version(entry: str) -> List[Any]:
+    """Sort key of a directory entry, in the order pkg_resources uses.
+
+    Sorting the entries of a directory with it, in reverse, puts the newest
+    of several versions of a project first.
+    """
+    name, ext = os.path.splitext(entry)
+    parts = itertools.chain(name.split("-"), [ext])
+    return [parse_version(part) for part in parts]
+
+
+def _iter_info_locations(path_item: str) -> Iterator[Tuple[str, str]]:
+    """Find the metadata of the distributions on a path item, the way
+    ``pkg_resources.find_distributions(path_item, only=True)`` does.
+
+    Yields (info location, location) pairs. Zipped eggs and wheels on the
+    path are not looked into.
+    """
+    if path_item.lower().endswith(".egg"):
+        info_location = os.path.join(path_item, "EGG-INFO")
+        if os.path.isdir(info_location):
+            yield info_location, path_item
+        return
+    try:
+        entries = os.listdir(path_item)
+    except OSError:
+        return
+    for entry in sorted(entries, key=_by_version, reverse=True):
+        lower = entry.lower()
+        path = os.path.join(path_item, entry)
+        if lower.endswith((".dist-info", ".egg-info")):
+            yield path, path_item
+        elif lower.endswith(".egg") and os.path.isdir(path):
+            yield from _iter_info_locations(path)
+        elif lower.endswith(".egg-link"):
+            project_dir = _read_egg_link(path)
+            if project_dir is not None:
+                yield from _iter_info_locations(project_dir)
+
+
+class Environment(BaseEnvironment):
+    def __init__(self, paths: List[str]) -> None:
+        self._paths = paths
+
+    @classmethod
+    def default(cls) -> BaseEnvironment:
+        return cls(sys.path)
+
+    @classmethod
+    def from_paths(cls, paths: Optional[List[str]]) -> BaseEnvironment:
+        if paths is None:
+            return cls(sys.path)
+        return cls(paths)
+
+    def get_distribution(self, name: str) -> Optional[BaseDistribution]:
+        canonical_name = canonicalize_name(name)
+        for dist in self.iter_distributions():
+            if dist.canonical_name == canonical_name:
+                return dist
+        return None
+
+    def _iter_distributions(self) -> Iterator[BaseDistribution]:
+        # Like a pkg_resources working set, only the first distribution found
+        # of a project is part of the environment.
+        seen: Set[str] = set()
+        for path_item in self._paths:
+            for info_location, location in _iter_info_locations(path_item):
+                dist = Distribution.from_info_location(info_location, location)
+                if dist.canonical_name in seen:
+                    continue
+                seen.add(dist.canonical_name)
+                yield dist
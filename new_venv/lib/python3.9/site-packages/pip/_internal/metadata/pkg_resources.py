@@ -4,6 +4,7 @@ import zipfile
 from typing import (
     TYPE_CHECKING,
     Collection,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -104,6 +105,7 @@ class Distribution(BaseDistribution):
 class Environment(BaseEnvironment):
     def __init__(self, ws: pkg_resources.WorkingSet) -> None:
         self._ws = ws
+        self._dists_by_name: Optional[Dict[str, BaseDistribution]] = None
 
     @classmethod
     def default(cls) -> BaseEnvironment:
@@ -119,11 +121,11 @@ class Environment(BaseEnvironment):
         This searches from *all* distributions available in the environment, to
         match the behavior of ``pkg_resources.get_distribution()``.
         """
-        canonical_name = canonicalize_name(name)
-        for dist in self.iter_distributions():
-            if dist.canonical_name == canonical_name:
-                return dist
-        return None
+        if self._dists_by_name is None:
+            self._dists_by_name = {}
+            for dist in self.iter_distributions():
+                self._dists_by_name.setdefault(dist.canonical_name, dist)
+        return self._dists_by_name.get(canonicalize_name(name))
 
     def get_distribution(self, name: str) -> Optional[BaseDistribution]:
 
@@ -146,6 +148,7 @@ class Environment(BaseEnvironment):
             self._ws.require(name)
         except pkg_resources.DistributionNotFound:
             return None
+        self._dists_by_name = None
         return self._search_distribution(name)
 
     def _iter_distributions(self) -> Iterator[BaseDistribution]:
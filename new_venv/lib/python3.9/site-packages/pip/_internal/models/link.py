@@ -35,6 +35,7 @@ class Link(KeyBasedCompareMixin):
         "comes_from",
         "requires_python",
         "yanked_reason",
+        "dist_info_metadata",
         "cache_link_parsing",
     ]
 
@@ -45,6 +46,7 @@ class Link(KeyBasedCompareMixin):
         requires_python: Optional[str] = None,
         yanked_reason: Optional[str] = None,
         cache_link_parsing: bool = True,
+        dist_info_metadata: Optional[str] = None,
     ) -> None:
         """
         :param url: url of the resource pointed to (href of the link)
@@ -65,6 +67,11 @@ class Link(KeyBasedCompareMixin):
                                    should be cached. PyPI index urls should
                                    generally have this set to False, for
                                    example.
+        :param dist_info_metadata: the value of the "data-dist-info-metadata"
+            attribute, if present, in a simple repository HTML link. This is
+            "true" or the hash of the file, as "<hashname>=<hashvalue>", if
+            the index serves the core metadata of the distribution next to
+            it. See PEP 658 for more information and the specification.
         """
 
         # url can be a UNC windows share
@@ -79,6 +86,7 @@ class Link(KeyBasedCompareMixin):
         self.comes_from = comes_from
         self.requires_python = requires_python if requires_python else None
         self.yanked_reason = yanked_reason
+        self.dist_info_metadata = dist_info_metadata or None
 
         super().__init__(key=url, defining_class=Link)
 
@@ -183,6 +191,20 @@ class Link(KeyBasedCompareMixin):
             return match.group(1)
         return None
 
+    def metadata_link(self) -> Optional["Link"]:
+        """Return a link to the core metadata file of the distribution, if
+        the index serves it (PEP 658).
+
+        The hash of the metadata file, if given, is kept in the fragment.
+        """
+        if self.dist_info_metadata is None:
+            return None
+        url = f"{self.url_without_fragment}.metadata"
+        hash_name, sep, hash_value = self.dist_info_metadata.partition("=")
+        if sep and hash_name in _SUPPORTED_HASHES:
+            url = f"{url}#{hash_name}={hash_value.lower()}"
+        return Link(url, comes_from=self.comes_from, cache_link_parsing=False)
+
     @property
     def show_url(self) -> str:
         return posixpath.basename(self._url.split('#', 1)[0].split('?', 1)[0])
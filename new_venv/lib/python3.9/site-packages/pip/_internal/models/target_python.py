@@ -1,5 +1,5 @@
 import sys
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pip._vendor.packaging.tags import Tag
 
@@ -22,6 +22,7 @@ class TargetPython:
         "py_version",
         "py_version_info",
         "_valid_tags",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -63,6 +64,8 @@ class TargetPython:
 
         # This is used to cache the return value of get_tags().
         self._valid_tags: Optional[List[Tag]] = None
+        # This is used to cache the return value of get_tag_priorities().
+        self._tag_priorities: Optional[Dict[Tag, int]] = None
 
     def format_given(self) -> str:
         """
@@ -109,3 +112,18 @@ class TargetPython:
             self._valid_tags = tags
 
         return self._valid_tags
+
+    def get_tag_priorities(self) -> Dict[Tag, int]:
+        """
+        Return a mapping from each supported tag to its priority.
+
+        The priority is the index of the tag in get_tags(), so lower is more
+        preferred. Checking a wheel against the mapping only costs a lookup
+        per tag of the wheel, instead of a scan of all the supported tags.
+        """
+        if self._tag_priorities is None:
+            self._tag_priorities = {
+                tag: idx for idx, tag in enumerate(self.get_tags())
+            }
+
+        return self._tag_priorities
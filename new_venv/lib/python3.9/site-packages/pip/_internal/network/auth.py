@@ -4,6 +4,7 @@ Contains interface (MultiDomainBasicAuth) and associated glue code for
 providing credentials in the context of network requests.
 """
 
+import threading
 import urllib.parse
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -77,6 +78,9 @@ class MultiDomainBasicAuth(AuthBase):
         self.prompting = prompting
         self.index_urls = index_urls
         self.passwords: Dict[str, AuthInfo] = {}
+        # Requests may be sent concurrently, e.g. when prefetching index
+        # pages, so only one of them asks for credentials at a time.
+        self._prompt_lock = threading.Lock()
         # When the user is prompted to enter credentials and keyring is
         # available, we will offer to save them. If the user accepts,
         # this value is set to the credentials they entered. After the
@@ -238,16 +242,9 @@ class MultiDomainBasicAuth(AuthBase):
             return False
         return ask("Save credentials to keyring [y/N]: ", ["y", "n"]) == "y"
 
-    def handle_401(self, resp: Response, **kwargs: Any) -> Response:
-        # We only care about 401 responses, anything else we want to just
-        #   pass through the actual response
-        if resp.status_code != 401:
-            return resp
-
-        # We are not able to prompt the user so simply return the response
-        if not self.prompting:
-            return resp
-
+    def _get_credentials_for_401(
+        self, resp: Response
+    ) -> Tuple[Optional[str], Optional[str]]:
         parsed = urllib.parse.urlparse(resp.url)
 
         # Query the keyring for credentials:
@@ -271,6 +268,31 @@ class MultiDomainBasicAuth(AuthBase):
             if save and self._should_save_password_to_keyring():
                 self._credentials_to_save = (parsed.netloc, username, password)
 
+        return username, password
+
+    def handle_401(self, resp: Response, **kwargs: Any) -> Response:
+        # We only care about 401 responses, anything else we want to just
+        #   pass through the actual response
+        if resp.status_code != 401:
+            return resp
+
+        # We are not able to prompt the user so simply return the response
+        if not self.prompting:
+            return resp
+
+        parsed = urllib.parse.urlparse(resp.url)
+
+        with self._prompt_lock:
+            if (
+                "Authorization" not in resp.request.headers and
+                parsed.netloc in self.passwords
+            ):
+                # Another request got credentials for this netloc after
+                # this one was sent without any.
+                username, password = self.passwords[parsed.netloc]
+            else:
+                username, password = self._get_credentials_for_401(resp)
+
         # Consume content and release the original connection to allow our new
         #   request to reuse the same one.
         resp.content
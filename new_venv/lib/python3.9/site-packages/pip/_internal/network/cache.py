@@ -1,16 +1,21 @@
 """HTTP cache implementation.
 """
 
+import logging
 import os
+import threading
+import time
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Set, Tuple
 
 from pip._vendor.cachecontrol.cache import BaseCache
 from pip._vendor.cachecontrol.caches import FileCache
 from pip._vendor.requests.models import Response
 
 from pip._internal.utils.filesystem import adjacent_tmp_file, replace
-from pip._internal.utils.misc import ensure_dir
+from pip._internal.utils.misc import ensure_dir, format_size
+
+logger = logging.getLogger(__name__)
 
 
 def is_from_cache(response: Response) -> bool:
@@ -32,12 +37,35 @@ class SafeFileCache(BaseCache):
     """
     A file based cache which is safe to use even when the target directory may
     not be accessible or writable.
+
+    When a maximum size is given, the cache may be swept when it is closed,
+    once pip is done with it. That is once a day, once a tenth of the
+    maximum size was written to it, or once what was written to it since it
+    was last swept makes it larger than the maximum size. Sweeping removes
+    the entries that were not used for MAX_AGE, then the least recently used
+    ones until the cache is no larger than the maximum size. Using an entry
+    updates the modification time of its file, which sweeps go by.
     """
 
-    def __init__(self, directory: str) -> None:
+    MAX_AGE = 30 * 24 * 60 * 60
+
+    SWEEP_INTERVAL = 24 * 60 * 60
+
+    # Touched when the cache is swept, and holds its size after the sweep.
+    SWEEP_STAMP = "pip-cache-sweep"
+
+    def __init__(self, directory: str, max_size: Optional[int] = None) -> None:
+        """
+        :param max_size: The size in bytes past which the least recently
+            used entries are removed. If None, the cache is not limited.
+        """
         assert directory is not None, "Cache directory must not be None."
         super().__init__()
         self.directory = directory
+        self.max_size = max_size
+        # What this process wrote since it last swept the cache.
+        self._written = 0
+        self._written_lock = threading.Lock()
 
     def _get_cache_path(self, name: str) -> str:
         # From cachecontrol.caches.file_cache.FileCache._fn, brought into our
@@ -49,9 +77,14 @@ class SafeFileCache(BaseCache):
 
     def get(self, key: str) -> Optional[bytes]:
         path = self._get_cache_path(key)
+        value = None
         with suppressed_cache_errors():
             with open(path, "rb") as f:
-                return f.read()
+                value = f.read()
+        if value is not None and self.max_size:
+            with suppressed_cache_errors():
+                os.utime(path)
+        return value
 
     def set(self, key: str, value: bytes) -> None:
         path = self._get_cache_path(key)
@@ -63,7 +96,98 @@ class SafeFileCache(BaseCache):
 
             replace(f.name, path)
 
+        if self.max_size:
+            # Sessions are shared between threads.
+            with self._written_lock:
+                self._written += len(value)
+
     def delete(self, key: str) -> None:
         path = self._get_cache_path(key)
         with suppressed_cache_errors():
             os.remove(path)
+
+    def close(self) -> None:
+        # Both adapters of a session close the cache it shares between them,
+        # and the second finds the stamp the first one left.
+        if not self.max_size:
+            return
+        with suppressed_cache_errors():
+            if self._should_sweep():
+                self._written = 0
+                self._remove_entries()
+
+    def _should_sweep(self) -> bool:
+        assert self.max_size
+        if self._written > self.max_size // 10:
+            return True
+        stamp = os.path.join(self.directory, self.SWEEP_STAMP)
+        try:
+            with open(stamp, encoding="ascii") as f:
+                size = int(f.read() or 0)
+                swept = os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return True
+        except (OSError, ValueError):
+            return False
+        if size + self._written > self.max_size:
+            return True
+        return time.time() - swept > self.SWEEP_INTERVAL
+
+    def _remove_entries(self) -> None:
+        assert self.max_size
+        # Touched first, so that other pip processes do not sweep the cache
+        # at the same time.
+        stamp = os.path.join(self.directory, self.SWEEP_STAMP)
+        with open(stamp, "a"):
+            pass
+        os.utime(stamp)
+
+        entries: List[Tuple[float, int, str]] = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                if path == stamp:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        removed_dirs: Set[str] = set()
+        # Least recently used first. Other pip processes may be using the
+        # entries: their readers keep open files, and files replaced by their
+        # writers meanwhile are only removed sooner than they would have been.
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size and now - mtime <= self.MAX_AGE:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            removed_dirs.add(os.path.dirname(path))
+
+        with open(stamp, "w", encoding="ascii") as f:
+            f.write(str(total))
+
+        for path in removed_dirs:
+            # Directories left empty, up to the cache directory.
+            while path.startswith(self.directory + os.sep):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    break
+                path = os.path.dirname(path)
+
+        if removed:
+            logger.debug(
+                "Removed %d entries from the cache %s, now %s",
+                removed,
+                self.directory,
+                format_size(total),
+            )
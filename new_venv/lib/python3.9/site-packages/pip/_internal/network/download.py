@@ -4,8 +4,9 @@ import cgi
 import logging
 import mimetypes
 import os
-from typing import Iterable, Optional, Tuple
+from typing import BinaryIO, Iterable, Iterator, Mapping, Optional, Tuple
 
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
 from pip._internal.cli.progress_bars import DownloadProgressProvider
@@ -15,7 +16,9 @@ from pip._internal.models.link import Link
 from pip._internal.network.cache import is_from_cache
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
+from pip._internal.utils.parallel import map_multithread_ordered
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +52,11 @@ def _prepare_download(
     else:
         logger.info("Downloading %s", logged_url)
 
-    if logger.getEffectiveLevel() > logging.INFO:
+    if progress_bar == "off":
+        # The silent bar would only install a SIGINT handler, which is
+        # not possible outside of the main thread.
+        show_progress = False
+    elif logger.getEffectiveLevel() > logging.INFO:
         show_progress = False
     elif is_from_cache(resp):
         show_progress = False
@@ -68,6 +75,13 @@ def _prepare_download(
     return DownloadProgressProvider(progress_bar, max=total_length)(chunks)
 
 
+def _write_chunks(chunks: Iterable[bytes], file: BinaryIO) -> Iterator[bytes]:
+    """Write chunks to file, passing each one on once it is written."""
+    for chunk in chunks:
+        file.write(chunk)
+        yield chunk
+
+
 def sanitize_content_filename(filename: str) -> str:
     """
     Sanitize the "filename" value from a Content-Disposition header.
@@ -126,8 +140,15 @@ class Downloader:
         self._session = session
         self._progress_bar = progress_bar
 
-    def __call__(self, link: Link, location: str) -> Tuple[str, str]:
-        """Download the file given by link into location."""
+    def __call__(
+        self, link: Link, location: str, hashes: Optional[Hashes] = None
+    ) -> Tuple[str, str]:
+        """Download the file given by link into location.
+
+        :param hashes: If given, the file is checked against them as it is
+            written, instead of being read back afterwards, and HashMismatch
+            is raised once it is complete if none match.
+        """
         try:
             resp = _http_get_download(self._session, link)
         except NetworkConnectionError as e:
@@ -142,8 +163,12 @@ class Downloader:
 
         chunks = _prepare_download(resp, link, self._progress_bar)
         with open(filepath, "wb") as content_file:
-            for chunk in chunks:
-                content_file.write(chunk)
+            if hashes:
+                # The chunks are hashed as they are, without being copied.
+                hashes.check_against_chunks(_write_chunks(chunks, content_file))
+            else:
+                for chunk in chunks:
+                    content_file.write(chunk)
         content_type = resp.headers.get("Content-Type", "")
         return filepath, content_type
 
@@ -153,32 +178,45 @@ class BatchDownloader:
         self,
         session: PipSession,
         progress_bar: str,
+        concurrency: int = 1,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
+        # Each download holds a connection from the session's per-host
+        # pools until it is done, so there is no point in going wider.
+        if concurrency > DEFAULT_POOLSIZE:
+            logger.debug(
+                "Limiting download concurrency to the connection pool size %d",
+                DEFAULT_POOLSIZE,
+            )
+        self._concurrency = max(1, min(concurrency, DEFAULT_POOLSIZE))
 
     def __call__(
-        self, links: Iterable[Link], location: str
+        self,
+        links: Iterable[Link],
+        location: str,
+        hashes: Optional[Mapping[Link, Hashes]] = None,
     ) -> Iterable[Tuple[Link, Tuple[str, str]]]:
-        """Download the files given by links into location."""
-        for link in links:
-            try:
-                resp = _http_get_download(self._session, link)
-            except NetworkConnectionError as e:
-                assert e.response is not None
-                logger.critical(
-                    "HTTP error %s while getting %s",
-                    e.response.status_code,
-                    link,
-                )
-                raise
-
-            filename = _get_http_response_filename(resp, link)
-            filepath = os.path.join(location, filename)
-
-            chunks = _prepare_download(resp, link, self._progress_bar)
-            with open(filepath, "wb") as content_file:
-                for chunk in chunks:
-                    content_file.write(chunk)
-            content_type = resp.headers.get("Content-Type", "")
-            yield link, (filepath, content_type)
+        """Download the files given by links into location.
+
+        Up to the configured concurrency, files are fetched in parallel.
+        Results are yielded in the order of links regardless.
+
+        :param hashes: The hashes to check the file of each link against as
+            it is written, if any.
+        """
+        link_hashes = hashes or {}
+        if self._concurrency == 1:
+            progress_bar = self._progress_bar
+        else:
+            # Several progress bars would overwrite each other on the
+            # terminal, so only the per-file log lines are kept.
+            progress_bar = "off"
+        download = Downloader(self._session, progress_bar)
+
+        def _download_one(link: Link) -> Tuple[Link, Tuple[str, str]]:
+            return link, download(link, location, link_hashes.get(link))
+
+        yield from map_multithread_ordered(
+            _download_one, links, self._concurrency
+        )
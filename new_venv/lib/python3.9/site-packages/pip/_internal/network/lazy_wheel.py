@@ -2,39 +2,71 @@
 
 __all__ = ["HTTPRangeRequestUnsupported", "dist_from_wheel_url"]
 
+import re
+import struct
 from bisect import bisect_left, bisect_right
 from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 from zipfile import BadZipfile, ZipFile
 
-from pip._vendor.pkg_resources import Distribution
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
+from pip._internal.exceptions import UnsupportedWheel
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
-from pip._internal.utils.wheel import pkg_resources_distribution_for_wheel
+from pip._internal.utils.wheel import (
+    WheelMetadata,
+    read_wheel_metadata_file,
+    wheel_dist_info_dir,
+)
+
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
+# How much of the end of a wheel to fetch at first. This holds the whole
+# central directory of all but the largest wheels.
+TAIL_SIZE = 64 * 1024
+
+# The end of central directory record of a ZIP file (without ZIP64).
+_EOCD_SIGNATURE = b"PK\x05\x06"
+_EOCD_STRUCT = struct.Struct("<4s4H2LH")
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
 
 
 class HTTPRangeRequestUnsupported(Exception):
     pass
 
 
-def dist_from_wheel_url(name: str, url: str, session: PipSession) -> Distribution:
+def dist_from_wheel_url(name: str, url: str, session: PipSession) -> "Distribution":
     """Return a pkg_resources.Distribution from the given wheel URL.
 
-    This uses HTTP range requests to only fetch the potion of the wheel
-    containing metadata, just enough for the object to be constructed.
-    If such requests are not supported, HTTPRangeRequestUnsupported
-    is raised.
+    This uses HTTP range requests to only fetch the central directory and
+    the METADATA file of the wheel, just enough for the object to be
+    constructed. Its dependencies can be inspected, but not its other
+    metadata files. If such requests are not supported,
+    HTTPRangeRequestUnsupported is raised.
     """
+    from pip._vendor.pkg_resources import DistInfoDistribution
+
     with LazyZipOverHTTP(url, session) as wheel:
         # For read-only ZIP files, ZipFile only needs methods read,
         # seek, seekable and tell, not the whole IO protocol.
         zip_file = ZipFile(wheel)  # type: ignore
+        try:
+            info_dir = wheel_dist_info_dir(zip_file, name)
+            path = f"{info_dir}/METADATA"
+            wheel.prefetch(zip_file, path)
+            metadata_text = {"METADATA": read_wheel_metadata_file(zip_file, path)}
+        except UnsupportedWheel as e:
+            raise UnsupportedWheel("{} has an invalid wheel, {}".format(name, str(e)))
         # After context manager exit, wheel.name
         # is an invalid file by intention.
-        return pkg_resources_distribution_for_wheel(zip_file, name, wheel.name)
+        metadata = WheelMetadata(metadata_text, wheel.name)
+        return DistInfoDistribution(
+            location=wheel.name, metadata=metadata, project_name=name
+        )
 
 
 class LazyZipOverHTTP:
@@ -44,23 +76,28 @@ class LazyZipOverHTTP:
     which is supposed to be fed to ZipFile.  If such requests are not
     supported by the server, raise HTTPRangeRequestUnsupported
     during initialization.
+
+    Initialization fetches the last tail_size bytes, and the rest of the
+    central directory if they did not hold all of it.
     """
 
     def __init__(
-        self, url: str, session: PipSession, chunk_size: int = CONTENT_CHUNK_SIZE
+        self,
+        url: str,
+        session: PipSession,
+        chunk_size: int = CONTENT_CHUNK_SIZE,
+        tail_size: int = TAIL_SIZE,
     ) -> None:
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers["Content-Length"])
         self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left: List[int] = []
         self._right: List[int] = []
-        if "bytes" not in head.headers.get("Accept-Ranges", "none"):
-            raise HTTPRangeRequestUnsupported("range request is not supported")
-        self._check_zip()
+        try:
+            self._fetch_tail(tail_size)
+            self._check_zip()
+        except BaseException:
+            self._file.close()
+            raise
 
     @property
     def mode(self) -> str:
@@ -92,11 +129,13 @@ class LazyZipOverHTTP:
         all bytes until EOF are returned.  Fewer than
         size bytes may be returned if EOF is reached.
         """
-        download_size = max(size, self._chunk_size)
         start, length = self.tell(), self._length
-        stop = length if size < 0 else min(start + download_size, length)
-        start = max(0, stop - download_size)
-        self._download(start, stop - 1)
+        stop = length if size < 0 else min(start + size, length)
+        if not self._is_downloaded(start, stop - 1):
+            download_size = max(size, self._chunk_size)
+            stop = length if size < 0 else min(start + download_size, length)
+            start = max(0, stop - download_size)
+            self._download(start, stop - 1)
         return self._file.read(size)
 
     def readable(self) -> bool:
@@ -150,8 +189,84 @@ class LazyZipOverHTTP:
         finally:
             self.seek(pos)
 
+    def prefetch(self, zip_file: ZipFile, name: str) -> None:
+        """Download the given member of zip_file, which reads from this
+        object, with a single request.
+
+        Raise UnsupportedWheel if there is no such member.
+        """
+        try:
+            info = zip_file.getinfo(name)
+        except KeyError as e:
+            raise UnsupportedWheel(f"could not read {name!r} file: {e!r}")
+        # The member ends where the next one, or the central directory,
+        # starts. The data descriptor and extra fields make its size in
+        # the central directory unreliable.
+        end = min(
+            (i.header_offset for i in zip_file.infolist()
+             if i.header_offset > info.header_offset),
+            default=self._length,
+        )
+        self._download(info.header_offset, end - 1)
+
+    def _fetch_tail(self, tail_size: int) -> None:
+        """Download the last tail_size bytes, which also tells the length
+        of the file.
+        """
+        headers = HEADERS.copy()
+        headers["Range"] = f"bytes=-{tail_size}"
+        headers["Cache-Control"] = "no-cache"
+        response = self._session.get(self._url, headers=headers, stream=True)
+        with response:
+            if response.status_code == 416:
+                raise HTTPRangeRequestUnsupported("range request is not satisfiable")
+            raise_for_status(response)
+            match = _CONTENT_RANGE_RE.fullmatch(
+                response.headers.get("Content-Range", "")
+            )
+            if response.status_code != 206 or match is None:
+                raise HTTPRangeRequestUnsupported("range request is not supported")
+            start, end, self._length = (int(g) for g in match.groups())
+            self.truncate(self._length)
+            self.seek(start)
+            for chunk in response_chunks(response, self._chunk_size):
+                self._file.write(chunk)
+        self._left.append(start)
+        self._right.append(end)
+
+    def _get_central_directory_start(self) -> Optional[int]:
+        """Locate the central directory in the downloaded tail.
+
+        Return None if the end of central directory record is not in the
+        tail, or if it is a ZIP64 file.
+        """
+        tail_start = self._left[-1]
+        with self._stay():
+            self.seek(tail_start)
+            tail = self._file.read()
+        position = tail.rfind(_EOCD_SIGNATURE)
+        if position < 0 or len(tail) - position < _EOCD_STRUCT.size:
+            return None
+        record = _EOCD_STRUCT.unpack_from(tail, position)
+        size, offset = record[5], record[6]
+        if offset == 0xFFFFFFFF or size == 0xFFFFFFFF:
+            return None
+        return max(0, tail_start + position - size)
+
     def _check_zip(self) -> None:
         """Check and download until the file is a valid ZIP."""
+        start = self._get_central_directory_start()
+        if start is not None:
+            self._download(start, self._length - 1)
+            with self._stay():
+                try:
+                    ZipFile(self)  # type: ignore
+                except BadZipfile:
+                    pass
+                else:
+                    return
+
+        # Probe backwards from the end, for unusual files.
         end = self._length - 1
         for start in reversed(range(0, end, self._chunk_size)):
             self._download(start, end)
@@ -197,6 +312,14 @@ class LazyZipOverHTTP:
             yield i, end
         self._left[left:right], self._right[left:right] = [start], [end]
 
+    def _is_downloaded(self, start: int, end: int) -> bool:
+        """Return whether bytes from start to end are all downloaded."""
+        if end < start:
+            return True
+        # Downloaded intervals are merged, so one holds them all if any.
+        index = bisect_right(self._left, start) - 1
+        return index >= 0 and self._right[index] >= end
+
     def _download(self, start: int, end: int) -> None:
         """Download bytes from start to end inclusively."""
         with self._stay():
@@ -29,8 +29,11 @@ from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 from pip._vendor import requests, urllib3
 from pip._vendor.cachecontrol import CacheControlAdapter
 from pip._vendor.requests.adapters import BaseAdapter, HTTPAdapter
+from pip._vendor.requests.auth import _basic_auth_str
 from pip._vendor.requests.models import PreparedRequest, Response
+from pip._vendor.requests.sessions import merge_setting
 from pip._vendor.requests.structures import CaseInsensitiveDict
+from pip._vendor.requests.utils import get_auth_from_url, get_environ_proxies
 from pip._vendor.urllib3.connectionpool import ConnectionPool
 from pip._vendor.urllib3.exceptions import InsecureRequestWarning
 
@@ -199,6 +202,27 @@ def user_agent() -> str:
     )
 
 
+# The JSON form of a simple repository page (PEP 691).
+SIMPLE_API_JSON = "application/vnd.pypi.simple.v1+json"
+
+
+def _get_local_json_page(request: PreparedRequest, pathname: str) -> Optional[str]:
+    """Return the path of the JSON form of a local index page, if the request
+    accepts it and there is one.
+
+    A local index can provide it as index.json next to (or instead of) the
+    index.html that is requested for a directory.
+    """
+    if SIMPLE_API_JSON not in request.headers.get("Accept", ""):
+        return None
+    if os.path.basename(pathname) != "index.html":
+        return None
+    json_pathname = os.path.join(os.path.dirname(pathname), "index.json")
+    if not os.path.isfile(json_pathname):
+        return None
+    return json_pathname
+
+
 class LocalFSAdapter(BaseAdapter):
     def send(
         self,
@@ -210,6 +234,9 @@ class LocalFSAdapter(BaseAdapter):
         proxies: Optional[Mapping[str, str]] = None,
     ) -> Response:
         pathname = url_to_path(request.url)
+        json_pathname = _get_local_json_page(request, pathname)
+        if json_pathname is not None:
+            pathname = json_pathname
 
         resp = Response()
         resp.status_code = 200
@@ -222,7 +249,10 @@ class LocalFSAdapter(BaseAdapter):
             resp.raw = exc
         else:
             modified = email.utils.formatdate(stats.st_mtime, usegmt=True)
-            content_type = mimetypes.guess_type(pathname)[0] or "text/plain"
+            if json_pathname is not None:
+                content_type = SIMPLE_API_JSON
+            else:
+                content_type = mimetypes.guess_type(pathname)[0] or "text/plain"
             resp.headers = CaseInsensitiveDict(
                 {
                     "Content-Type": content_type,
@@ -271,11 +301,15 @@ class PipSession(requests.Session):
         *args: Any,
         retries: int = 0,
         cache: Optional[str] = None,
+        cache_max_size: Optional[int] = None,
         trusted_hosts: Sequence[str] = (),
         index_urls: Optional[List[str]] = None,
         **kwargs: Any,
     ) -> None:
         """
+        :param cache_max_size: The size in bytes past which the least
+            recently used responses are removed from the cache. If None,
+            the cache is not limited.
         :param trusted_hosts: Domains not to emit warnings for when not using
             HTTPS.
         """
@@ -291,6 +325,9 @@ class PipSession(requests.Session):
         # Attach our Authentication handler to the session
         self.auth = MultiDomainBasicAuth(index_urls=index_urls)
 
+        # The proxies to use for each origin, as found in the environment.
+        self._environ_proxies: Dict[Tuple[str, str, Optional[str]], Dict[str, str]] = {}
+
         # Create our urllib3.Retry instance which will allow us to customize
         # how we handle retries.
         retries = urllib3.Retry(
@@ -322,12 +359,15 @@ class PipSession(requests.Session):
         # origin, and we don't want someone to be able to poison the cache and
         # require manual eviction from the cache to fix it.
         if cache:
+            # Shared, so that the sizes of the responses both adapters store
+            # add up.
+            file_cache = SafeFileCache(cache, max_size=cache_max_size)
             secure_adapter = CacheControlAdapter(
-                cache=SafeFileCache(cache),
+                cache=file_cache,
                 max_retries=retries,
             )
             self._trusted_host_adapter = InsecureCacheControlAdapter(
-                cache=SafeFileCache(cache),
+                cache=file_cache,
                 max_retries=retries,
             )
         else:
@@ -369,10 +409,14 @@ class PipSession(requests.Session):
         if host_port not in self.pip_trusted_origins:
             self.pip_trusted_origins.append(host_port)
 
-        self.mount(build_url_from_netloc(host) + "/", self._trusted_host_adapter)
-        if not host_port[1]:
-            # Mount wildcard ports for the same host.
-            self.mount(build_url_from_netloc(host) + ":", self._trusted_host_adapter)
+        # Trusted hosts are often served over plain http, and their responses
+        # are cached as well.
+        for scheme in ("https", "http"):
+            url = build_url_from_netloc(host, scheme=scheme)
+            self.mount(url + "/", self._trusted_host_adapter)
+            if not host_port[1]:
+                # Mount wildcard ports for the same host.
+                self.mount(url + ":", self._trusted_host_adapter)
 
     def iter_secure_origins(self) -> Iterator[SecureOrigin]:
         yield from SECURE_ORIGINS
@@ -446,6 +490,77 @@ class PipSession(requests.Session):
 
         return False
 
+    def _get_environ_proxies(self, url: str, no_proxy: Optional[str]) -> Dict[str, str]:
+        parsed = urllib.parse.urlsplit(url)
+        key = (parsed.scheme, parsed.netloc, no_proxy)
+        try:
+            return self._environ_proxies[key]
+        except KeyError:
+            proxies = get_environ_proxies(url, no_proxy=no_proxy)
+            self._environ_proxies[key] = proxies
+            return proxies
+
+    def merge_environment_settings(
+        self,
+        url: str,
+        proxies: Dict[str, str],
+        stream: Optional[bool],
+        verify: Union[bool, str, None],
+        cert: Union[str, Tuple[str, str], None],
+    ) -> Dict[str, Any]:
+        # The same as requests does, except that the proxies in the
+        # environment are looked up once per origin rather than for every
+        # request, which takes scanning all the environment variables a
+        # few times.
+        if self.trust_env:
+            no_proxy = proxies.get("no_proxy") if proxies is not None else None
+            for key, value in self._get_environ_proxies(url, no_proxy).items():
+                proxies.setdefault(key, value)
+
+            if verify is True or verify is None:
+                verify = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get(
+                    "CURL_CA_BUNDLE"
+                )
+
+        return {
+            "verify": merge_setting(verify, self.verify),
+            "proxies": merge_setting(proxies, self.proxies),
+            "stream": merge_setting(stream, self.stream),
+            "cert": merge_setting(cert, self.cert),
+        }
+
+    def rebuild_proxies(
+        self, prepared_request: PreparedRequest, proxies: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        # The same as requests does, with the proxies in the environment
+        # looked up once per origin. requests calls this for every request it
+        # sends, even when the proxies were already merged in.
+        proxies = proxies if proxies is not None else {}
+        headers = prepared_request.headers
+        url = prepared_request.url
+        assert url is not None
+        scheme = urllib.parse.urlsplit(url).scheme
+        new_proxies = proxies.copy()
+
+        if self.trust_env:
+            environ_proxies = self._get_environ_proxies(url, proxies.get("no_proxy"))
+            proxy = environ_proxies.get(scheme, environ_proxies.get("all"))
+            if proxy:
+                new_proxies.setdefault(scheme, proxy)
+
+        if "Proxy-Authorization" in headers:
+            del headers["Proxy-Authorization"]
+
+        try:
+            username, password = get_auth_from_url(new_proxies[scheme])
+        except KeyError:
+            username, password = None, None
+
+        if username and password:
+            headers["Proxy-Authorization"] = _basic_auth_str(username, password)
+
+        return new_proxies
+
     def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
         # Allow setting a default timeout on a session
         kwargs.setdefault("timeout", self.timeout)
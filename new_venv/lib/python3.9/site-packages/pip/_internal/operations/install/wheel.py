@@ -5,16 +5,20 @@ import collections
 import compileall
 import contextlib
 import csv
+import functools
 import importlib
 import logging
+import multiprocessing
 import os.path
 import re
 import shutil
 import sys
+import threading
 import warnings
 from base64 import urlsafe_b64encode
 from email.message import Message
 from itertools import chain, filterfalse, starmap
+from multiprocessing.pool import Pool
 from typing import (
     IO,
     TYPE_CHECKING,
@@ -47,6 +51,7 @@ from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
 from pip._internal.utils.filesystem import adjacent_tmp_file, replace
 from pip._internal.utils.misc import captured_stdout, ensure_dir, hash_file, partition
+from pip._internal.utils.parallel import LACK_SEM_OPEN
 from pip._internal.utils.unpacking import (
     current_umask,
     is_within_directory,
@@ -70,6 +75,24 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_pycompile_lock = threading.Lock()
+
+# Wheels with fewer Python files than this are byte-compiled in-process, as
+# sending them to a pool of worker processes would cost more than it saves.
+PARALLEL_PYCOMPILE_MIN_FILES = 200
+
+# The process pool of the innermost pycompile_pool() block, started by the
+# first wheel that needs it. Only used with _pycompile_lock held.
+_pycompile_pool_active = False
+_pycompile_pool = None  # type: Optional[Pool]
+
+# What the pool's workers run. Only the standard library may be loaded by
+# name in them: with `pip install -U pip`, pip's own modules on disk have
+# already been replaced by the ones being installed.
+_pool_compile_file = functools.partial(
+    compileall.compile_file, force=True, quiet=2
+)
+
 RecordPath = NewType('RecordPath', str)
 InstalledCSVRow = Tuple[RecordPath, str, Union[int, str]]
 
@@ -441,6 +464,118 @@ def _raise_for_invalid_entrypoint(specification):
         raise MissingCallableSuffix(str(entry))
 
 
+def get_wheel_install_paths(name, wheel_path, scheme):
+    # type: (str, str, Scheme) -> Set[str]
+    """Return the paths of the files installing a wheel would write.
+
+    This mirrors the destination logic of _install_wheel without touching
+    the filesystem, so that the installations of several wheels can be
+    checked for overlaps up front. The generated entry point wrappers are
+    included, the byte-compiled files and the .dist-info metadata files
+    pip generates are not (the latter live in the wheel's .dist-info
+    directory, which is already covered).
+    """
+    with ZipFile(wheel_path, allowZip64=True) as wheel_zip:
+        info_dir, metadata = parse_wheel(wheel_zip, name)
+        names = [ensure_text(n) for n in wheel_zip.namelist()]
+
+    if wheel_root_is_purelib(metadata):
+        lib_dir = scheme.purelib
+    else:
+        lib_dir = scheme.platlib
+
+    paths = set()
+    for record_path in names:
+        if record_path.endswith("/"):
+            continue
+        normed_path = os.path.normpath(record_path)
+        if not record_path.split("/", 1)[0].endswith(".data"):
+            paths.add(os.path.join(lib_dir, normed_path))
+            continue
+        try:
+            _, scheme_key, dest_subpath = normed_path.split(os.path.sep, 2)
+        except ValueError:
+            # _install_wheel reports these with a proper error message.
+            continue
+        if scheme_key in SCHEME_KEYS:
+            scheme_path = getattr(scheme, scheme_key)
+            paths.add(os.path.join(scheme_path, dest_subpath))
+
+    distribution = get_wheel_distribution(wheel_path, canonicalize_name(name))
+    console, gui = get_entrypoints(distribution)
+    script_names = [
+        spec.split("=", 1)[0].strip()
+        for spec in get_console_script_specs(console)
+    ]
+    script_names.extend(gui)
+    for script_name in script_names:
+        paths.add(os.path.join(scheme.scripts, script_name))
+
+    return paths
+
+
+def _compile_file(path):
+    # type: (str) -> Tuple[str, bool, str]
+    """Byte-compile a single installed Python file, returning compileall's
+    output along with whether it succeeded.
+    """
+    with captured_stdout() as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore')
+            # Python 2's `compileall.compile_file` requires a str in
+            # error cases, so we must convert to the native type.
+            path_arg = ensure_str(path, encoding=sys.getfilesystemencoding())
+            success = compileall.compile_file(path_arg, force=True, quiet=True)
+    return path, bool(success), stdout.getvalue()
+
+
+@contextlib.contextmanager
+def pycompile_pool():
+    # type: () -> Iterator[None]
+    """Byte-compile the large wheels installed within the block on a single
+    process pool, which is closed at the end of the block.
+
+    Wheels installed outside such a block are byte-compiled in-process.
+    """
+    global _pycompile_pool_active, _pycompile_pool
+    if _pycompile_pool_active:
+        yield
+        return
+    _pycompile_pool_active = True
+    try:
+        yield
+    except BaseException:
+        with _pycompile_lock:
+            pool, _pycompile_pool = _pycompile_pool, None
+        if pool is not None:
+            pool.terminate()
+        raise
+    else:
+        with _pycompile_lock:
+            pool, _pycompile_pool = _pycompile_pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        _pycompile_pool_active = False
+
+
+def _get_pycompile_pool():
+    # type: () -> Optional[Pool]
+    global _pycompile_pool
+    if _pycompile_pool is None and _pycompile_pool_active and not LACK_SEM_OPEN:
+        # Spawned rather than forked: other threads, such as the ones
+        # installing wheels in parallel or prefetching index pages, may hold
+        # locks that forked workers would inherit in their locked state.
+        try:
+            _pycompile_pool = multiprocessing.get_context("spawn").Pool(
+                initializer=warnings.simplefilter, initargs=("ignore",)
+            )
+        except OSError as e:
+            logger.debug("Could not start byte-compilation workers: %s", e)
+    return _pycompile_pool
+
+
 class PipScriptMaker(ScriptMaker):
     def make(self, specification, options=None):
         # type: (str, Dict[str, Any]) -> List[str]
@@ -659,26 +794,45 @@ def _install_wheel(
 
     # Compile all of the pyc files for the installed files
     if pycompile:
-        with captured_stdout() as stdout:
-            with warnings.catch_warnings():
-                warnings.filterwarnings('ignore')
-                for path in pyc_source_file_paths():
-                    # Python 2's `compileall.compile_file` requires a str in
-                    # error cases, so we must convert to the native type.
-                    path_arg = ensure_str(
-                        path, encoding=sys.getfilesystemencoding()
-                    )
-                    success = compileall.compile_file(
-                        path_arg, force=True, quiet=True
+        source_paths = list(pyc_source_file_paths())
+        # _compile_file patches process-wide state when run in-process, and
+        # a process pool already keeps all CPUs busy, so wheels installed
+        # from several threads take turns here.
+        with _pycompile_lock:
+            cpu_count = os.cpu_count() or 1
+            pool = None
+            if (
+                cpu_count > 1 and
+                len(source_paths) >= PARALLEL_PYCOMPILE_MIN_FILES
+            ):
+                pool = _get_pycompile_pool()
+            if pool is not None:
+                # Make the chunks big enough to amortize the cost of sending
+                # them to the worker processes. The workers don't report
+                # why a file failed to compile, so such files are compiled
+                # again in-process to get the message.
+                chunksize = max(1, len(source_paths) // (4 * cpu_count))
+                successes = pool.imap(
+                    _pool_compile_file, source_paths, chunksize
+                )
+                compile_results = (
+                    (path, True, "") if success else _compile_file(path)
+                    for path, success in zip(source_paths, successes)
+                )  # type: Iterable[Tuple[str, bool, str]]
+            else:
+                compile_results = map(_compile_file, source_paths)
+
+            outputs = []  # type: List[str]
+            for path, success, output in compile_results:
+                outputs.append(output)
+                if success:
+                    pyc_path = pyc_output_path(path)
+                    assert os.path.exists(pyc_path)
+                    pyc_record_path = cast(
+                        "RecordPath", pyc_path.replace(os.path.sep, "/")
                     )
-                    if success:
-                        pyc_path = pyc_output_path(path)
-                        assert os.path.exists(pyc_path)
-                        pyc_record_path = cast(
-                            "RecordPath", pyc_path.replace(os.path.sep, "/")
-                        )
-                        record_installed(pyc_record_path, pyc_path)
-        logger.debug(stdout.getvalue())
+                    record_installed(pyc_record_path, pyc_path)
+        logger.debug("".join(outputs))
 
     maker = PipScriptMaker(None, scheme.scripts)
 
@@ -701,6 +855,11 @@ def _install_wheel(
 
     gui_scripts_to_generate = list(starmap('{} = {}'.format, gui.items()))
 
+    if scripts_to_generate or gui_scripts_to_generate:
+        # distlib does not expect the directory to be created concurrently,
+        # as happens when several wheels are installed in parallel.
+        ensure_dir(scheme.scripts)
+
     generated_console_scripts = maker.make_multiple(scripts_to_generate)
     generated.extend(generated_console_scripts)
 
@@ -8,11 +8,16 @@ import logging
 import mimetypes
 import os
 import shutil
-from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+import urllib.parse
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+from zipfile import BadZipFile
 
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.pkg_resources import Distribution
 
+from pip._internal.build_env import BuildEnvironmentCache
+from pip._internal.cache import MetadataCache
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
 from pip._internal.exceptions import (
@@ -33,6 +38,7 @@ from pip._internal.network.lazy_wheel import (
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
+from pip._internal.network.utils import HEADERS, raise_for_status
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_tracker import RequirementTracker
 from pip._internal.utils.deprecation import deprecated
@@ -42,8 +48,12 @@ from pip._internal.utils.logging import indent_log
 from pip._internal.utils.misc import display_path, hide_url, is_installable_dir, rmtree
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.unpacking import unpack_file
+from pip._internal.utils.wheel import WheelMetadata
 from pip._internal.vcs import vcs
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,15 +62,31 @@ def _get_prepared_distribution(
     req_tracker,  # type: RequirementTracker
     finder,  # type: PackageFinder
     build_isolation,  # type: bool
+    build_env_cache=None,  # type: Optional[BuildEnvironmentCache]
 ):
     # type: (...) -> Distribution
     """Prepare a distribution for installation."""
     abstract_dist = make_distribution_for_install_requirement(req)
     with req_tracker.track(req):
-        abstract_dist.prepare_distribution_metadata(finder, build_isolation)
+        abstract_dist.prepare_distribution_metadata(
+            finder, build_isolation, build_env_cache
+        )
     return abstract_dist.get_pkg_resources_distribution()
 
 
+def _dist_from_metadata(link, metadata):
+    # type: (Link, bytes) -> Distribution
+    """Make a distribution for a wheel out of its METADATA file alone."""
+    from pip._vendor.pkg_resources import DistInfoDistribution
+
+    name = canonicalize_name(Wheel(link.filename).name)
+    return DistInfoDistribution(
+        location=link.url_without_fragment,
+        metadata=WheelMetadata({"METADATA": metadata}, link.filename),
+        project_name=name,
+    )
+
+
 def unpack_vcs_link(link, location):
     # type: (Link, str) -> None
     vcs_backend = vcs.get_backend_for_scheme(link.scheme)
@@ -98,10 +124,8 @@ def get_http_url(
         from_path = already_downloaded_path
         content_type = None
     else:
-        # let's download to a tmp dir
-        from_path, content_type = download(link, temp_dir.path)
-        if hashes:
-            hashes.check_against_path(from_path)
+        # let's download to a tmp dir, checking the hashes on the way
+        from_path, content_type = download(link, temp_dir.path, hashes)
 
     return File(from_path, content_type)
 
@@ -174,9 +198,10 @@ def get_file_url(
         )
 
     if already_downloaded_path:
-        from_path = already_downloaded_path
-    else:
-        from_path = link.file_path
+        # _check_download_dir() checked the hashes already.
+        return File(already_downloaded_path, None)
+
+    from_path = link.file_path
 
     # If --require-hashes is off, `hashes` is either empty, the
     # link's embedded hash, or MissingHashes; it is required to
@@ -295,6 +320,10 @@ class RequirementPreparer:
         use_user_site,  # type: bool
         lazy_wheel,  # type: bool
         in_tree_build,  # type: bool
+        download_concurrency=1,  # type: int
+        use_metadata_files=False,  # type: bool
+        metadata_cache=None,  # type: Optional[MetadataCache]
+        build_env_cache=None,  # type: Optional[BuildEnvironmentCache]
     ):
         # type: (...) -> None
         super().__init__()
@@ -304,7 +333,9 @@ class RequirementPreparer:
         self.req_tracker = req_tracker
         self._session = session
         self._download = Downloader(session, progress_bar)
-        self._batch_download = BatchDownloader(session, progress_bar)
+        self._batch_download = BatchDownloader(
+            session, progress_bar, concurrency=download_concurrency,
+        )
         self.finder = finder
 
         # Where still-packed archives should be written to. If None, they are
@@ -314,6 +345,10 @@ class RequirementPreparer:
         # Is build isolation allowed?
         self.build_isolation = build_isolation
 
+        # Where the isolated build environments of several requirements
+        # are shared.
+        self._build_env_cache = build_env_cache
+
         # Should hash-checking be required?
         self.require_hashes = require_hashes
 
@@ -323,15 +358,39 @@ class RequirementPreparer:
         # Should wheels be downloaded lazily?
         self.use_lazy_wheel = lazy_wheel
 
+        # Should the metadata files served by the index (PEP 658) be used
+        # instead of wheels until they are needed?
+        self.use_metadata_files = use_metadata_files
+
+        # Where the metadata of wheels already inspected is kept across runs.
+        self._metadata_cache = metadata_cache
+
         # Should in-tree builds be used for local paths?
         self.in_tree_build = in_tree_build
 
         # Memoized downloaded files, as mapping of url: (path, mime type)
         self._downloaded = {}  # type: Dict[str, Tuple[str, str]]
 
+        # Files already checked against hashes, as mapping of path: the
+        # hashes they match, so that they are not read again to check them.
+        self._checked_hashes = {}  # type: Dict[str, Hashes]
+
+        # Memoized metadata fetched without the whole wheel, as mapping of
+        # url to the (possibly pending) distribution. Metadata may be
+        # fetched concurrently by Factory.prefetch_candidates().
+        self._metadata_dists = {}  # type: Dict[str, Future]
+        self._metadata_lock = threading.Lock()
+        # Hosts that do not support range requests.
+        self._lazy_wheel_unsupported_hosts = set()  # type: Set[str]
+
         # Previous "header" printed for a link-based InstallRequirement
         self._previous_requirement_header = ("", "")
 
+    @property
+    def session(self):
+        # type: () -> PipSession
+        return self._session
+
     def _log_preparing_link(self, req):
         # type: (InstallRequirement) -> None
         """Provide context for the requirement being prepared."""
@@ -418,6 +477,113 @@ class RequirementPreparer:
         # showing the user what the hash should be.
         return req.hashes(trust_internet=False) or MissingHashes()
 
+    def _fetch_metadata_only(self, link):
+        # type: (Link) -> Optional[Distribution]
+        """Fetch only the metadata of a wheel, if possible.
+
+        This is safe to call from several threads. The metadata of each link
+        is only fetched once.
+        """
+        with self._metadata_lock:
+            future = self._metadata_dists.get(link.url)
+            fetching = future is None
+            if fetching:
+                future = self._metadata_dists[link.url] = Future()
+        if not fetching:
+            return future.result()
+
+        try:
+            dist = self._fetch_metadata_using_cache(link)
+            if dist is None:
+                dist = self._fetch_metadata_using_metadata_file(link)
+            if dist is None:
+                dist = self._fetch_metadata_using_lazy_wheel(link)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        future.set_result(dist)
+        return dist
+
+    def _fetch_metadata_using_cache(self, link):
+        # type: (Link) -> Optional[Distribution]
+        """Get metadata from a previous run, if the wheel was inspected then."""
+        if self._metadata_cache is None:
+            return None
+        metadata = self._metadata_cache.get(link)
+        if metadata is None:
+            return None
+        logger.debug('Using cached metadata of %s', link.show_url)
+        return _dist_from_metadata(link, metadata)
+
+    def _check_hashes(self, hashes, file_path):
+        # type: (Hashes, str) -> None
+        """Check file_path against hashes, unless it already was."""
+        if self._checked_hashes.get(file_path) == hashes:
+            return
+        hashes.check_against_path(file_path)
+        self._checked_hashes[file_path] = hashes
+
+    def _cache_metadata(self, link, file_path, dist):
+        # type: (Link, str, Distribution) -> None
+        """Keep the metadata of a downloaded wheel for later runs."""
+        if self._metadata_cache is None or not self._metadata_cache.supports(link):
+            return
+        if self._metadata_cache.get(link) is not None:
+            return
+        # The wheel may have been checked against other hashes than the one
+        # of the link, under which the metadata is cached.
+        try:
+            self._check_hashes(Hashes({link.hash_name: [link.hash]}), file_path)
+        except HashMismatch:
+            logger.debug('Not caching metadata of %s: hash mismatch', link)
+            return
+        self._metadata_cache.set(link, dist.get_metadata('METADATA'))
+
+    def _fetch_metadata_using_metadata_file(self, link):
+        # type: (Link) -> Optional[Distribution]
+        """Fetch metadata from the file the index serves next to the wheel
+        (PEP 658), if possible.
+        """
+        if not self.use_metadata_files or link.is_file or not link.is_wheel:
+            return None
+        metadata_link = link.metadata_link()
+        if metadata_link is None:
+            return None
+
+        wheel = Wheel(link.filename)
+        name = canonicalize_name(wheel.name)
+        logger.info(
+            'Obtaining dependency information for %s %s from %s',
+            name, wheel.version, metadata_link.show_url,
+        )
+        try:
+            response = self._session.get(
+                metadata_link.url_without_fragment, headers=HEADERS,
+            )
+            raise_for_status(response)
+        except NetworkConnectionError as exc:
+            logger.debug(
+                'Could not fetch %s, falling back to the wheel: %s',
+                metadata_link, exc,
+            )
+            return None
+        metadata = response.content
+
+        if metadata_link.hash_name is not None:
+            hashes = Hashes({metadata_link.hash_name: [metadata_link.hash]})
+            try:
+                hashes.check_against_chunks([metadata])
+            except HashMismatch:
+                # The wheel, which is checked on its own, is authoritative.
+                logger.warning(
+                    'The metadata file of %s does not match its hash, '
+                    'falling back to the wheel',
+                    link.show_url,
+                )
+                return None
+
+        return _dist_from_metadata(link, metadata)
+
     def _fetch_metadata_using_lazy_wheel(self, link):
         # type: (Link) -> Optional[Distribution]
         """Fetch metadata using lazy wheel, if possible."""
@@ -434,6 +600,10 @@ class RequirementPreparer:
             )
             return None
 
+        netloc = urllib.parse.urlsplit(link.url).netloc
+        if netloc in self._lazy_wheel_unsupported_hosts:
+            return None
+
         wheel = Wheel(link.filename)
         name = canonicalize_name(wheel.name)
         logger.info(
@@ -445,7 +615,19 @@ class RequirementPreparer:
             return dist_from_wheel_url(name, url, self._session)
         except HTTPRangeRequestUnsupported:
             logger.debug('%s does not support range requests', url)
+            # Save other wheels from the same host a pointless request.
+            self._lazy_wheel_unsupported_hosts.add(netloc)
             return None
+        except BadZipFile:
+            logger.debug('%s could not be read lazily as a ZIP file', url)
+            return None
+
+    def prefetch_metadata(self, link):
+        # type: (Link) -> None
+        """Fetch only the metadata of link, if possible, so that preparing
+        a requirement for it later does not wait for it.
+        """
+        self._fetch_metadata_only(link)
 
     def _complete_partial_requirements(
         self,
@@ -462,18 +644,27 @@ class RequirementPreparer:
         # `req.local_file_path` on the appropriate requirement after passing
         # all the links at once into BatchDownloader.
         links_to_fully_download = {}  # type: Dict[Link, InstallRequirement]
+        links_hashes = {}  # type: Dict[Link, Hashes]
         for req in partially_downloaded_reqs:
             assert req.link
             links_to_fully_download[req.link] = req
+            links_hashes[req.link] = self._get_linked_req_hashes(req)
 
         batch_download = self._batch_download(
             links_to_fully_download.keys(),
             temp_dir,
+            hashes=links_hashes,
         )
-        for link, (filepath, _) in batch_download:
+        for link, (filepath, content_type) in batch_download:
             logger.debug("Downloading link %s to %s", link, filepath)
             req = links_to_fully_download[link]
             req.local_file_path = filepath
+            # Record the download so that _prepare_linked_requirement uses
+            # this file instead of fetching the link again. Its hashes were
+            # checked while it was written.
+            self._downloaded[link.url] = filepath, content_type
+            if links_hashes[link]:
+                self._checked_hashes[filepath] = links_hashes[link]
 
         # This step is necessary to ensure all lazy wheels are processed
         # successfully by the 'download', 'wheel', and 'install' commands.
@@ -497,9 +688,11 @@ class RequirementPreparer:
             if file_path is not None:
                 # The file is already available, so mark it as downloaded
                 self._downloaded[req.link.url] = file_path, None
+                if hashes:
+                    self._checked_hashes[file_path] = hashes
             else:
                 # The file is not available, attempt to fetch only metadata
-                wheel_dist = self._fetch_metadata_using_lazy_wheel(link)
+                wheel_dist = self._fetch_metadata_only(link)
                 if wheel_dist is not None:
                     req.needs_more_preparation = True
                     return wheel_dist
@@ -518,6 +711,8 @@ class RequirementPreparer:
                 file_path = _check_download_dir(req.link, self.download_dir, hashes)
                 if file_path is not None:
                     self._downloaded[req.link.url] = file_path, None
+                    if hashes:
+                        self._checked_hashes[file_path] = hashes
                     req.needs_more_preparation = False
 
         # Prepare requirements we found were already downloaded for some
@@ -556,10 +751,12 @@ class RequirementPreparer:
                     'Could not install requirement {} because of HTTP '
                     'error {} for URL {}'.format(req, exc, link)
                 )
+            if local_file and hashes:
+                self._checked_hashes[local_file.path] = hashes
         else:
             file_path, content_type = self._downloaded[link.url]
             if hashes:
-                hashes.check_against_path(file_path)
+                self._check_hashes(hashes, file_path)
             local_file = File(file_path, content_type)
 
         # For use in later processing,
@@ -569,7 +766,10 @@ class RequirementPreparer:
 
         dist = _get_prepared_distribution(
             req, self.req_tracker, self.finder, self.build_isolation,
+            self._build_env_cache,
         )
+        if local_file and link.is_wheel:
+            self._cache_metadata(link, local_file.path, dist)
         return dist
 
     def save_linked_requirement(self, req):
@@ -621,6 +821,7 @@ class RequirementPreparer:
 
             dist = _get_prepared_distribution(
                 req, self.req_tracker, self.finder, self.build_isolation,
+                self._build_env_cache,
             )
 
             req.check_if_exists(self.use_user_site)
@@ -1,12 +1,35 @@
 import collections
+import functools
 import logging
-from typing import Iterator, List, Optional, Sequence, Tuple
+import os
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from zipfile import BadZipFile
 
+from pip._internal.exceptions import PipError
+from pip._internal.locations import get_scheme
+from pip._internal.models.scheme import SCHEME_KEYS
+from pip._internal.operations.install.wheel import (
+    get_wheel_install_paths,
+    pycompile_pool,
+)
 from pip._internal.utils.logging import indent_log
+from pip._internal.utils.misc import get_distribution, normalize_path
+from pip._internal.utils.parallel import map_multithread_ordered
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
 from .req_set import RequirementSet
+from .req_uninstall import UninstallPathSet
 
 __all__ = [
     "RequirementSet", "InstallRequirement",
@@ -32,6 +55,217 @@ def _validate_requirements(
         yield req.name, req
 
 
+def _single_install(
+    req_name: str,
+    requirement: InstallRequirement,
+    install_options: List[str],
+    global_options: Sequence[str],
+    root: Optional[str],
+    home: Optional[str],
+    prefix: Optional[str],
+    warn_script_location: bool,
+    use_user_site: bool,
+    pycompile: bool,
+) -> InstallationResult:
+    if requirement.should_reinstall:
+        logger.info('Attempting uninstall: %s', req_name)
+        with indent_log():
+            uninstalled_pathset = requirement.uninstall(
+                auto_confirm=True
+            )
+    else:
+        uninstalled_pathset = None
+
+    try:
+        requirement.install(
+            install_options,
+            global_options,
+            root=root,
+            home=home,
+            prefix=prefix,
+            warn_script_location=warn_script_location,
+            use_user_site=use_user_site,
+            pycompile=pycompile,
+        )
+    except Exception:
+        # if install did not succeed, rollback previous uninstall
+        if uninstalled_pathset and not requirement.install_succeeded:
+            uninstalled_pathset.rollback()
+        raise
+    else:
+        if uninstalled_pathset and requirement.install_succeeded:
+            uninstalled_pathset.commit()
+
+    return InstallationResult(req_name)
+
+
+def _claim_for_path(path: str, roots: Sequence[str]) -> str:
+    """Return the top-level entry under one of roots that contains path."""
+    for root in sorted(roots, key=len, reverse=True):
+        if path.startswith(root + os.path.sep):
+            top_level = path[len(root) + 1:].split(os.path.sep, 1)[0]
+            return os.path.join(root, top_level)
+    return os.path.dirname(path)
+
+
+class _InstallClaims(NamedTuple):
+    # Top-level entries of the scheme directories written or removed.
+    paths: Set[str]
+    # Files of the installed distribution removed before the install.
+    removed: Set[str]
+    # Scheme directories directly holding some of the removed files.
+    removed_from_roots: Set[str]
+
+
+def _get_install_claims(
+    requirement: InstallRequirement,
+    root: Optional[str],
+    home: Optional[str],
+    prefix: Optional[str],
+    use_user_site: bool,
+) -> Optional[_InstallClaims]:
+    """Return what installing a requirement writes or removes.
+
+    Paths are coarsened to the top-level entry of the scheme directory they
+    live in, since uninstallation may move whole directories aside. None is
+    returned when the requirement cannot be installed next to others.
+    """
+    if requirement.editable or not requirement.is_wheel:
+        return None
+    assert requirement.name
+    assert requirement.local_file_path
+
+    scheme = get_scheme(
+        requirement.name,
+        user=use_user_site,
+        home=home,
+        root=root,
+        isolated=requirement.isolated,
+        prefix=prefix,
+    )
+    roots = [normalize_path(getattr(scheme, key)) for key in SCHEME_KEYS]
+    try:
+        paths = get_wheel_install_paths(
+            requirement.name, requirement.local_file_path, scheme
+        )
+    except (PipError, BadZipFile, OSError):
+        # Let the serial installation report the problem.
+        return None
+    claims = _InstallClaims(
+        paths={_claim_for_path(normalize_path(p), roots) for p in paths},
+        removed=set(),
+        removed_from_roots=set(),
+    )
+
+    if not requirement.should_reinstall:
+        return claims
+    dist = get_distribution(requirement.name)
+    if dist is None:
+        return claims
+    try:
+        pathset = UninstallPathSet.from_dist(dist)
+    except PipError:
+        return None
+    if pathset.pth:
+        # .pth files are shared with other distributions.
+        return None
+    roots.append(normalize_path(dist.location))
+    for path in pathset.paths:
+        claims.paths.add(_claim_for_path(path, roots))
+        claims.removed.add(path)
+        parent = os.path.dirname(path)
+        if parent in roots:
+            claims.removed_from_roots.add(parent)
+    return claims
+
+
+def _has_other_files(directory: str, removed: Set[str]) -> bool:
+    """Check whether directory holds any file that is not to be removed."""
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(dirpath, os.path.normcase(filename))
+            if path not in removed:
+                return True
+    return False
+
+
+def _find_overlapping(claims_by_name: Dict[str, Set[str]]) -> Set[str]:
+    """Return the names whose claims overlap with those of another name.
+
+    Two claims overlap if they are the same path or one is a parent
+    directory of the other.
+    """
+    owners: Dict[str, Set[str]] = collections.defaultdict(set)
+    for name, claims in claims_by_name.items():
+        for claim in claims:
+            owners[claim].add(name)
+
+    overlapping: Set[str] = set()
+    for claim, names in owners.items():
+        path = claim
+        while True:
+            others = owners.get(path, set())
+            if len(names | others) > 1:
+                overlapping.update(names, others)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+    return overlapping
+
+
+def _get_parallel_installable(
+    requirements: Iterable[Tuple[str, InstallRequirement]],
+    root: Optional[str],
+    home: Optional[str],
+    prefix: Optional[str],
+    use_user_site: bool,
+) -> List[str]:
+    """Return the names of the requirements that can be installed in parallel.
+
+    Only wheels qualify, and only if none of the files they install or
+    replace belong to another requirement being installed.
+    """
+    claims_by_name = {}
+    for req_name, requirement in requirements:
+        claims = _get_install_claims(
+            requirement,
+            root=root,
+            home=home,
+            prefix=prefix,
+            use_user_site=use_user_site,
+        )
+        if claims is not None:
+            claims_by_name[req_name] = claims
+
+    # compress_for_rename() moves a whole directory aside when all the files
+    # it holds are to be removed. For a scheme directory such as bin/ this
+    # can only happen if the uninstallations together would empty it.
+    removed = set()
+    for claims in claims_by_name.values():
+        removed.update(claims.removed)
+    emptied_roots = set()
+    for claims in claims_by_name.values():
+        for directory in claims.removed_from_roots - emptied_roots:
+            if not _has_other_files(directory, removed):
+                emptied_roots.add(directory)
+
+    paths_by_name = {}
+    for req_name, claims in claims_by_name.items():
+        paths_by_name[req_name] = claims.paths | (
+            claims.removed_from_roots & emptied_roots
+        )
+
+    overlapping = _find_overlapping(paths_by_name)
+    for req_name in sorted(overlapping):
+        logger.debug(
+            "Installing %s serially as its files overlap with another "
+            "package being installed",
+            req_name,
+        )
+    return [name for name in claims_by_name if name not in overlapping]
+
+
 def install_given_reqs(
     requirements: List[InstallRequirement],
     install_options: List[str],
@@ -42,11 +276,18 @@ def install_given_reqs(
     warn_script_location: bool,
     use_user_site: bool,
     pycompile: bool,
+    jobs: int = 1,
 ) -> List[InstallationResult]:
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    With more than one job, each run of consecutive wheels that do not
+    share any files with the other requirements is installed concurrently.
+    Each one is still uninstalled, installed and then committed or rolled
+    back on its own. The other requirements are installed serially, so that
+    the order of the requirements is kept between runs.
     """
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
@@ -56,39 +297,57 @@ def install_given_reqs(
             ', '.join(to_install.keys()),
         )
 
-    installed = []
+    install_one = functools.partial(
+        _single_install,
+        install_options=install_options,
+        global_options=global_options,
+        root=root,
+        home=home,
+        prefix=prefix,
+        warn_script_location=warn_script_location,
+        use_user_site=use_user_site,
+        pycompile=pycompile,
+    )
+
+    parallel: Set[str] = set()
+    if jobs > 1:
+        parallel = set(_get_parallel_installable(
+            to_install.items(),
+            root=root,
+            home=home,
+            prefix=prefix,
+            use_user_site=use_user_site,
+        ))
+
+    def _install_in_worker(req_name: str) -> InstallationResult:
+        # Logging indentation is tracked per thread.
+        with indent_log():
+            return install_one(req_name, to_install[req_name])
+
+    installed: List[InstallationResult] = []
+    batch: List[str] = []
+
+    def _install_batch() -> None:
+        if len(batch) > 1:
+            logger.debug(
+                "Installing %d packages with up to %d workers",
+                len(batch),
+                jobs,
+            )
+            installed.extend(
+                map_multithread_ordered(_install_in_worker, batch, jobs)
+            )
+        else:
+            installed.extend(install_one(n, to_install[n]) for n in batch)
+        batch.clear()
 
-    with indent_log():
+    with indent_log(), pycompile_pool():
         for req_name, requirement in to_install.items():
-            if requirement.should_reinstall:
-                logger.info('Attempting uninstall: %s', req_name)
-                with indent_log():
-                    uninstalled_pathset = requirement.uninstall(
-                        auto_confirm=True
-                    )
-            else:
-                uninstalled_pathset = None
-
-            try:
-                requirement.install(
-                    install_options,
-                    global_options,
-                    root=root,
-                    home=home,
-                    prefix=prefix,
-                    warn_script_location=warn_script_location,
-                    use_user_site=use_user_site,
-                    pycompile=pycompile,
-                )
-            except Exception:
-                # if install did not succeed, rollback previous uninstall
-                if uninstalled_pathset and not requirement.install_succeeded:
-                    uninstalled_pathset.rollback()
-                raise
-            else:
-                if uninstalled_pathset and requirement.install_succeeded:
-                    uninstalled_pathset.commit()
-
-            installed.append(InstallationResult(req_name))
+            if req_name in parallel:
+                batch.append(req_name)
+                continue
+            _install_batch()
+            installed.append(install_one(req_name, requirement))
+        _install_batch()
 
     return installed
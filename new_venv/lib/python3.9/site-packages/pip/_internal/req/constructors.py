@@ -16,7 +16,6 @@ from typing import Any, Dict, Optional, Set, Tuple, Union
 from pip._vendor.packaging.markers import Marker
 from pip._vendor.packaging.requirements import InvalidRequirement, Requirement
 from pip._vendor.packaging.specifiers import Specifier
-from pip._vendor.pkg_resources import RequirementParseError, parse_requirements
 
 from pip._internal.exceptions import InstallationError
 from pip._internal.models.index import PyPI, TestPyPI
@@ -138,6 +137,8 @@ def deduce_helpful_msg(req: str) -> str:
     if os.path.exists(req):
         msg = " The path does exist. "
         # Try to parse and check if it is a requirements file.
+        from pip._vendor.pkg_resources import RequirementParseError, parse_requirements
+
         try:
             with open(req) as fp:
                 # parse first line only
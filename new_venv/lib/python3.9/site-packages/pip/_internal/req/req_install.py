@@ -7,9 +7,9 @@ import shutil
 import sys
 import uuid
 import zipfile
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
 
-from pip._vendor import pkg_resources, six
+from pip._vendor import six
 from pip._vendor.packaging.markers import Marker
 from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.specifiers import SpecifierSet
@@ -17,7 +17,6 @@ from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
 from pip._vendor.packaging.version import parse as parse_version
 from pip._vendor.pep517.wrappers import Pep517HookCaller
-from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.build_env import BuildEnvironment, NoOpBuildEnvironment
 from pip._internal.exceptions import InstallationError
@@ -54,13 +53,18 @@ from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
 from pip._internal.utils.virtualenv import running_under_virtualenv
 from pip._internal.vcs import vcs
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 logger = logging.getLogger(__name__)
 
 
-def _get_dist(metadata_directory: str) -> Distribution:
+def _get_dist(metadata_directory: str) -> "Distribution":
     """Return a pkg_resources.Distribution for the provided
     metadata directory.
     """
+    from pip._vendor import pkg_resources
+
     dist_dir = metadata_directory.rstrip(os.sep)
 
     # Build a PathMetadata object, from path to metadata. :wink:
@@ -140,9 +144,9 @@ class InstallRequirement:
         if extras:
             self.extras = extras
         elif req:
-            self.extras = {
-                pkg_resources.safe_extra(extra) for extra in req.extras
-            }
+            from pip._vendor.pkg_resources import safe_extra
+
+            self.extras = {safe_extra(extra) for extra in req.extras}
         else:
             self.extras = set()
         if markers is None and req:
@@ -151,7 +155,7 @@ class InstallRequirement:
 
         # This holds the pkg_resources.Distribution object if this requirement
         # is already available:
-        self.satisfied_by: Optional[Distribution] = None
+        self.satisfied_by: Optional["Distribution"] = None
         # Whether the installation process should try to uninstall an existing
         # distribution before installing this requirement.
         self.should_reinstall = False
@@ -241,7 +245,9 @@ class InstallRequirement:
     def name(self) -> Optional[str]:
         if self.req is None:
             return None
-        return pkg_resources.safe_name(self.req.name)
+        from pip._vendor.pkg_resources import safe_name
+
+        return safe_name(self.req.name)
 
     @property
     def specifier(self) -> SpecifierSet:
@@ -542,7 +548,7 @@ class InstallRequirement:
 
         return self._metadata
 
-    def get_dist(self) -> Distribution:
+    def get_dist(self) -> "Distribution":
         return _get_dist(self.metadata_directory)
 
     def assert_source_matches_version(self) -> None:
@@ -4,10 +4,18 @@ import os
 import sys
 import sysconfig
 from importlib.util import cache_from_source
-from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
-
-from pip._vendor import pkg_resources
-from pip._vendor.pkg_resources import Distribution
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from pip._internal.exceptions import UninstallationError
 from pip._internal.locations import get_bin_prefix, get_bin_user
@@ -25,10 +33,13 @@ from pip._internal.utils.misc import (
 )
 from pip._internal.utils.temp_dir import AdjacentTempDirectory, TempDirectory
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 logger = getLogger(__name__)
 
 
-def _script_names(dist: Distribution, script_name: str, is_gui: bool) -> List[str]:
+def _script_names(dist: "Distribution", script_name: str, is_gui: bool) -> List[str]:
     """Create the fully qualified name of the files created by
     {console,gui}_scripts for the given ``dist``.
     Returns the list of file names
@@ -61,7 +72,7 @@ def _unique(fn: Callable[..., Iterator[Any]]) -> Callable[..., Iterator[Any]]:
 
 
 @_unique
-def uninstallation_paths(dist: Distribution) -> Iterator[str]:
+def uninstallation_paths(dist: "Distribution") -> Iterator[str]:
     """
     Yield all the uninstallation paths for dist based on RECORD-without-.py[co]
 
@@ -315,7 +326,7 @@ class StashedUninstallPathSet:
 class UninstallPathSet:
     """A set of file paths to be removed in the uninstallation of a
     requirement."""
-    def __init__(self, dist: Distribution) -> None:
+    def __init__(self, dist: "Distribution") -> None:
         self.paths: Set[str] = set()
         self._refuse: Set[str] = set()
         self.pth: Dict[str, UninstallPthEntries] = {}
@@ -436,7 +447,7 @@ class UninstallPathSet:
         self._moved_paths.commit()
 
     @classmethod
-    def from_dist(cls, dist: Distribution) -> "UninstallPathSet":
+    def from_dist(cls, dist: "Distribution") -> "UninstallPathSet":
         dist_path = normalize_path(dist.location)
         if not dist_is_local(dist):
             logger.info(
@@ -457,6 +468,8 @@ class UninstallPathSet:
             )
             return cls(dist)
 
+        from pip._vendor import pkg_resources
+
         paths_to_remove = cls(dist)
         develop_egg_link = egg_link_path(dist)
         develop_egg_link_egg_info = '{}.egg-info'.format(
@@ -1,8 +1,12 @@
 import contextlib
 import functools
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
+    Callable,
+    ContextManager,
     Dict,
     FrozenSet,
     Iterable,
@@ -22,6 +26,7 @@ from pip._vendor.packaging.requirements import InvalidRequirement
 from pip._vendor.packaging.requirements import Requirement as PackagingRequirement
 from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
+from pip._vendor.requests.adapters import DEFAULT_POOLSIZE
 from pip._vendor.resolvelib import ResolutionImpossible
 
 from pip._internal.cache import CacheEntry, WheelCache
@@ -34,7 +39,7 @@ from pip._internal.exceptions import (
     UnsupportedWheel,
 )
 from pip._internal.index.package_finder import PackageFinder
-from pip._internal.metadata import BaseDistribution, get_default_environment
+from pip._internal.metadata import BaseDistribution
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
 from pip._internal.operations.prepare import RequirementPreparer
@@ -59,6 +64,7 @@ from .candidates import (
     as_base_candidate,
 )
 from .found_candidates import FoundCandidates, IndexCandidateInfo
+from .reporter import PipProfilingReporter
 from .requirements import (
     ExplicitRequirement,
     RequiresPythonRequirement,
@@ -98,6 +104,7 @@ class Factory:
         ignore_installed: bool,
         ignore_requires_python: bool,
         py_version_info: Optional[Tuple[int, ...]] = None,
+        profiler: Optional[PipProfilingReporter] = None,
     ) -> None:
         self._finder = finder
         self.preparer = preparer
@@ -107,6 +114,7 @@ class Factory:
         self._use_user_site = use_user_site
         self._force_reinstall = force_reinstall
         self._ignore_requires_python = ignore_requires_python
+        self._profiler = profiler
 
         self._build_failures: Cache[InstallationError] = {}
         self._link_candidate_cache: Cache[LinkCandidate] = {}
@@ -116,8 +124,17 @@ class Factory:
             Tuple[int, FrozenSet[str]], ExtrasCandidate
         ] = {}
 
+        # Background fetches of the metadata of likely candidates.
+        self._metadata_executor: Optional[ThreadPoolExecutor] = None
+        self._metadata_prefetches: Dict[Tuple[str, str], Future] = {}
+        self._metadata_cancelled = threading.Event()
+
         if not ignore_installed:
-            env = get_default_environment()
+            # Installed candidates wrap pkg_resources distributions, whichever
+            # metadata backend is chosen.
+            from pip._internal.metadata.pkg_resources import Environment
+
+            env = Environment.default()
             self._installed_dists = {
                 dist.canonical_name: dist
                 for dist in env.iter_installed_distributions(local_only=False)
@@ -129,6 +146,12 @@ class Factory:
     def force_reinstall(self) -> bool:
         return self._force_reinstall
 
+    def profile(self, phase: str, identifier: str) -> ContextManager[None]:
+        """Time a phase of the work on an identifier, if profiling."""
+        if self._profiler is None:
+            return contextlib.nullcontext()
+        return self._profiler.timing(phase, identifier)
+
     def _fail_if_link_is_unsupported_wheel(self, link: Link) -> None:
         if not link.is_wheel:
             return
@@ -186,13 +209,14 @@ class Factory:
         if template.editable:
             if link not in self._editable_candidate_cache:
                 try:
-                    self._editable_candidate_cache[link] = EditableCandidate(
-                        link,
-                        template,
-                        factory=self,
-                        name=name,
-                        version=version,
-                    )
+                    with self.profile("prepare", name or link.filename):
+                        self._editable_candidate_cache[link] = EditableCandidate(
+                            link,
+                            template,
+                            factory=self,
+                            name=name,
+                            version=version,
+                        )
                 except (InstallationSubprocessError, MetadataInconsistent) as e:
                     logger.warning("Discarding %s. %s", link, e)
                     self._build_failures[link] = e
@@ -201,13 +225,14 @@ class Factory:
         else:
             if link not in self._link_candidate_cache:
                 try:
-                    self._link_candidate_cache[link] = LinkCandidate(
-                        link,
-                        template,
-                        factory=self,
-                        name=name,
-                        version=version,
-                    )
+                    with self.profile("prepare", name or link.filename):
+                        self._link_candidate_cache[link] = LinkCandidate(
+                            link,
+                            template,
+                            factory=self,
+                            name=name,
+                            version=version,
+                        )
                 except (InstallationSubprocessError, MetadataInconsistent) as e:
                     logger.warning("Discarding %s. %s", link, e)
                     self._build_failures[link] = e
@@ -220,6 +245,7 @@ class Factory:
 
     def _iter_found_candidates(
         self,
+        identifier: str,
         ireqs: Sequence[InstallRequirement],
         specifier: SpecifierSet,
         hashes: Hashes,
@@ -269,12 +295,15 @@ class Factory:
             return candidate
 
         def iter_index_candidate_infos() -> Iterator[IndexCandidateInfo]:
-            result = self._finder.find_best_candidate(
-                project_name=name,
-                specifier=specifier,
-                hashes=hashes,
-            )
-            icans = list(result.iter_applicable())
+            # The finder is only consulted once the candidates are iterated,
+            # which the resolver does outside of find_matches().
+            with self.profile("find_candidates", identifier):
+                result = self._finder.find_best_candidate(
+                    project_name=name,
+                    specifier=specifier,
+                    hashes=hashes,
+                )
+                icans = list(result.iter_applicable())
 
             # PEP 592: Yanked releases must be ignored unless only yanked
             # releases can satisfy the version range. So if this is false,
@@ -347,6 +376,91 @@ class Factory:
             if candidate:
                 yield candidate
 
+    def prefetch_candidates(
+        self,
+        requirements: Iterable[Requirement],
+        eligible_for_upgrade: Callable[[str], bool],
+    ) -> None:
+        """Start fetching the index pages the requirements may be looked up in.
+
+        Projects are skipped if an installed version satisfies the
+        requirement and would be preferred, as the index is then not needed.
+        """
+        to_prefetch = {}
+        for requirement in requirements:
+            _, ireq = requirement.get_candidate_lookup()
+            if ireq is None or ireq.req is None:
+                continue
+            name = canonicalize_name(ireq.req.name)
+            installed_dist = self._installed_dists.get(name)
+            if (
+                installed_dist is not None and
+                not self._force_reinstall and
+                not eligible_for_upgrade(requirement.name) and
+                ireq.req.specifier.contains(installed_dist.version, prereleases=True)
+            ):
+                continue
+            to_prefetch[name] = ireq
+        self._finder.prefetch_all_candidates(to_prefetch)
+
+        # Also fetch the metadata of the candidate each requirement will
+        # most likely be pinned to, when that does not need the whole wheel,
+        # as the resolver would otherwise fetch them one after another.
+        if not (self.preparer.use_lazy_wheel or self.preparer.use_metadata_files):
+            return
+        for name, ireq in to_prefetch.items():
+            key = (name, str(ireq.req.specifier))
+            if key in self._metadata_prefetches:
+                continue
+            if self._metadata_executor is None:
+                self._metadata_executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_POOLSIZE,
+                    thread_name_prefix="pip-metadata",
+                )
+                self._metadata_cancelled = threading.Event()
+            self._metadata_prefetches[key] = self._metadata_executor.submit(
+                self._prefetch_best_candidate_metadata,
+                name,
+                ireq,
+                self._metadata_cancelled,
+            )
+
+    def _prefetch_best_candidate_metadata(
+        self, name: str, ireq: InstallRequirement, cancelled: threading.Event
+    ) -> None:
+        assert ireq.req is not None
+        if cancelled.is_set():
+            return
+        try:
+            result = self._finder.find_best_candidate(
+                project_name=name,
+                specifier=ireq.req.specifier,
+                hashes=ireq.hashes(trust_internet=False),
+            )
+            if cancelled.is_set():
+                return
+            if result.best_candidate is not None:
+                self.preparer.prefetch_metadata(result.best_candidate.link)
+        except Exception:
+            # The resolver runs into the same error if it needs the result.
+            logger.debug("Could not prefetch metadata for %s", name, exc_info=True)
+
+    def cancel_prefetches(self, include_finder: bool = True) -> None:
+        """Cancel the prefetches that have not started yet, stop the running
+        ones as soon as possible, and shut the workers down.
+
+        :param include_finder: Whether to also cancel the prefetches of the
+            finder, which it may be running for another resolution.
+        """
+        self._metadata_cancelled.set()
+        if include_finder:
+            self._finder.cancel_prefetches()
+        for future in self._metadata_prefetches.values():
+            future.cancel()
+        if self._metadata_executor is not None:
+            self._metadata_executor.shutdown(wait=False)
+            self._metadata_executor = None
+
     def find_candidates(
         self,
         identifier: str,
@@ -402,6 +516,7 @@ class Factory:
         # the finder for candidates.
         if not explicit_candidates:
             return self._iter_found_candidates(
+                identifier,
                 ireqs,
                 constraint.specifier,
                 constraint.hashes,
@@ -158,40 +158,52 @@ class PipProvider(_ProviderBase):
 
         return Constraint.empty()
 
+    def _eligible_for_upgrade(self, name: str) -> bool:
+        """Are upgrades allowed for this project?
+
+        This checks the upgrade strategy, and whether the project was one
+        that the user specified in the command line, in order to decide
+        whether we should upgrade if there's a newer version available.
+
+        (Note that we don't need access to the `--upgrade` flag, because
+        an upgrade strategy of "to-satisfy-only" means that `--upgrade`
+        was not specified).
+        """
+        if self._upgrade_strategy == "eager":
+            return True
+        elif self._upgrade_strategy == "only-if-needed":
+            return name in self._user_requested
+        return False
+
+    def prefetch(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the index pages of the requirements' projects, so
+        that find_matches() does not have to wait for each of them in turn.
+        """
+        self._factory.prefetch_candidates(requirements, self._eligible_for_upgrade)
+
     def find_matches(
         self,
         identifier: str,
         requirements: Mapping[str, Iterator[Requirement]],
         incompatibilities: Mapping[str, Iterator[Candidate]],
     ) -> Iterable[Candidate]:
-        def _eligible_for_upgrade(name: str) -> bool:
-            """Are upgrades allowed for this project?
-
-            This checks the upgrade strategy, and whether the project was one
-            that the user specified in the command line, in order to decide
-            whether we should upgrade if there's a newer version available.
-
-            (Note that we don't need access to the `--upgrade` flag, because
-            an upgrade strategy of "to-satisfy-only" means that `--upgrade`
-            was not specified).
-            """
-            if self._upgrade_strategy == "eager":
-                return True
-            elif self._upgrade_strategy == "only-if-needed":
-                return name in self._user_requested
-            return False
-
-        return self._factory.find_candidates(
-            identifier=identifier,
-            requirements=requirements,
-            constraint=self._get_constraint(identifier),
-            prefers_installed=(not _eligible_for_upgrade(identifier)),
-            incompatibilities=incompatibilities,
-        )
+        with self._factory.profile("find_matches", identifier):
+            return self._factory.find_candidates(
+                identifier=identifier,
+                requirements=requirements,
+                constraint=self._get_constraint(identifier),
+                prefers_installed=(not self._eligible_for_upgrade(identifier)),
+                incompatibilities=incompatibilities,
+            )
 
     def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
         return requirement.is_satisfied_by(candidate)
 
     def get_dependencies(self, candidate: Candidate) -> Sequence[Requirement]:
         with_requires = not self._ignore_dependencies
-        return [r for r in candidate.iter_dependencies(with_requires) if r is not None]
+        with self._factory.profile("get_dependencies", self.identify(candidate)):
+            dependencies = [
+                r for r in candidate.iter_dependencies(with_requires) if r is not None
+            ]
+        self.prefetch(dependencies)
+        return dependencies
@@ -1,9 +1,16 @@
+import contextlib
+import json
+import threading
+import time
 from collections import defaultdict
 from logging import getLogger
-from typing import Any, DefaultDict
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
 
+from pip._vendor.requests.models import Response
 from pip._vendor.resolvelib.reporters import BaseReporter
 
+from pip._internal.network.cache import is_from_cache
+
 from .base import Candidate, Requirement
 
 logger = getLogger(__name__)
@@ -12,6 +19,9 @@ logger = getLogger(__name__)
 class PipReporter(BaseReporter):
     def __init__(self) -> None:
         self.backtracks_by_package: DefaultDict[str, int] = defaultdict(int)
+        self.rounds = 0
+        self.backjumps = 0
+        self.skipped_pins = 0
 
         self._messages_at_backtrack = {
             1: (
@@ -33,6 +43,23 @@ class PipReporter(BaseReporter):
             ),
         }
 
+    def starting_round(self, index: int) -> None:
+        self.rounds = index + 1
+
+    def ending(self, state: Any) -> None:
+        if not self.backjumps:
+            return
+        # Backtracking one pin at a time would have tried at least one other
+        # candidate for each of the skipped pins, each in a round of its own.
+        logger.info(
+            "Resolved in %d rounds. Backjumping over %d pins unrelated to "
+            "conflicts (in %d jumps) saved at least as many rounds and "
+            "candidate evaluations.",
+            self.rounds,
+            self.skipped_pins,
+            self.backjumps,
+        )
+
     def backtracking(self, candidate: Candidate) -> None:
         self.backtracks_by_package[candidate.name] += 1
 
@@ -43,6 +70,138 @@ class PipReporter(BaseReporter):
         message = self._messages_at_backtrack[count]
         logger.info("INFO: %s", message.format(package_name=candidate.name))
 
+    def backjumping(self, candidates: List[Candidate]) -> None:
+        self.backjumps += 1
+        self.skipped_pins += len(candidates)
+
+
+class PipProfilingReporter(PipReporter):
+    """A reporter that also records where the resolution spends its time.
+
+    The provider and the factory time their work on each identifier with
+    :meth:`timing`. The time of a phase excludes that of the phases nested in
+    it, so preparing a candidate while finding matches is only counted once.
+    The timed phases must all run on the thread that created the reporter.
+
+    find_matches is the provider call. The finder is only consulted when
+    the resolver iterates the matches, which is timed as find_candidates,
+    nested in find_matches or not depending on when that happens.
+    """
+
+    PHASES = ("find_matches", "find_candidates", "get_dependencies", "prepare")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.network_bytes = 0
+        self._network_bytes_by_identifier: DefaultDict[str, int] = defaultdict(int)
+        # Responses without a Content-Length, such as chunked ones, and the
+        # identifier they are for. Their bytes are counted once read.
+        self._unsized_responses: List[Tuple[Optional[str], Any]] = []
+        self._phases: DefaultDict[str, Dict[str, Dict[str, Any]]] = defaultdict(
+            lambda: {phase: {"calls": 0, "seconds": 0.0} for phase in self.PHASES}
+        )
+        # Identifiers being timed and the time spent in their nested phases.
+        self._frames: List[List[Any]] = []
+        self._thread = threading.current_thread()
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def starting(self) -> None:
+        self._started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def timing(self, phase: str, identifier: str) -> Iterator[None]:
+        frame = [identifier, 0.0]
+        self._frames.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._frames.pop()
+            if self._frames:
+                self._frames[-1][1] += elapsed
+            stats = self._phases[identifier][phase]
+            stats["calls"] += 1
+            stats["seconds"] += elapsed - frame[1]
+
+    def record_response(self, response: Response, *args: Any, **kwargs: Any) -> None:
+        """Count the bytes of a response, as a requests response hook.
+
+        Responses from the HTTP cache did not use the network. Responses of
+        prefetches running on other threads only count towards the total.
+        Responses without a Content-Length, such as chunked ones, are counted
+        when the profile is made, by the bytes read from them by then.
+        """
+        if is_from_cache(response):
+            return
+        identifier = None
+        if self._frames and threading.current_thread() is self._thread:
+            identifier = self._frames[-1][0]
+        try:
+            size = int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            # The body has not been read yet.
+            with self._lock:
+                self._unsized_responses.append((identifier, response.raw))
+            return
+        self._count_bytes(identifier, size)
+
+    def _count_bytes(self, identifier: Optional[str], size: int) -> None:
+        with self._lock:
+            self.network_bytes += size
+            if identifier is not None:
+                self._network_bytes_by_identifier[identifier] += size
+
+    def _count_unsized_responses(self) -> None:
+        with self._lock:
+            responses, self._unsized_responses = self._unsized_responses, []
+        for identifier, raw in responses:
+            # The bytes read from the connection so far.
+            try:
+                size = raw.tell()
+            except (AttributeError, OSError, ValueError):
+                continue
+            self._count_bytes(identifier, size)
+
+    def get_profile(self, max_rounds: int) -> Dict[str, Any]:
+        self._count_unsized_responses()
+        identifiers = {}
+        for identifier in (
+            self._phases.keys()
+            | self._network_bytes_by_identifier.keys()
+            | self.backtracks_by_package.keys()
+        ):
+            phases = self._phases[identifier]
+            identifiers[identifier] = {
+                "seconds": sum(stats["seconds"] for stats in phases.values()),
+                **phases,
+                "network_bytes": self._network_bytes_by_identifier[identifier],
+                "backtracks": self.backtracks_by_package[identifier],
+            }
+        return {
+            "seconds": time.perf_counter() - self._started,
+            "rounds": self.rounds,
+            "max_rounds": max_rounds,
+            "network_bytes": self.network_bytes,
+            "backtracks": sum(self.backtracks_by_package.values()),
+            "backjumps": self.backjumps,
+            "skipped_pins": self.skipped_pins,
+            # The slowest projects first.
+            "identifiers": dict(
+                sorted(
+                    identifiers.items(),
+                    key=lambda item: item[1]["seconds"],
+                    reverse=True,
+                )
+            ),
+        }
+
+    def write_profile(self, path: str, max_rounds: int) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_profile(max_rounds), f, indent=2)
+            f.write("\n")
+
 
 class PipDebuggingReporter(BaseReporter):
     """A reporter that does an info log for every event it sees."""
@@ -65,5 +224,8 @@ class PipDebuggingReporter(BaseReporter):
     def backtracking(self, candidate: Candidate) -> None:
         logger.info("Reporter.backtracking(%r)", candidate)
 
+    def backjumping(self, candidates: List[Candidate]) -> None:
+        logger.info("Reporter.backjumping(%r)", candidates)
+
     def pinning(self, candidate: Candidate) -> None:
         logger.info("Reporter.pinning(%r)", candidate)
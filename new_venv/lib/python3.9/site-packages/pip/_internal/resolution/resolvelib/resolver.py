@@ -17,6 +17,7 @@ from pip._internal.resolution.base import BaseResolver, InstallRequirementProvid
 from pip._internal.resolution.resolvelib.provider import PipProvider
 from pip._internal.resolution.resolvelib.reporter import (
     PipDebuggingReporter,
+    PipProfilingReporter,
     PipReporter,
 )
 from pip._internal.utils.deprecation import deprecated
@@ -50,10 +51,18 @@ class Resolver(BaseResolver):
         force_reinstall: bool,
         upgrade_strategy: str,
         py_version_info: Optional[Tuple[int, ...]] = None,
+        backjumping: bool = False,
+        profile_path: Optional[str] = None,
+        cancel_finder_prefetches: bool = True,
     ):
         super().__init__()
         assert upgrade_strategy in self._allowed_strategies
 
+        self.profile_path = profile_path
+        self._profiler: Optional[PipProfilingReporter] = None
+        if profile_path:
+            self._profiler = PipProfilingReporter()
+
         self.factory = Factory(
             finder=finder,
             preparer=preparer,
@@ -64,9 +73,14 @@ class Resolver(BaseResolver):
             ignore_installed=ignore_installed,
             ignore_requires_python=ignore_requires_python,
             py_version_info=py_version_info,
+            profiler=self._profiler,
         )
         self.ignore_dependencies = ignore_dependencies
         self.upgrade_strategy = upgrade_strategy
+        self.backjumping = backjumping
+        # False when the finder is shared with a resolution still running,
+        # such as the one a build environment is installed for.
+        self.cancel_finder_prefetches = cancel_finder_prefetches
         self._result: Optional[Result] = None
 
     def resolve(
@@ -80,17 +94,23 @@ class Resolver(BaseResolver):
             upgrade_strategy=self.upgrade_strategy,
             user_requested=collected.user_requested,
         )
-        if "PIP_RESOLVER_DEBUG" in os.environ:
-            reporter: BaseReporter = PipDebuggingReporter()
+        if self._profiler is not None:
+            reporter: BaseReporter = self._profiler
+            response_hooks = self.factory.preparer.session.hooks["response"]
+            response_hooks.append(self._profiler.record_response)
+        elif "PIP_RESOLVER_DEBUG" in os.environ:
+            reporter = PipDebuggingReporter()
         else:
             reporter = PipReporter()
         resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
             provider,
             reporter,
+            backjumping=self.backjumping,
         )
 
+        provider.prefetch(collected.requirements)
+        try_to_avoid_resolution_too_deep = 2000000
         try:
-            try_to_avoid_resolution_too_deep = 2000000
             result = self._result = resolver.resolve(
                 collected.requirements, max_rounds=try_to_avoid_resolution_too_deep
             )
@@ -101,6 +121,14 @@ class Resolver(BaseResolver):
                 collected.constraints,
             )
             raise error from e
+        finally:
+            # Prefetches for projects the resolution did not get to.
+            self.factory.cancel_prefetches(
+                include_finder=self.cancel_finder_prefetches
+            )
+            if self._profiler is not None:
+                response_hooks.remove(self._profiler.record_response)
+                self._write_profile(try_to_avoid_resolution_too_deep)
 
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         for candidate in result.mapping.values():
@@ -182,6 +210,19 @@ class Resolver(BaseResolver):
         self.factory.preparer.prepare_linked_requirements_more(reqs)
         return req_set
 
+    def _write_profile(self, max_rounds: int) -> None:
+        assert self._profiler is not None and self.profile_path is not None
+        try:
+            self._profiler.write_profile(self.profile_path, max_rounds)
+        except OSError as e:
+            logger.warning(
+                "Could not write the resolver profile to %s: %s",
+                self.profile_path,
+                e,
+            )
+        else:
+            logger.info("Wrote the resolver profile to %s", self.profile_path)
+
     def get_installation_order(
         self, req_set: RequirementSet
     ) -> List[InstallRequirement]:
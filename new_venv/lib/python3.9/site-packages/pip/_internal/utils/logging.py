@@ -86,6 +86,27 @@ def get_indentation():
     return getattr(_log_state, "indentation", 0)
 
 
+@contextlib.contextmanager
+def label_log(label):
+    # type: (str) -> Iterator[None]
+    """
+    A context manager which will cause the log output of the current thread
+    to be prefixed with ``[label]``, to tell apart the messages of work done
+    concurrently.
+    """
+    previous = get_log_label()
+    _log_state.label = f"[{label}] "
+    try:
+        yield
+    finally:
+        _log_state.label = previous
+
+
+def get_log_label():
+    # type: () -> str
+    return getattr(_log_state, "label", "")
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -97,7 +118,8 @@ class IndentingFormatter(logging.Formatter):
     ):
         # type: (...) -> None
         """
-        A logging.Formatter that obeys the indent_log() context manager.
+        A logging.Formatter that obeys the indent_log() and label_log()
+        context managers.
 
         :param add_timestamp: A bool indicating output lines should be prefixed
             with their record's timestamp.
@@ -135,7 +157,7 @@ class IndentingFormatter(logging.Formatter):
         prefix = ""
         if self.add_timestamp:
             prefix = f"{self.formatTime(record)} "
-        prefix += " " * get_indentation()
+        prefix += " " * get_indentation() + get_log_label()
         formatted = "".join([prefix + line for line in formatted.splitlines(True)])
         return formatted
 
@@ -17,6 +17,7 @@ from io import StringIO
 from itertools import filterfalse, tee, zip_longest
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
     Any,
     AnyStr,
     BinaryIO,
@@ -34,7 +35,6 @@ from typing import (
     cast,
 )
 
-from pip._vendor.pkg_resources import Distribution
 from pip._vendor.tenacity import retry, stop_after_delay, wait_fixed
 
 from pip import __version__
@@ -46,6 +46,9 @@ from pip._internal.utils.virtualenv import (
     virtualenv_no_global,
 )
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 __all__ = [
     "rmtree",
     "display_path",
@@ -407,13 +410,13 @@ def get_installed_distributions(
 
     Left for compatibility until direct pkg_resources uses are refactored out.
     """
-    from pip._internal.metadata import get_default_environment, get_environment
     from pip._internal.metadata.pkg_resources import Distribution as _Dist
+    from pip._internal.metadata.pkg_resources import Environment
 
     if paths is None:
-        env = get_default_environment()
+        env = Environment.default()
     else:
-        env = get_environment(paths)
+        env = Environment.from_paths(paths)
     dists = env.iter_installed_distributions(
         local_only=local_only,
         skip=skip,
@@ -433,10 +436,10 @@ def get_distribution(req_name):
 
     Left for compatibility until direct pkg_resources uses are refactored out.
     """
-    from pip._internal.metadata import get_default_environment
     from pip._internal.metadata.pkg_resources import Distribution as _Dist
+    from pip._internal.metadata.pkg_resources import Environment
 
-    dist = get_default_environment().get_distribution(req_name)
+    dist = Environment.default().get_distribution(req_name)
     if dist is None:
         return None
     return cast(_Dist, dist)._dist
@@ -461,6 +464,16 @@ def egg_link_path(dist):
 
     This method will just return the first one found.
     """
+    return egg_link_path_for_name(dist.project_name)
+
+
+def egg_link_path_for_name(project_name):
+    # type: (str) -> Optional[str]
+    """
+    Return the path for the .egg-link file of the project named
+    ``project_name`` (as pkg_resources spells it) if it exists, otherwise,
+    None. See ``egg_link_path()``.
+    """
     sites = []
     if running_under_virtualenv():
         sites.append(site_packages)
@@ -472,7 +485,7 @@ def egg_link_path(dist):
         sites.append(site_packages)
 
     for site in sites:
-        egglink = os.path.join(site, dist.project_name) + ".egg-link"
+        egglink = os.path.join(site, project_name) + ".egg-link"
         if os.path.isfile(egglink):
             return egglink
     return None
@@ -1,18 +1,21 @@
+import functools
 import logging
 from email.message import Message
 from email.parser import FeedParser
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from pip._vendor import pkg_resources
 from pip._vendor.packaging import specifiers, version
-from pip._vendor.pkg_resources import Distribution
 
 from pip._internal.exceptions import NoneMetadataError
 from pip._internal.utils.misc import display_path
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=512)
 def check_requires_python(requires_python, version_info):
     # type: (Optional[str], Tuple[int, ...]) -> bool
     """
@@ -24,6 +27,9 @@ def check_requires_python(requires_python, version_info):
     :return: `True` if the given Python version satisfies the requirement.
         Otherwise, return `False`.
 
+    The result is cached, as an index serves the same few "Requires-Python"
+    values for all the files of a project.
+
     :raises InvalidSpecifier: If `requires_python` has an invalid format.
     """
     if requires_python is None:
@@ -41,8 +47,10 @@ def get_metadata(dist):
     :raises NoneMetadataError: if the distribution reports `has_metadata()`
         True but `get_metadata()` returns None.
     """
+    from pip._vendor.pkg_resources import DistInfoDistribution
+
     metadata_name = "METADATA"
-    if isinstance(dist, pkg_resources.DistInfoDistribution) and dist.has_metadata(
+    if isinstance(dist, DistInfoDistribution) and dist.has_metadata(
         metadata_name
     ):
         metadata = dist.get_metadata(metadata_name)
@@ -64,7 +72,7 @@ def get_metadata(dist):
 
 
 def get_requires_python(dist):
-    # type: (pkg_resources.Distribution) -> Optional[str]
+    # type: (Distribution) -> Optional[str]
     """
     Return the "Requires-Python" metadata for a distribution, or None
     if not present.
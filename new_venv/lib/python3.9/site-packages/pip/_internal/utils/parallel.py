@@ -1,12 +1,13 @@
 """Convenient parallelization of higher order functions.
 
-This module provides two helper functions, with appropriate fallbacks on
+This module provides three helper functions, with appropriate fallbacks on
 Python 2 and on systems lacking support for synchronization mechanisms:
 
 - map_multiprocess
 - map_multithread
+- map_multithread_ordered
 
-These helpers work like Python 3's map, with two differences:
+The first two helpers work like Python 3's map, with two differences:
 
 - They don't guarantee the order of processing of
   the elements of the iterable.
@@ -14,9 +15,12 @@ These helpers work like Python 3's map, with two differences:
   a number of chunks, so that for very long iterables using
   a large value for chunksize can make the job complete much faster
   than using the default value of 1.
+
+map_multithread_ordered instead yields results lazily and in input order,
+using a bounded number of worker threads.
 """
 
-__all__ = ["map_multiprocess", "map_multithread"]
+__all__ = ["map_multiprocess", "map_multithread", "map_multithread_ordered"]
 
 from contextlib import contextmanager
 from multiprocessing import Pool as ProcessPool
@@ -94,8 +98,41 @@ def _map_multithread(func, iterable, chunksize=1):
         return pool.imap_unordered(func, iterable, chunksize)
 
 
+def _map_ordered_fallback(func, iterable, workers=DEFAULT_POOLSIZE):
+    # type: (Callable[[S], T], Iterable[S], int) -> Iterator[T]
+    """Make an iterator applying func to each element in iterable.
+
+    This is the sequential fallback of map_multithread_ordered.
+    """
+    return map(func, iterable)
+
+
+def _map_multithread_ordered(func, iterable, workers=DEFAULT_POOLSIZE):
+    # type: (Callable[[S], T], Iterable[S], int) -> Iterator[T]
+    """Submit each element of iterable to a pool of at most workers threads.
+
+    Return an iterator yielding the results in the order of iterable,
+    each one as soon as it and all of its predecessors are available.
+    If func raises, the exception is propagated to the consumer and
+    the work that has not yet started is abandoned.
+    """
+    if workers <= 1:
+        yield from map(func, iterable)
+        return
+    pool = ThreadPool(workers)
+    try:
+        yield from pool.imap(func, iterable)
+    finally:
+        # Threads cannot be killed, so this waits for the tasks
+        # in progress but drops the ones not yet started.
+        pool.terminate()
+        pool.join()
+
+
 if LACK_SEM_OPEN:
     map_multiprocess = map_multithread = _map_fallback
+    map_multithread_ordered = _map_ordered_fallback
 else:
     map_multiprocess = _map_multiprocess
     map_multithread = _map_multithread
+    map_multithread_ordered = _map_multithread_ordered
@@ -1,7 +1,5 @@
 from typing import Dict, Iterable, List
 
-from pip._vendor.pkg_resources import yield_lines
-
 
 class DictMetadata:
     """IMetadataProvider that reads metadata files from a dictionary."""
@@ -25,6 +23,8 @@ class DictMetadata:
 
     def get_metadata_lines(self, name):
         # type: (str) -> Iterable[str]
+        from pip._vendor.pkg_resources import yield_lines
+
         return yield_lines(self.get_metadata(name))
 
     def metadata_isdir(self, name):
@@ -1,8 +1,20 @@
+import contextlib
 import logging
 import os
 import shlex
 import subprocess
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Union
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 
 from pip._internal.cli.spinners import SpinnerInterface, open_spinner
 from pip._internal.exceptions import InstallationSubprocessError
@@ -14,6 +26,29 @@ CommandArgs = List[Union[str, HiddenText]]
 
 LOG_DIVIDER = "----------------------------------------"
 
+_environ_state = threading.local()
+
+
+@contextlib.contextmanager
+def subprocess_environ(environ):
+    # type: (Mapping[str, str]) -> Iterator[None]
+    """
+    A context manager which sets environment variables for the subprocesses
+    started by the current thread, leaving os.environ alone so that other
+    threads are not affected.
+    """
+    previous = get_subprocess_environ()
+    _environ_state.environ = {**previous, **environ}
+    try:
+        yield
+    finally:
+        _environ_state.environ = previous
+
+
+def get_subprocess_environ():
+    # type: () -> Dict[str, str]
+    return getattr(_environ_state, "environ", {})
+
 
 def make_command(*args):
     # type: (Union[str, HiddenText, CommandArgs]) -> CommandArgs
@@ -161,6 +196,7 @@ def call_subprocess(
 
     log_subprocess("Running command %s", command_desc)
     env = os.environ.copy()
+    env.update(get_subprocess_environ())
     if extra_environ:
         env.update(extra_environ)
     for name in unset_environ:
@@ -4,15 +4,17 @@
 import logging
 from email.message import Message
 from email.parser import Parser
-from typing import Dict, Tuple
+from typing import TYPE_CHECKING, Dict, Tuple
 from zipfile import BadZipFile, ZipFile
 
 from pip._vendor.packaging.utils import canonicalize_name
-from pip._vendor.pkg_resources import DistInfoDistribution, Distribution
 
 from pip._internal.exceptions import UnsupportedWheel
 from pip._internal.utils.pkg_resources import DictMetadata
 
+if TYPE_CHECKING:
+    from pip._vendor.pkg_resources import Distribution
+
 VERSION_COMPATIBLE = (1, 0)
 
 
@@ -46,6 +48,8 @@ def pkg_resources_distribution_for_wheel(wheel_zip, name, location):
 
     :raises UnsupportedWheel: on any errors
     """
+    from pip._vendor.pkg_resources import DistInfoDistribution
+
     info_dir, _ = parse_wheel(wheel_zip, name)
 
     metadata_files = [p for p in wheel_zip.namelist() if p.startswith(f"{info_dir}/")]
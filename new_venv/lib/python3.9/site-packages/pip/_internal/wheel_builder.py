@@ -13,13 +13,15 @@ from pip._vendor.packaging.version import InvalidVersion, Version
 from pip._internal.cache import WheelCache
 from pip._internal.exceptions import InvalidWheelFilename, UnsupportedWheel
 from pip._internal.metadata import get_wheel_distribution
+from pip._internal.models.format_control import FormatControl
 from pip._internal.models.link import Link
 from pip._internal.models.wheel import Wheel
 from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_legacy import build_wheel_legacy
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import indent_log, label_log
 from pip._internal.utils.misc import ensure_dir, hash_file, is_wheel_installed
+from pip._internal.utils.parallel import map_multithread_ordered
 from pip._internal.utils.setuptools_build import make_setuptools_clean_args
 from pip._internal.utils.subprocess import call_subprocess
 from pip._internal.utils.temp_dir import TempDirectory
@@ -34,6 +36,15 @@ BinaryAllowedPredicate = Callable[[InstallRequirement], bool]
 BuildResult = Tuple[List[InstallRequirement], List[InstallRequirement]]
 
 
+def get_check_binary_allowed(format_control: FormatControl) -> BinaryAllowedPredicate:
+    def check_binary_allowed(req: InstallRequirement) -> bool:
+        canonical_name = canonicalize_name(req.name or "")
+        allowed_formats = format_control.get_allowed_formats(canonical_name)
+        return "binary" in allowed_formats
+
+    return check_binary_allowed
+
+
 def _contains_egg_info(s):
     # type: (str) -> bool
     """Determine whether the string looks like an egg_info.
@@ -313,10 +324,13 @@ def build(
     verify,  # type: bool
     build_options,  # type: List[str]
     global_options,  # type: List[str]
+    jobs=1,  # type: int
 ):
     # type: (...) -> BuildResult
     """Build wheels.
 
+    :param jobs: How many wheels to build at the same time. The log output
+        of each build is then prefixed with the name of its requirement.
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
@@ -329,14 +343,30 @@ def build(
         ', '.join(req.name for req in requirements),  # type: ignore
     )
 
+    def _build_one_for_cache(req):
+        # type: (InstallRequirement) -> Optional[str]
+        cache_dir = _get_cache_dir(req, wheel_cache)
+        return _build_one(req, cache_dir, verify, build_options, global_options)
+
+    def _build_in_worker(req):
+        # type: (InstallRequirement) -> Optional[str]
+        # Logging indentation is tracked per thread.
+        with indent_log(), label_log(req.name or str(req)):
+            return _build_one_for_cache(req)
+
     with indent_log():
+        if jobs > 1:
+            logger.debug("Building wheels with up to %d workers", jobs)
+            wheel_files = map_multithread_ordered(
+                _build_in_worker, requirements, jobs
+            )  # type: Iterable[Optional[str]]
+        else:
+            wheel_files = map(_build_one_for_cache, requirements)
+
         build_successes, build_failures = [], []
-        for req in requirements:
-            cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req, cache_dir, verify, build_options, global_options
-            )
+        for req, wheel_file in zip(requirements, wheel_files):
             if wheel_file:
+                wheel_cache.add(wheel_file)
                 # Update the link for this.
                 req.link = Link(path_to_url(wheel_file))
                 req.local_file_path = req.link.file_path
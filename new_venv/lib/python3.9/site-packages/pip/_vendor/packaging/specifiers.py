@@ -22,7 +22,7 @@ from typing import (
 )
 
 from .utils import canonicalize_version
-from .version import LegacyVersion, Version, parse
+from .version import LegacyVersion, Version, _parse_version, parse
 
 ParsedVersion = Union[Version, LegacyVersion]
 UnparsedVersion = Union[Version, LegacyVersion, str]
@@ -94,20 +94,24 @@ class BaseSpecifier(metaclass=abc.ABCMeta):
         """
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_specifier(regex: Pattern[str], spec: str) -> Tuple[str, str]:
+    # The same few specifier strings are parsed over and over while
+    # resolving, so the results of matching them are kept.
+    match = regex.search(spec)
+    if not match:
+        raise InvalidSpecifier(f"Invalid specifier: '{spec}'")
+
+    return match.group("operator").strip(), match.group("version").strip()
+
+
 class _IndividualSpecifier(BaseSpecifier):
 
     _operators: Dict[str, str] = {}
     _regex: Pattern[str]
 
     def __init__(self, spec: str = "", prereleases: Optional[bool] = None) -> None:
-        match = self._regex.search(spec)
-        if not match:
-            raise InvalidSpecifier(f"Invalid specifier: '{spec}'")
-
-        self._spec: Tuple[str, str] = (
-            match.group("operator").strip(),
-            match.group("version").strip(),
-        )
+        self._spec: Tuple[str, str] = _split_specifier(self._regex, spec)
 
         # Store whether or not this Specifier should accept prereleases
         self._prereleases = prereleases
@@ -450,7 +454,7 @@ class Specifier(_IndividualSpecifier):
         # We need special logic to handle prefix matching
         if spec.endswith(".*"):
             # In the case of prefix matching we want to ignore local segment.
-            prospective = Version(prospective.public)
+            prospective = _parse_version(prospective.public)
             # Split the spec out by dots, and pretend that there is an implicit
             # dot in between a release segment and a pre-release segment.
             split_spec = _version_split(spec[:-2])  # Remove the trailing .*
@@ -474,13 +478,13 @@ class Specifier(_IndividualSpecifier):
             return padded_prospective == padded_spec
         else:
             # Convert our spec string into a Version
-            spec_version = Version(spec)
+            spec_version = _parse_version(spec)
 
             # If the specifier does not have a local segment, then we want to
             # act as if the prospective version also does not have a local
             # segment.
             if not spec_version.local:
-                prospective = Version(prospective.public)
+                prospective = _parse_version(prospective.public)
 
             return prospective == spec_version
 
@@ -494,7 +498,7 @@ class Specifier(_IndividualSpecifier):
         # NB: Local version identifiers are NOT permitted in the version
         # specifier, so local version labels can be universally removed from
         # the prospective version.
-        return Version(prospective.public) <= Version(spec)
+        return _parse_version(prospective.public) <= _parse_version(spec)
 
     @_require_version_compare
     def _compare_greater_than_equal(
@@ -504,14 +508,14 @@ class Specifier(_IndividualSpecifier):
         # NB: Local version identifiers are NOT permitted in the version
         # specifier, so local version labels can be universally removed from
         # the prospective version.
-        return Version(prospective.public) >= Version(spec)
+        return _parse_version(prospective.public) >= _parse_version(spec)
 
     @_require_version_compare
     def _compare_less_than(self, prospective: ParsedVersion, spec_str: str) -> bool:
 
         # Convert our spec to a Version instance, since we'll want to work with
         # it as a version.
-        spec = Version(spec_str)
+        spec = _parse_version(spec_str)
 
         # Check to see if the prospective version is less than the spec
         # version. If it's not we can short circuit and just return False now
@@ -524,7 +528,9 @@ class Specifier(_IndividualSpecifier):
         # versions for the version mentioned in the specifier (e.g. <3.1 should
         # not match 3.1.dev0, but should match 3.0.dev0).
         if not spec.is_prerelease and prospective.is_prerelease:
-            if Version(prospective.base_version) == Version(spec.base_version):
+            if _parse_version(prospective.base_version) == _parse_version(
+                spec.base_version
+            ):
                 return False
 
         # If we've gotten to here, it means that prospective version is both
@@ -537,7 +543,7 @@ class Specifier(_IndividualSpecifier):
 
         # Convert our spec to a Version instance, since we'll want to work with
         # it as a version.
-        spec = Version(spec_str)
+        spec = _parse_version(spec_str)
 
         # Check to see if the prospective version is greater than the spec
         # version. If it's not we can short circuit and just return False now
@@ -550,13 +556,17 @@ class Specifier(_IndividualSpecifier):
         # post-release versions for the version mentioned in the specifier
         # (e.g. >3.1 should not match 3.0.post0, but should match 3.2.post0).
         if not spec.is_postrelease and prospective.is_postrelease:
-            if Version(prospective.base_version) == Version(spec.base_version):
+            if _parse_version(prospective.base_version) == _parse_version(
+                spec.base_version
+            ):
                 return False
 
         # Ensure that we do not allow a local version of the version mentioned
         # in the specifier, which is technically greater than, to match.
         if prospective.local is not None:
-            if Version(prospective.base_version) == Version(spec.base_version):
+            if _parse_version(prospective.base_version) == _parse_version(
+                spec.base_version
+            ):
                 return False
 
         # If we've gotten to here, it means that prospective version is both
@@ -3,6 +3,7 @@
 # for complete details.
 
 import collections
+import functools
 import itertools
 import re
 import warnings
@@ -39,18 +40,44 @@ _Version = collections.namedtuple(
 )
 
 
+# Parsed versions are immutable, so the same object is handed out for every
+# parse of a version string. Resolving parses the version strings of a
+# project's releases many times over, through the specifiers.
+_PARSE_CACHE_SIZE = 20000
+
+
 def parse(version: str) -> Union["LegacyVersion", "Version"]:
     """
     Parse the given version string and return either a :class:`Version` object
     or a :class:`LegacyVersion` object depending on if the given version is
     a valid PEP 440 version or a legacy version.
     """
+    try:
+        return _cached_parse(version)
+    except TypeError:
+        # Unhashable string-likes, such as email headers, are not cached.
+        return _parse(version)
+
+
+def _parse(version: str) -> Union["LegacyVersion", "Version"]:
     try:
         return Version(version)
     except InvalidVersion:
         return LegacyVersion(version)
 
 
+_cached_parse = functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse)
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_version(version: str) -> "Version":
+    """
+    Return the :class:`Version` for the given string, shared between calls.
+    Raises :class:`InvalidVersion` like ``Version(version)`` does.
+    """
+    return Version(version)
+
+
 class InvalidVersion(ValueError):
     """
     An invalid version was found, users should refer to PEP 440.
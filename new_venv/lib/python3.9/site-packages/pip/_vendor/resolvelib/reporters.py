@@ -33,5 +33,14 @@ class BaseReporter(object):
     def backtracking(self, candidate):
         """Called when rejecting a candidate during backtracking."""
 
+    def backjumping(self, candidates):
+        """Called when unpinning candidates unrelated to a conflict.
+
+        :param candidates: The candidates unpinned to jump back to the latest
+            pin related to the conflict, most recent first. They are not
+            rejected, and ``backtracking`` is then called for the candidate
+            jumped back to.
+        """
+
     def pinning(self, candidate):
         """Called when adding a candidate to the potential solution."""
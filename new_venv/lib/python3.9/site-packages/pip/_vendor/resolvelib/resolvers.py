@@ -1,4 +1,5 @@
 import collections
+import itertools
 import operator
 
 from .providers import AbstractResolver
@@ -109,10 +110,14 @@ class Resolution(object):
     the resolution process, and holds the results afterwards.
     """
 
-    def __init__(self, provider, reporter):
+    def __init__(self, provider, reporter, backjumping=False):
         self._p = provider
         self._r = reporter
+        self._backjumping = backjumping
         self._states = []
+        # Identifiers whose pins led to candidates of each identifier being
+        # rejected, so conflicts involving them can be traced back further.
+        self._rejection_causes = collections.defaultdict(set)
 
     @property
     def state(self):
@@ -239,6 +244,38 @@ class Resolution(object):
         # end, signal for backtracking.
         return causes
 
+    def _patch_criteria(self, incompatibilities_from_broken):
+        """Apply incompatibilities gathered in a discarded state to this one."""
+        for k, incompatibilities in incompatibilities_from_broken:
+            if not incompatibilities:
+                continue
+            try:
+                criterion = self.state.criteria[k]
+            except KeyError:
+                continue
+            matches = self._p.find_matches(
+                identifier=k,
+                requirements=IteratorMapping(
+                    self.state.criteria,
+                    operator.methodcaller("iter_requirement"),
+                ),
+                incompatibilities=IteratorMapping(
+                    self.state.criteria,
+                    operator.attrgetter("incompatibilities"),
+                    {k: incompatibilities},
+                ),
+            )
+            candidates = build_iter_view(matches)
+            if not candidates:
+                return False
+            incompatibilities.extend(criterion.incompatibilities)
+            self.state.criteria[k] = Criterion(
+                candidates=candidates,
+                information=list(criterion.information),
+                incompatibilities=incompatibilities,
+            )
+        return True
+
     def _backtrack(self):
         """Perform backtracking.
 
@@ -284,39 +321,8 @@ class Resolution(object):
 
             # Create a new state from the last known-to-work one, and apply
             # the previously gathered incompatibility information.
-            def _patch_criteria():
-                for k, incompatibilities in incompatibilities_from_broken:
-                    if not incompatibilities:
-                        continue
-                    try:
-                        criterion = self.state.criteria[k]
-                    except KeyError:
-                        continue
-                    matches = self._p.find_matches(
-                        identifier=k,
-                        requirements=IteratorMapping(
-                            self.state.criteria,
-                            operator.methodcaller("iter_requirement"),
-                        ),
-                        incompatibilities=IteratorMapping(
-                            self.state.criteria,
-                            operator.attrgetter("incompatibilities"),
-                            {k: incompatibilities},
-                        ),
-                    )
-                    candidates = build_iter_view(matches)
-                    if not candidates:
-                        return False
-                    incompatibilities.extend(criterion.incompatibilities)
-                    self.state.criteria[k] = Criterion(
-                        candidates=candidates,
-                        information=list(criterion.information),
-                        incompatibilities=incompatibilities,
-                    )
-                return True
-
             self._push_new_state()
-            success = _patch_criteria()
+            success = self._patch_criteria(incompatibilities_from_broken)
 
             # It works! Let's work on this new state.
             if success:
@@ -328,6 +334,83 @@ class Resolution(object):
         # No way to backtrack anymore.
         return False
 
+    def _is_related_pin(self, candidate, identifiers):
+        dependencies = self._p.get_dependencies(candidate=candidate)
+        return any(self._p.identify(d) in identifiers for d in dependencies)
+
+    def _add_rejection_causes(self, identifiers):
+        pending = list(identifiers)
+        while pending:
+            for key in self._rejection_causes.get(pending.pop(), ()):
+                if key not in identifiers:
+                    identifiers.add(key)
+                    pending.append(key)
+
+    def _backjump(self, causes):
+        """Perform backjumping.
+
+        This works like `_backtrack`, except that state Y is not necessarily
+        the state right before Z. The conflict is recorded as the identifiers
+        of the requirements involved and of their parents, and the pins that
+        did not introduce a dependency on any of them are undone without
+        trying their other candidates, since doing so cannot solve the
+        conflict. Y is the latest state whose pin did.
+
+        Candidates rejected earlier are missing from the criteria involved,
+        so the causes of those rejections are part of the conflict too.
+        Likewise, whenever rejecting a pin leaves a criterion without
+        candidates, the jump continues to the pins related to it.
+        """
+        incompatible_reqs = itertools.chain(
+            (c.parent for c in causes if c.parent is not None),
+            (c.requirement for c in causes),
+        )
+        incompatible_ids = {self._p.identify(r) for r in incompatible_reqs}
+        self._add_rejection_causes(incompatible_ids)
+
+        while len(self._states) >= 3:
+            # Remove the state that triggered backtracking.
+            del self._states[-1]
+
+            # Jump over the pins unrelated to the conflict. The root state is
+            # kept as the base of the state pushed below.
+            # Incompatibilities are still gathered from the latest state.
+            latest_state = self.state
+            skipped = []
+            while len(self._states) >= 2:
+                name, candidate = self._states.pop().mapping.popitem()
+                if self._is_related_pin(candidate, incompatible_ids):
+                    break
+                skipped.append(candidate)
+            else:
+                # The conflict is between the root requirements.
+                return False
+
+            # Rejections caused by the pin being undone no longer hold.
+            incompatibilities_from_broken = [
+                (k, list(v.incompatibilities))
+                for k, v in latest_state.criteria.items()
+                if k == name or name not in self._rejection_causes.get(k, ())
+            ]
+            incompatibilities_from_broken.append((name, [candidate]))
+
+            self._rejection_causes[name].update(incompatible_ids)
+
+            if skipped:
+                self._r.backjumping(candidates=skipped)
+            self._r.backtracking(candidate=candidate)
+
+            self._push_new_state()
+            if self._patch_criteria(incompatibilities_from_broken):
+                return True
+            incompatible_ids.update(
+                k for k, incompatibilities in incompatibilities_from_broken
+                if incompatibilities
+            )
+            self._add_rejection_causes(incompatible_ids)
+
+        return False
+
     def resolve(self, requirements, max_rounds):
         if self._states:
             raise RuntimeError("already resolved")
@@ -366,13 +449,16 @@ class Resolution(object):
             failure_causes = self._attempt_to_pin_criterion(name)
 
             if failure_causes:
+                causes = [i for c in failure_causes for i in c.information]
                 # Backtrack if pinning fails. The backtrack process puts us in
                 # an unpinned state, so we can work on it in the next round.
-                success = self._backtrack()
+                if self._backjumping:
+                    success = self._backjump(causes)
+                else:
+                    success = self._backtrack()
 
                 # Dead ends everywhere. Give up.
                 if not success:
-                    causes = [i for c in failure_causes for i in c.information]
                     raise ResolutionImpossible(causes)
             else:
                 # Pinning was successful. Push a new state to do another pin.
@@ -440,6 +526,14 @@ class Resolver(AbstractResolver):
 
     base_exception = ResolverException
 
+    def __init__(self, provider, reporter, backjumping=False):
+        """
+        :param backjumping: Whether to jump back to the latest pin related to
+            a conflict, instead of backtracking one pin at a time.
+        """
+        super(Resolver, self).__init__(provider, reporter)
+        self.backjumping = backjumping
+
     def resolve(self, requirements, max_rounds=100):
         """Take a collection of constraints, spit out the resolution result.
 
@@ -468,6 +562,6 @@ class Resolver(AbstractResolver):
             dependency, but you can try to resolve this by increasing the
             `max_rounds` argument.
         """
-        resolution = Resolution(self.provider, self.reporter)
+        resolution = Resolution(self.provider, self.reporter, self.backjumping)
         state = resolution.resolve(requirements, max_rounds=max_rounds)
         return _build_result(state)
@@ -0,0 +1,96 @@
+"""Time building sdists that share their isolated build environment.
+
+It makes N local PEP 517 sdists that all require "setuptools>=40.8.0" and
+"wheel", and builds them with `pip wheel --no-index`, finding the build
+requirements in FIND_LINKS. One sdist and all N are built with
+--no-cache-dir, then with a cache directory that an untimed build has
+already filled. Each case reports the best and median of the runs.
+
+Run it with the pip under test importable, e.g.::
+
+    PYTHONPATH=new_venv/lib/python3.9/site-packages \\
+        python tools/benchmarks/build_envs.py /path/to/wheels
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from typing import List
+
+PYPROJECT = """\
+[build-system]
+requires = ["setuptools>=40.8.0", "wheel"]
+build-backend = "setuptools.build_meta"
+"""
+
+
+def make_projects(directory: str, count: int) -> List[str]:
+    projects = []
+    for i in range(1, count + 1):
+        name = f"bench{i}"
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.join(path, name))
+        open(os.path.join(path, name, "__init__.py"), "w").close()
+        with open(os.path.join(path, "pyproject.toml"), "w") as f:
+            f.write(PYPROJECT)
+        with open(os.path.join(path, "setup.py"), "w") as f:
+            f.write(textwrap.dedent(f"""\
+                from setuptools import setup
+                setup(name="{name}", version="1.0", packages=["{name}"])
+            """))
+        projects.append(path)
+    return projects
+
+
+def build(projects: List[str], find_links: str, cache_args: List[str]) -> float:
+    with tempfile.TemporaryDirectory() as wheel_dir:
+        args = [
+            sys.executable, "-m", "pip", "wheel", "-q", "--no-index",
+            "--find-links", find_links, "--wheel-dir", wheel_dir,
+        ]
+        start = time.perf_counter()
+        subprocess.run(
+            args + cache_args + projects,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "find_links", help="a directory with setuptools and wheel wheels"
+    )
+    parser.add_argument("--sdists", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        projects = make_projects(os.path.join(tmp, "src"), options.sdists)
+        cache_args = ["--cache-dir", os.path.join(tmp, "cache")]
+        build(projects[:1], options.find_links, cache_args)
+
+        cases = [
+            ("--no-cache-dir", ["--no-cache-dir"]),
+            ("warm cache", cache_args),
+        ]
+        for label, args in cases:
+            for count in (1, options.sdists):
+                timings = [
+                    build(projects[:count], options.find_links, args)
+                    for _ in range(options.runs)
+                ]
+                print("{}, {} sdist(s): best {:.1f}s, median {:.1f}s".format(
+                    label, count, min(timings), statistics.median(timings)
+                ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare `pip list` and `pip freeze` between the metadata backends.
+
+Each command runs in a fresh interpreter, once with the pkg_resources backend
+and once with the importlib.metadata one (_PIP_USE_IMPORTLIB_METADATA), and
+the best wall-clock time of the runs is reported. With --path, the commands
+are also timed against that directory, e.g. one with a few hundred
+distributions installed into it with `pip install --target`.
+
+Run it with the pip under test importable, e.g.::
+
+    PYTHONPATH=new_venv/lib/python3.9/site-packages \\
+        python tools/benchmarks/metadata_backends.py --path /tmp/big
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+BACKENDS = (("pkg_resources", "0"), ("importlib", "1"))
+
+
+def best_time(args: List[str], use_importlib: str, runs: int) -> float:
+    env = dict(os.environ, _PIP_USE_IMPORTLIB_METADATA=use_importlib)
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "pip", *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--path", help="also time the commands against DIR")
+    options = parser.parse_args()
+
+    commands = [["list"], ["freeze"]]
+    if options.path:
+        commands += [["list", "--path", options.path]]
+        commands += [["freeze", "--path", options.path]]
+    for args in commands:
+        timings = (
+            "{} {:.0f}ms".format(name, best_time(args, value, options.runs) * 1000)
+            for name, value in BACKENDS
+        )
+        print("pip {}: {}".format(" ".join(args), ", ".join(timings)))
+
+
+if __name__ == "__main__":
+    main()
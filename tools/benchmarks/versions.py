@@ -0,0 +1,51 @@
+"""Time version and specifier handling for a project with 5,000 versions.
+
+One pass does to a single project what a resolve does: it filters all the
+versions through a merged specifier, checks the newest 200 against each of
+the requirements, and checks Requires-Python for every link. The first pass
+starts with cold parse caches, the later ones reuse them.
+
+Run it with the pip under test importable, e.g.::
+
+    PYTHONPATH=new_venv/lib/python3.9/site-packages \\
+        python tools/benchmarks/versions.py
+"""
+
+import argparse
+import timeit
+
+from pip._vendor.packaging.specifiers import SpecifierSet
+from pip._vendor.packaging.version import parse
+
+from pip._internal.utils.packaging import check_requires_python
+
+VERSIONS = [
+    "{}.{}.{}".format(i // 500, (i // 25) % 20, i % 25) for i in range(5000)
+]
+REQUIRES_PYTHON = [">=3.6", ">=3.7", "!=3.0.*,!=3.1.*,>=2.7", None]
+REQUIREMENTS = (">=1.0", "<9.5", "!=3.2.*")
+
+
+def resolve_one_project() -> None:
+    list(SpecifierSet(",".join(REQUIREMENTS)).filter(VERSIONS))
+    for requirement in REQUIREMENTS:
+        specifier = SpecifierSet(requirement)
+        for version in VERSIONS[-200:]:
+            specifier.contains(parse(version), prereleases=True)
+    for i, _ in enumerate(VERSIONS):
+        check_requires_python(REQUIRES_PYTHON[i % 4], (3, 9, 18))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    timings = timeit.repeat(resolve_one_project, number=1, repeat=options.repeat)
+    print("first pass: {:.0f}ms".format(timings[0] * 1000))
+    if len(timings) > 1:
+        print("later passes: {:.0f}ms best".format(min(timings[1:]) * 1000))
+
+
+if __name__ == "__main__":
+    main()